@@ -3,86 +3,165 @@
 
 import sys
 import os
-from neo4j import GraphDatabase
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-from config import NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD
+from config import get_driver
 
-def run_query(driver, query):
+# Nodes (label → rows)
+COUNTRIES = [
+    {"name": "United States", "region": "North America"},
+    {"name": "China", "region": "Asia"},
+    {"name": "Taiwan", "region": "Asia"},
+    {"name": "Vietnam", "region": "Southeast Asia"},
+]
+
+INDUSTRIES = [
+    {"name": "Semiconductor", "sector": "Technology"},
+    {"name": "Artificial Intelligence", "sector": "Technology"},
+]
+
+MACRO_INDICATORS = [
+    {"name": "US-China Trade War", "props": {"type": "geopolitical", "impact_level": "high"}},
+    {"name": "Taiwan Strait Tension", "props": {"type": "geopolitical", "impact_level": "critical"}},
+    {"name": "Global Semiconductor Shortage", "props": {"type": "supply_chain"}},
+]
+
+COMPANIES = [
+    {"name": "Nvidia", "props": {"market_cap": 1200, "revenue": 60.9, "country": "United States"}},
+    {"name": "TSMC", "props": {"market_cap": 500, "revenue": 69.3, "country": "Taiwan"}},
+    {"name": "AMD", "props": {"market_cap": 240, "revenue": 22.7, "country": "United States"}},
+    {"name": "FPT Semiconductor", "props": {
+        "market_cap": 15, "revenue": 4.5, "country": "Vietnam",
+        "industry": "Semiconductor Manufacturing"
+    }},
+]
+
+# name 유니크 제약을 거는 라벨 (MERGE가 라벨 스캔 대신 유니크 인덱스 seek 사용)
+CONSTRAINED_LABELS = ("Country", "Industry", "MacroIndicator", "Company")
+
+# Relationships (from_label, rel_type, to_label) → rows
+# 관계 타입은 파라미터화할 수 없으므로 타입별로 UNWIND 쿼리를 하나씩 실행
+RELATIONSHIPS = {
+    # Company → Industry
+    ("Company", "OPERATES_IN", "Industry"): [
+        {"from": "Nvidia", "to": "Semiconductor", "props": {}},
+        {"from": "TSMC", "to": "Semiconductor", "props": {}},
+        {"from": "AMD", "to": "Semiconductor", "props": {}},
+    ],
+    # Company → Country
+    ("Company", "LOCATED_IN", "Country"): [
+        {"from": "Nvidia", "to": "United States", "props": {}},
+        {"from": "TSMC", "to": "Taiwan", "props": {}},
+        {"from": "AMD", "to": "United States", "props": {}},
+        {"from": "FPT Semiconductor", "to": "Vietnam", "props": {}},
+    ],
+    # Dependencies
+    ("Company", "DEPENDS_ON", "Company"): [
+        {"from": "Nvidia", "to": "TSMC", "props": {"criticality": "high"}},
+        {"from": "AMD", "to": "TSMC", "props": {"criticality": "high"}},
+    ],
+    # Competition
+    ("Company", "COMPETES_WITH", "Company"): [
+        {"from": "Nvidia", "to": "AMD", "props": {"segment": "GPU"}},
+        {"from": "AMD", "to": "Nvidia", "props": {"segment": "GPU"}},
+    ],
+    # Supply Chain - FPT Semiconductor supplies to major companies
+    ("Company", "SUPPLIES", "Company"): [
+        {"from": "FPT Semiconductor", "to": "TSMC", "props": {"component": "packaging"}},
+    ],
+    ("Company", "PARTNERS_WITH", "Company"): [
+        {"from": "FPT Semiconductor", "to": "Nvidia", "props": {"type": "testing"}},
+    ],
+    # Macro → Industry
+    ("MacroIndicator", "IMPACTS", "Industry"): [
+        {"from": "Taiwan Strait Tension", "to": "Semiconductor", "props": {"impact": "negative", "severity": 0.9}},
+        {"from": "US-China Trade War", "to": "Semiconductor", "props": {"impact": "negative", "severity": 0.7}},
+    ],
+    # Macro → Country
+    ("MacroIndicator", "AFFECTS", "Country"): [
+        {"from": "Taiwan Strait Tension", "to": "Taiwan", "props": {"severity": 0.95}},
+    ],
+}
+
+
+def run_query(driver, query, params=None, stream=False):
+    """
+    쿼리 실행
+    
+    stream=False: 결과를 dict 리스트로 반환 (Record 객체 없이 result.data())
+    stream=True: 세션을 열어둔 채 레코드를 하나씩 yield하는 제너레이터 반환
+    """
+    if stream:
+        return _stream_query(driver, query, params)
     with driver.session() as session:
-        result = session.run(query)
-        return list(result)
+        return session.run(query, params or {}).data()
+
+
+def _stream_query(driver, query, params=None):
+    with driver.session() as session:
+        for record in session.run(query, params or {}):
+            yield record
+
+
+def _seed_tx(tx):
+    """모든 시드 데이터를 하나의 트랜잭션에서 UNWIND 배치로 MERGE"""
+    tx.run(
+        "UNWIND $rows AS row MERGE (c:Country {name: row.name}) SET c.region = row.region",
+        rows=COUNTRIES
+    )
+    tx.run(
+        "UNWIND $rows AS row MERGE (i:Industry {name: row.name}) SET i.sector = row.sector",
+        rows=INDUSTRIES
+    )
+    tx.run(
+        "UNWIND $rows AS row MERGE (m:MacroIndicator {name: row.name}) SET m += row.props",
+        rows=MACRO_INDICATORS
+    )
+    tx.run(
+        "UNWIND $rows AS row MERGE (c:Company {name: row.name}) SET c += row.props",
+        rows=COMPANIES
+    )
+    
+    for (from_label, rel_type, to_label), rows in RELATIONSHIPS.items():
+        tx.run(
+            f"UNWIND $rows AS row "
+            f"MATCH (a:{from_label} {{name: row.from}}), (b:{to_label} {{name: row.to}}) "
+            f"MERGE (a)-[r:{rel_type}]->(b) SET r += row.props",
+            rows=rows
+        )
+
 
 def main():
-    driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USERNAME, NEO4J_PASSWORD))
+    driver = get_driver()
     print("✅ Connected to Neo4j")
     
-    # Countries
-    queries = [
-        "MERGE (c:Country {name: 'United States'}) SET c.region = 'North America'",
-        "MERGE (c:Country {name: 'China'}) SET c.region = 'Asia'",
-        "MERGE (c:Country {name: 'Taiwan'}) SET c.region = 'Asia'",
-        "MERGE (c:Country {name: 'Vietnam'}) SET c.region = 'Southeast Asia'",
-        
-        # Industries
-        "MERGE (i:Industry {name: 'Semiconductor'}) SET i.sector = 'Technology'",
-        "MERGE (i:Industry {name: 'Artificial Intelligence'}) SET i.sector = 'Technology'",
-        
-        # Macro Indicators
-        "MERGE (m:MacroIndicator {name: 'US-China Trade War'}) SET m.type = 'geopolitical', m.impact_level = 'high'",
-        "MERGE (m:MacroIndicator {name: 'Taiwan Strait Tension'}) SET m.type = 'geopolitical', m.impact_level = 'critical'",
-        "MERGE (m:MacroIndicator {name: 'Global Semiconductor Shortage'}) SET m.type = 'supply_chain'",
-        
-        # Companies
-        "MERGE (c:Company {name: 'Nvidia'}) SET c.market_cap = 1200, c.revenue = 60.9, c.country = 'United States'",
-        "MERGE (c:Company {name: 'TSMC'}) SET c.market_cap = 500, c.revenue = 69.3, c.country = 'Taiwan'",
-        "MERGE (c:Company {name: 'AMD'}) SET c.market_cap = 240, c.revenue = 22.7, c.country = 'United States'",
-        "MERGE (c:Company {name: 'FPT Semiconductor'}) SET c.market_cap = 15, c.revenue = 4.5, c.country = 'Vietnam', c.industry = 'Semiconductor Manufacturing'",
-        
-        # Company → Industry
-        "MATCH (c:Company {name: 'Nvidia'}), (i:Industry {name: 'Semiconductor'}) MERGE (c)-[:OPERATES_IN]->(i)",
-        "MATCH (c:Company {name: 'TSMC'}), (i:Industry {name: 'Semiconductor'}) MERGE (c)-[:OPERATES_IN]->(i)",
-        "MATCH (c:Company {name: 'AMD'}), (i:Industry {name: 'Semiconductor'}) MERGE (c)-[:OPERATES_IN]->(i)",
-        
-        # Company → Country
-        "MATCH (c:Company {name: 'Nvidia'}), (co:Country {name: 'United States'}) MERGE (c)-[:LOCATED_IN]->(co)",
-        "MATCH (c:Company {name: 'TSMC'}), (co:Country {name: 'Taiwan'}) MERGE (c)-[:LOCATED_IN]->(co)",
-        "MATCH (c:Company {name: 'AMD'}), (co:Country {name: 'United States'}) MERGE (c)-[:LOCATED_IN]->(co)",
-        "MATCH (c:Company {name: 'FPT Semiconductor'}), (co:Country {name: 'Vietnam'}) MERGE (c)-[:LOCATED_IN]->(co)",
-        
-        # Dependencies
-        "MATCH (n:Company {name: 'Nvidia'}), (t:Company {name: 'TSMC'}) MERGE (n)-[:DEPENDS_ON {criticality: 'high'}]->(t)",
-        "MATCH (a:Company {name: 'AMD'}), (t:Company {name: 'TSMC'}) MERGE (a)-[:DEPENDS_ON {criticality: 'high'}]->(t)",
-        
-        # Competition
-        "MATCH (n:Company {name: 'Nvidia'}), (a:Company {name: 'AMD'}) MERGE (n)-[:COMPETES_WITH {segment: 'GPU'}]->(a)",
-        "MATCH (a:Company {name: 'AMD'}), (n:Company {name: 'Nvidia'}) MERGE (a)-[:COMPETES_WITH {segment: 'GPU'}]->(n)",
-        
-        # Supply Chain - FPT Semiconductor supplies to major companies
-        "MATCH (f:Company {name: 'FPT Semiconductor'}), (t:Company {name: 'TSMC'}) MERGE (f)-[:SUPPLIES {component: 'packaging'}]->(t)",
-        "MATCH (f:Company {name: 'FPT Semiconductor'}), (n:Company {name: 'Nvidia'}) MERGE (f)-[:PARTNERS_WITH {type: 'testing'}]->(n)",
-        
-        # Macro → Industry
-        "MATCH (m:MacroIndicator {name: 'Taiwan Strait Tension'}), (i:Industry {name: 'Semiconductor'}) MERGE (m)-[:IMPACTS {impact: 'negative', severity: 0.9}]->(i)",
-        "MATCH (m:MacroIndicator {name: 'US-China Trade War'}), (i:Industry {name: 'Semiconductor'}) MERGE (m)-[:IMPACTS {impact: 'negative', severity: 0.7}]->(i)",
-        
-        # Macro → Country
-        "MATCH (m:MacroIndicator {name: 'Taiwan Strait Tension'}), (c:Country {name: 'Taiwan'}) MERGE (m)-[:AFFECTS {severity: 0.95}]->(c)",
-    ]
+    # 스키마 변경은 데이터 쓰기와 같은 트랜잭션에 넣을 수 없으므로 먼저 실행
+    for label in CONSTRAINED_LABELS:
+        run_query(
+            driver,
+            f"CREATE CONSTRAINT {label.lower()}_name_unique IF NOT EXISTS "
+            f"FOR (n:{label}) REQUIRE n.name IS UNIQUE"
+        )
+    print(f"✅ {len(CONSTRAINED_LABELS)} name constraints ensured")
+    
+    with driver.session() as session:
+        session.execute_write(_seed_tx)
     
-    for i, q in enumerate(queries, 1):
-        run_query(driver, q)
-        print(f"✅ {i}/{len(queries)}")
+    node_count = len(COUNTRIES) + len(INDUSTRIES) + len(MACRO_INDICATORS) + len(COMPANIES)
+    rel_count = sum(len(rows) for rows in RELATIONSHIPS.values())
+    print(f"✅ {node_count} nodes, {rel_count} relationships merged in one transaction")
     
     # Test query
+    # 관계 타입을 명시해 planner가 타입 필터를 경로 확장 단계에서 바로 적용하도록 함
+    # (타입 없는 [*1..2]는 모든 관계 타입의 trail을 열거). 시작 노드 조회는
+    # Company(name) 인덱스를 타야 함 - 쿼리 앞에 PROFILE을 붙여 NodeIndexSeek 확인
     print("\n🧪 Test: Nvidia risk paths")
     test = """
-    MATCH path = (c:Company {name: 'Nvidia'})-[*1..2]-(related)
+    MATCH path = (c:Company {name: $name})-[:DEPENDS_ON|COMPETES_WITH|SUPPLIES|PARTNERS_WITH*1..2]-(related)
     RETURN [n IN nodes(path) | n.name] AS path
     LIMIT 10
     """
-    results = run_query(driver, test)
-    for r in results:
+    for r in run_query(driver, test, {"name": "Nvidia"}, stream=True):
         print(f"  {r['path']}")
     
     driver.close()
@@ -3,12 +3,33 @@ Multi-Agent 시스템 패키지
 금융 분석을 위한 4개 에이전트(Master, KB Collector, Analyst, Writer) 제공
 """
 
-from .base_agent import BaseAgent
-from .agent_context import AgentContext
-from .master_agent import MasterAgent
-from .kb_collector_agent import KBCollectorAgent
-from .analyst_agent import AnalystAgent
-from .writer_agent import WriterAgent
+import importlib
+
+# 공개 이름 → 정의 모듈 (PEP 562: 처음 접근할 때 import)
+# 서브모듈만 쓰는 경우(agents.langgraph_workflow, agents.agent_context 등)
+# 패키지 로드만으로 모든 에이전트와 LLM/Neo4j 클라이언트 의존성을 불러오지 않도록 지연
+_LAZY_EXPORTS = {
+    "BaseAgent": ".base_agent",
+    "AgentContext": ".agent_context",
+    "MasterAgent": ".master_agent",
+    "KBCollectorAgent": ".kb_collector_agent",
+    "AnalystAgent": ".analyst_agent",
+    "WriterAgent": ".writer_agent",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 이후 접근은 일반 속성 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "BaseAgent",
@@ -2,11 +2,20 @@
 에이전트 간 데이터 전달을 위한 공유 컨텍스트
 """
 
+import asyncio
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
 
+# get_conflicts 기본 대기 시간 (초) - 초과 시 상충 감지 취소
+CONFLICTS_WAIT_TIMEOUT = 10.0
+
+# 보강 검색(Tavily) 생략 기준: 수집 소스 신뢰도 합 (0.9 소스 2개 또는 0.7 소스 3개)
+COVERAGE_THRESHOLD = 2.0
+
+
 class QueryComplexity(str, Enum):
     """쿼리 복잡도"""
     SIMPLE = "simple"       # 단순 팩트 검색
@@ -14,16 +23,20 @@ class QueryComplexity(str, Enum):
     COMPLEX = "complex"     # 투자 조언 등 종합 분석
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """
     에이전트 간 공유 컨텍스트
     각 에이전트는 이 컨텍스트를 받아서 작업하고, 결과를 추가하여 반환
+    
+    slots=True: 인스턴스별 __dict__ 없이 고정 슬롯에 필드 저장 (메모리 절감, 빠른 속성 접근)
     """
     # 입력
     question: str
     complexity: QueryComplexity = QueryComplexity.SIMPLE
     enable_web_search: bool = False
+    detect_conflicts: bool = True  # False면 상충 감지 LLM 호출 생략
+    coverage_threshold: float = COVERAGE_THRESHOLD  # 소스 신뢰도 합이 이 이상이면 Tavily 보강 생략
     
     # Planner 결과 (LangGraph 워크플로우용)
     subtasks: List[Dict[str, Any]] = field(default_factory=list)
@@ -34,7 +47,13 @@ class AgentContext:
     # KB Collector 결과
     sources: List[Dict[str, Any]] = field(default_factory=list)
     conflicts: List[Dict[str, Any]] = field(default_factory=list)
+    # 백그라운드 상충 감지 태스크 (완료 전이면 get_conflicts()로 대기)
+    conflicts_task: Optional["asyncio.Task"] = field(default=None, repr=False, compare=False)
     raw_context: str = ""
+    # 수집된 소스 내용 해시 (Feedback Loop 재수집 시 이미 가진 소스를 다시 추가하지 않도록)
+    source_hashes: set = field(default_factory=set, repr=False, compare=False)
+    # 질문 단위 임베딩 (시맨틱 캐시 조회/소스 중복 제거에서 한 번 계산 후 후속 에이전트가 재사용)
+    question_embedding: Optional[List[float]] = field(default=None, repr=False, compare=False)
     
     # Analyst 결과
     validated_data: List[Dict[str, Any]] = field(default_factory=list)
@@ -55,16 +74,43 @@ class AgentContext:
         """처리 단계 추가 (디버깅용)"""
         self.processing_steps.append(step)
     
+    async def get_conflicts(self, timeout: float = CONFLICTS_WAIT_TIMEOUT) -> List[Dict[str, Any]]:
+        """
+        상충 정보 반환 (백그라운드 감지가 진행 중이면 완료까지 대기)
+        
+        Args:
+            timeout: 최대 대기 시간 (초), 초과 시 감지를 취소하고 현재 값 반환
+            
+        Returns:
+            상충 정보 리스트
+        """
+        task = self.conflicts_task
+        if task is not None:
+            self.conflicts_task = None
+            try:
+                self.conflicts = await asyncio.wait_for(task, timeout)
+            except Exception:
+                # 시간 초과/감지 실패 시 상충 없음으로 처리
+                pass
+        return self.conflicts
+    
     def to_dict(self) -> Dict[str, Any]:
         """API 응답용 딕셔너리로 변환"""
-        return {
-            "answer": self.final_report,
-            "sources": self.sources,
-            "confidence": self.confidence,
-            "recommendation": self.recommendation,
-            "insights": self.insights,
-            "retrieval_backend": self.retrieval_backend,
-            "processing_steps": self.processing_steps,
-            "reasoning_path": self.reasoning_path,
-            "mode": "AGENTIC_WORKFLOW" if self.subtasks else "MULTI_AGENT"
-        }
+        result = dict(zip(_TO_DICT_KEYS, _TO_DICT_GETTER(self)))
+        result["mode"] = "AGENTIC_WORKFLOW" if self.subtasks else "MULTI_AGENT"
+        return result
+
+
+# to_dict 응답 키 → AgentContext 필드 (attrgetter로 한 번에 읽음)
+_TO_DICT_FIELDS = {
+    "answer": "final_report",
+    "sources": "sources",
+    "confidence": "confidence",
+    "recommendation": "recommendation",
+    "insights": "insights",
+    "retrieval_backend": "retrieval_backend",
+    "processing_steps": "processing_steps",
+    "reasoning_path": "reasoning_path",
+}
+_TO_DICT_KEYS = tuple(_TO_DICT_FIELDS)
+_TO_DICT_GETTER = attrgetter(*_TO_DICT_FIELDS.values())
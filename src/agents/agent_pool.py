@@ -0,0 +1,55 @@
+"""
+워커 에이전트 공유 풀
+요청마다 AgenticWorkflow/MasterAgent를 만들어도 같은 설정의 에이전트 인스턴스를 재사용
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple, Type, TypeVar
+
+
+# 풀에 유지할 최대 인스턴스 수 (초과 시 가장 오래 안 쓴 인스턴스부터 제거)
+AGENT_POOL_MAX_SIZE = 32
+
+A = TypeVar("A")
+
+# (에이전트 클래스, 생성 인자) → 인스턴스 (LRU 순서)
+_pool: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+
+
+def _arg_key(value: Any) -> Hashable:
+    """
+    생성 인자 → 풀 키 구성요소
+    
+    엔진/DB/MCP 같은 객체는 동일 인스턴스일 때만 같은 키 (풀의 에이전트가 참조를 유지하므로 id 재사용 없음)
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return (type(value).__qualname__, id(value))
+
+
+def get_agent(agent_cls: Type[A], **kwargs: Any) -> A:
+    """
+    같은 클래스/생성 인자의 공유 에이전트 반환 (없으면 생성)
+    
+    워커 에이전트는 요청 상태를 AgentContext로만 주고받고 인스턴스에는
+    지연 초기화된 핸들(엔진, MCP 도구)과 캐시만 두므로 동시 요청 간 공유해도 안전
+    (PrivacyAnalystAgent도 질문별 상태 없이 ReAct 실행기/클라이언트만 보유)
+    
+    Args:
+        agent_cls: 에이전트 클래스
+        **kwargs: 생성자 인자
+    
+    Returns:
+        에이전트 인스턴스
+    """
+    key = (agent_cls, *sorted((name, _arg_key(value)) for name, value in kwargs.items()))
+    agent = _pool.get(key)
+    if agent is not None:
+        _pool.move_to_end(key)
+        return agent
+    
+    agent = agent_cls(**kwargs)
+    _pool[key] = agent
+    while len(_pool) > AGENT_POOL_MAX_SIZE:
+        _pool.popitem(last=False)
+    return agent
@@ -3,11 +3,141 @@
 수치 검증 및 할루시네이션 제거
 """
 
+import asyncio
+import hashlib
+import importlib
 import json
-from typing import List, Dict, Any, Optional
+import re
+from collections import Counter
+from functools import lru_cache
+from operator import methodcaller
+from typing import List, Dict, Any, Optional, Callable, Tuple, TypedDict
 
 from .base_agent import BaseAgent
 from .agent_context import AgentContext
+from .ticker_resolver import lookup_ticker, parse_ticker, remember_ticker, resolve_ticker
+
+# orjson이 있으면 빠른 C 파서 사용 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# 프롬프트 소스 요약: 토큰 예산 (주 제한) / 최대 소스 개수 / 소스당 발췌 길이
+MAX_PROMPT_SOURCES = 20
+MAX_EXCERPT_CHARS = 300
+PROMPT_SOURCES_TOKEN_BUDGET = 3000
+
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """
+    토큰 인코딩 지연 로드 (첫 _count_tokens 호출 시 1회)
+    
+    캐시가 비어 있으면 tiktoken이 BPE 파일을 네트워크로 받으므로 import 시점에 로드하지 않음
+    (tiktoken이 없거나 로드 실패 시 None → 대략 4글자 = 1토큰 가정)
+    """
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model("gpt-4o")
+    except Exception:
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """프롬프트 조각의 토큰 수 (추정)"""
+    encoding = _get_token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text) // 4 + 1
+
+# 검증 응답 토큰 예산 (소스 수에 비례, 상한 VALIDATION_MAX_TOKENS)
+VALIDATION_BASE_TOKENS = 400
+VALIDATION_TOKENS_PER_SOURCE = 160
+VALIDATION_MAX_TOKENS = 2000
+
+# 스트리밍 중인 검증 응답에서 ticker 필드 감지
+_STREAM_TICKER_RE = re.compile(r'"ticker"\s*:\s*"([A-Za-z]{1,5})"')
+
+# 주장 중복 판별용 정규화 (대소문자/공백/구두점 차이 무시)
+_CLAIM_NORMALIZE_RE = re.compile(r"[\W_]+")
+
+
+def _normalize_claim(claim: str) -> str:
+    """중복 비교용 주장 키"""
+    return _CLAIM_NORMALIZE_RE.sub(" ", claim.lower()).strip()
+
+
+# 충분성 판단: 서브태스크당 최소 소스 개수
+MIN_SOURCES_PER_SUBTASK = 2
+_SUBTASK_ID_GETTER = methodcaller("get", "subtask_id")
+
+
+# 재무 수치 주장 판별 키워드
+FINANCIAL_KEYWORDS = (
+    "주가", "price", "매출", "revenue", "이익", "profit",
+    "달러", "dollar", "$", "억", "조", "billion", "million"
+)
+
+# JSON 모드: 모델이 항상 유효한 JSON 객체만 출력하도록 강제
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# 수치 + 단위 추출 (금액/비율만 대상: 단위나 $가 붙은 수치)
+# 한 글자 단위 B/M은 대문자만 인정 ("5 m", "3 b" 등 소문자는 단위가 아님)
+_NUM_RE = re.compile(
+    r"(\$)?\s?(\d[\d,]*(?:\.\d+)?)\s*(억|조|billion|million|bn|(?-i:[BM])(?![A-Za-z])|%)?",
+    re.IGNORECASE
+)
+_UNIT_MULTIPLIERS = {
+    "억": 1e8, "조": 1e12,
+    "billion": 1e9, "bn": 1e9, "b": 1e9,
+    "million": 1e6, "m": 1e6,
+}
+# 수치 대조: 상대 오차 허용치 / 불일치 시 신뢰도 배율
+NUMERIC_TOLERANCE = 0.01
+NUMERIC_MISMATCH_PENALTY = 0.5
+
+
+def _extract_numbers(text: str) -> List[Tuple[float, str]]:
+    """
+    텍스트에서 금액/비율 수치를 추출해 표준 단위로 정규화
+    
+    Returns:
+        (값, 종류) 리스트 - 종류는 "%" 또는 "amount" (예: "57억 달러" → (5.7e9, "amount"))
+    """
+    numbers = []
+    for dollar, digits, unit in _NUM_RE.findall(text):
+        if not dollar and not unit:
+            continue  # 연도/순번 등 단위 없는 정수는 제외
+        value = float(digits.replace(",", ""))
+        if unit == "%":
+            numbers.append((value, "%"))
+        else:
+            numbers.append((value * _UNIT_MULTIPLIERS.get(unit.lower(), 1.0), "amount"))
+    return numbers
+
+
+def _numbers_match(claim_numbers: List[Tuple[float, str]], source_numbers: List[Tuple[float, str]]) -> bool:
+    """주장의 모든 수치가 출처 수치 중 하나와 (허용 오차 내) 일치하는지 확인"""
+    return all(
+        any(
+            kind == s_kind and abs(value - s_value) <= NUMERIC_TOLERANCE * max(abs(value), abs(s_value))
+            for s_value, s_kind in source_numbers
+        )
+        for value, kind in claim_numbers
+    )
+
+
+class ValidationResult(TypedDict, total=False):
+    """_validate_with_llm / _merge_verification 이 주고받는 검증 결과 구조"""
+    validated_data: List[Dict[str, Any]]
+    removed_claims: List[str]
+    insights: List[str]
+    overall_confidence: float
+    ticker: str  # 검증 응답에 함께 실린 티커 (별도 LLM 호출 절약)
+    # validated_data 신뢰도 누적 합/개수 (병합 시 전체 재합산 방지)
+    _conf_sum: float
+    _conf_count: int
 
 
 class AnalystAgent(BaseAgent):
@@ -46,6 +176,9 @@ class AnalystAgent(BaseAgent):
 }
 """
     
+    # 재무 관련 키워드 매처 (클래스 로드 시 1회 컴파일)
+    _FIN_RE = re.compile("|".join(map(re.escape, FINANCIAL_KEYWORDS)), re.IGNORECASE)
+    
     def __init__(self, mcp_manager=None, neo4j_db=None):
         """
         Args:
@@ -60,6 +193,17 @@ class AnalystAgent(BaseAgent):
         self._mcp_manager = mcp_manager
         self._neo4j_db = neo4j_db
         self._yahoo_tool = None
+        
+        # MCP 도구 모듈을 백그라운드 스레드에서 미리 import (첫 Yahoo 검증의 cold-start 제거)
+        # 실행 중인 이벤트 루프가 없으면 기존처럼 첫 사용 시 import
+        self._yahoo_import_task: Optional["asyncio.Task"] = None
+        if mcp_manager:
+            try:
+                self._yahoo_import_task = asyncio.get_running_loop().create_task(
+                    asyncio.to_thread(importlib.import_module, "mcp.tools")
+                )
+            except RuntimeError:
+                pass
     
     async def execute(self, context: AgentContext) -> AgentContext:
         """
@@ -79,26 +223,48 @@ class AnalystAgent(BaseAgent):
             context.add_step(f"{self.name}: 소스 없음, 스킵")
             return context
         
+        # Yahoo 조회를 LLM 검증과 겹쳐서 미리 시작 (티커를 바로 알 수 있을 때만)
+        yahoo_prefetch = self._start_yahoo_prefetch(context.question)
+        
+        # Neo4j 읽기도 검증과 독립적이므로 동시에 시작
+        neo4j_task = None
+        if self._neo4j_db and context.neo4j_keys:
+            neo4j_task = asyncio.create_task(self._read_from_neo4j(context))
+        
+        def start_prefetch_from_stream(ticker: str) -> None:
+            # 검증 응답 스트림에서 티커가 먼저 도착하면 나머지 생성과 겹쳐 Yahoo 조회 시작
+            nonlocal yahoo_prefetch
+            if yahoo_prefetch is None:
+                yahoo_prefetch = asyncio.create_task(self._fetch_yahoo(ticker))
+        
         try:
             # 1. 기존 CitationValidator 활용 (있는 경우)
             validation_result = await self._validate_with_llm(
                 context.question,
                 context.sources,
-                context.raw_context
+                context.raw_context,
+                on_ticker=start_prefetch_from_stream if self._mcp_manager else None
             )
             
+            # validated_data는 한 번만 읽어 이후 단계에 그대로 전달
+            validated_data = validation_result.get("validated_data") or []
+            validation_result["validated_data"] = validated_data
+            
             # 2. Yahoo Finance로 수치 재검증 (MCP 활성화 시)
-            if self._mcp_manager and self._has_financial_claims(validation_result):
+            if self._mcp_manager and self._has_financial_claims(validated_data):
                 self._log("Yahoo Finance로 수치 재검증")
                 verified_result = await self._cross_verify_with_yahoo(
                     validation_result,
-                    context.question
+                    context.question,
+                    prefetch=yahoo_prefetch
+                )
+                validation_result = self._merge_verification(
+                    validation_result, validated_data, verified_result
                 )
-                validation_result = self._merge_verification(validation_result, verified_result)
             
             # 3. Neo4j에서 추가 컨텍스트 읽기 (LangGraph 워크플로우)
-            if self._neo4j_db and context.neo4j_keys:
-                additional_sources = await self._read_from_neo4j(context)
+            if neo4j_task is not None:
+                additional_sources = await neo4j_task
                 if additional_sources:
                     context.sources.extend(additional_sources)
                     self._log(f"Neo4j에서 {len(additional_sources)}개 추가 소스 로드")
@@ -112,11 +278,18 @@ class AnalystAgent(BaseAgent):
                     f"{self.name}: 정보 부족 감지 - {sufficiency_check['reason']}"
                 )
             
-            # 5. 결과를 컨텍스트에 반영
-            context.validated_data = validation_result.get("validated_data", [])
-            context.removed_claims = validation_result.get("removed_claims", [])
-            context.insights = validation_result.get("insights", [])
-            context.confidence = validation_result.get("overall_confidence", 0.5)
+            # 5. 결과를 컨텍스트에 반영 (한 번에)
+            (
+                context.validated_data,
+                context.removed_claims,
+                context.insights,
+                context.confidence
+            ) = (
+                validated_data,
+                validation_result.get("removed_claims", []),
+                validation_result.get("insights", []),
+                validation_result.get("overall_confidence", 0.5)
+            )
             
             self._log(
                 f"분석 완료: {len(context.validated_data)}개 검증된 주장, "
@@ -134,24 +307,56 @@ class AnalystAgent(BaseAgent):
             context.add_step(f"{self.name}: 실패 - {str(e)}")
             # 실패해도 원본 소스는 유지
             return context
+            
+        finally:
+            # 쓰이지 않은 백그라운드 태스크는 취소 (이미 끝났으면 예외만 회수)
+            for task in (yahoo_prefetch, neo4j_task):
+                if task is None:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
     
     async def _validate_with_llm(
         self,
         question: str,
         sources: List[Dict[str, Any]],
-        raw_context: str
-    ) -> Dict[str, Any]:
+        raw_context: str,
+        on_ticker: Optional[Callable[[str], None]] = None
+    ) -> ValidationResult:
         """
         LLM을 활용한 검증
         
+        Args:
+            on_ticker: 지정 시 응답을 스트리밍으로 받고, ticker 필드가 도착하는 즉시 호출
+            
         Returns:
             검증 결과 딕셔너리
         """
-        # 소스 요약 생성 (최대 10개)
-        sources_summary = "\n\n".join([
-            f"[{s.get('id', i+1)}] {s.get('file', 'Unknown')} (Page {s.get('page', 'N/A')}):\n{s.get('excerpt', '')[:300]}"
-            for i, s in enumerate(sources[:10])
-        ])
+        sources_summary = self._build_sources_summary(sources)
+        
+        # 응답 길이는 소스 수에 비례 → 필요한 만큼만 토큰 예산 할당
+        max_tokens = min(
+            VALIDATION_MAX_TOKENS,
+            VALIDATION_BASE_TOKENS
+            + VALIDATION_TOKENS_PER_SOURCE * min(len(sources), MAX_PROMPT_SOURCES)
+        )
+        
+        on_partial = None
+        if on_ticker is not None:
+            ticker_seen = False
+            
+            def on_partial(buffer: str) -> None:
+                nonlocal ticker_seen
+                if ticker_seen:
+                    return
+                match = _STREAM_TICKER_RE.search(buffer)
+                if match:
+                    ticker_seen = True
+                    ticker = match.group(1).upper()
+                    if ticker != "NONE":
+                        on_ticker(ticker)
         
         prompt = f"""질문: {question}
 
@@ -164,9 +369,11 @@ class AnalystAgent(BaseAgent):
 2. 수치는 정확히 소스와 일치해야 함
 3. 논리적 일관성 확인
 4. 인과관계 분석 포함
+5. 질문 대상 기업의 주식 티커 심볼 (예: NVDA), 없으면 "NONE" - 가장 먼저 출력
 
 JSON 형식으로 응답:
 {{
+  "ticker": "NVDA",
   "validated_data": [
     {{"claim": "구체적 주장", "confidence": 0.95, "citations": [1, 2], "reasoning": "근거"}},
     ...
@@ -178,33 +385,143 @@ JSON 형식으로 응답:
 """
         
         try:
-            response = await self._call_llm(prompt, temperature=0.0, max_tokens=2000)
+            response = await self._call_llm(
+                prompt,
+                temperature=0.0,
+                max_tokens=max_tokens,
+                response_format=JSON_RESPONSE_FORMAT,
+                on_partial=on_partial
+            )
             
-            # JSON 파싱
+            # JSON 파싱 (JSON 모드라 실패는 드물지만 토큰 한도 초과 등 대비)
             try:
-                result = json.loads(response)
+                result = json_loads(response)
+                mismatched = self._verify_claim_numbers(result.get("validated_data") or [], sources)
+                result = self._track_confidence_totals(result)
+                if mismatched and result["_conf_count"]:
+                    # 신뢰도를 낮춘 주장을 전체 신뢰도에도 반영 (주장 평균을 넘지 않도록)
+                    result["overall_confidence"] = min(
+                        result.get("overall_confidence", 0.5),
+                        result["_conf_sum"] / result["_conf_count"]
+                    )
                 return result
             except json.JSONDecodeError:
                 self._log("LLM 응답 JSON 파싱 실패, 기본 구조 반환")
-                return self._create_fallback_validation(sources)
+                return self._track_confidence_totals(self._create_fallback_validation(sources))
                 
         except Exception as e:
             self._log(f"LLM 검증 실패: {e}")
-            return self._create_fallback_validation(sources)
+            return self._track_confidence_totals(self._create_fallback_validation(sources))
+    
+    def _verify_claim_numbers(
+        self,
+        validated_data: List[Dict[str, Any]],
+        sources: List[Dict[str, Any]]
+    ) -> int:
+        """
+        주장의 수치를 인용 소스의 수치와 직접 대조 (LLM 산술 검증 보완)
+        인용 소스에 없는 수치를 포함한 주장은 신뢰도를 낮춤 (in-place)
+        
+        Args:
+            validated_data: LLM 검증 결과의 주장 리스트
+            sources: 프롬프트에 사용한 소스 리스트
+            
+        Returns:
+            신뢰도를 낮춘 주장 개수
+        """
+        excerpts = {
+            str(s.get("id", i + 1)): s.get("excerpt") or ""
+            for i, s in enumerate(sources)
+        }
+        source_numbers: Dict[str, List[Tuple[float, str]]] = {}
+        
+        mismatched = 0
+        for item in validated_data:
+            claim_numbers = _extract_numbers(item.get("claim", ""))
+            if not claim_numbers:
+                continue
+            
+            cited_numbers = []
+            for citation in item.get("citations", []):
+                key = str(citation)
+                if key not in excerpts:
+                    continue
+                if key not in source_numbers:
+                    source_numbers[key] = _extract_numbers(excerpts[key])
+                cited_numbers.extend(source_numbers[key])
+            
+            if cited_numbers and not _numbers_match(claim_numbers, cited_numbers):
+                item["confidence"] = item.get("confidence", 0.5) * NUMERIC_MISMATCH_PENALTY
+                item["numeric_mismatch"] = True
+                mismatched += 1
+        
+        if mismatched:
+            self._log(f"수치 불일치 주장 {mismatched}개 신뢰도 하향")
+        return mismatched
+    
+    @staticmethod
+    def _track_confidence_totals(result: ValidationResult) -> ValidationResult:
+        """validated_data의 신뢰도 합/개수를 결과에 기록 (병합 시 O(k) 갱신용)"""
+        validated_data = result.get("validated_data", [])
+        result["_conf_sum"] = sum(item.get("confidence", 0.5) for item in validated_data)
+        result["_conf_count"] = len(validated_data)
+        return result
     
-    def _create_fallback_validation(self, sources: List[Dict]) -> Dict[str, Any]:
+    def _build_sources_summary(self, sources: List[Dict[str, Any]]) -> str:
+        """
+        소스 요약 생성 (PROMPT_SOURCES_TOKEN_BUDGET 토큰, 최대 MAX_PROMPT_SOURCES개)
+        신뢰도 높은 소스부터 예산이 찰 때까지 채움 (짧은 발췌가 많으면 더 많은 소스 포함)
+        발췌가 동일한 소스(재수집/다중 서브태스크 중복)는 한 번만 포함하여 프롬프트 토큰 절감
+        
+        Args:
+            sources: 소스 리스트
+            
+        Returns:
+            프롬프트용 소스 요약 문자열
+        """
+        ranked = sorted(
+            enumerate(sources),
+            key=lambda pair: pair[1].get("confidence", 0.0),
+            reverse=True
+        )
+        
+        entries = []
+        seen_excerpts = set()
+        used_tokens = 0
+        for i, s in ranked:
+            excerpt = (s.get("excerpt") or "")[:MAX_EXCERPT_CHARS]
+            digest = hashlib.md5(excerpt.encode("utf-8")).digest()
+            if digest in seen_excerpts:
+                continue
+            seen_excerpts.add(digest)
+            
+            sid, file, page = s.get("id", i + 1), s.get("file", "Unknown"), s.get("page", "N/A")
+            entry = f"[{sid}] {file} (Page {page}):\n{excerpt}"
+            entry_tokens = _count_tokens(entry)
+            if entries and used_tokens + entry_tokens > PROMPT_SOURCES_TOKEN_BUDGET:
+                break
+            entries.append(entry)
+            used_tokens += entry_tokens
+            if len(entries) == MAX_PROMPT_SOURCES:
+                break
+        
+        return "\n\n".join(entries)
+    
+    def _create_fallback_validation(self, sources: List[Dict]) -> ValidationResult:
         """
         LLM 실패 시 폴백 검증 결과 생성
         (소스를 그대로 validated_data로 변환)
         """
-        validated_data = []
-        for i, source in enumerate(sources[:5]):  # 최대 5개
-            validated_data.append({
+        # 최대 5개 (리스트 컴프리헨션으로 한 번에 생성, 소스당 dict 조회 1회씩)
+        validated_data = [
+            {
                 "claim": source.get("excerpt", "")[:200],
                 "confidence": source.get("confidence", 0.7),
-                "citations": [source.get("id", i+1)],
+                "citations": [source.get("id", i + 1)],
                 "reasoning": "소스에서 직접 추출"
-            })
+            }
+            for i, source in enumerate(sources[:5])
+        ]
         
         return {
             "validated_data": validated_data,
@@ -213,35 +530,26 @@ JSON 형식으로 응답:
             "overall_confidence": 0.7
         }
     
-    def _has_financial_claims(self, validation_result: Dict[str, Any]) -> bool:
+    def _has_financial_claims(self, validated_data: List[Dict[str, Any]]) -> bool:
         """
-        검증 결과에 재무 수치 주장이 있는지 확인
+        검증된 주장 중 재무 수치 주장이 있는지 확인
         
         Args:
-            validation_result: 검증 결과
+            validated_data: 검증 결과의 validated_data 리스트
             
         Returns:
             재무 수치 포함 여부
         """
-        validated_data = validation_result.get("validated_data", [])
-        
-        # 재무 관련 키워드
-        financial_keywords = [
-            "주가", "price", "매출", "revenue", "이익", "profit",
-            "달러", "dollar", "$", "억", "조", "billion", "million"
-        ]
-        
-        for item in validated_data:
-            claim = item.get("claim", "").lower()
-            if any(keyword in claim for keyword in financial_keywords):
-                return True
-        
-        return False
+        return any(
+            self._FIN_RE.search(item.get("claim", ""))
+            for item in validated_data
+        )
     
     async def _cross_verify_with_yahoo(
         self,
-        validation_result: Dict[str, Any],
-        question: str
+        validation_result: ValidationResult,
+        question: str,
+        prefetch: Optional["asyncio.Task"] = None
     ) -> Dict[str, Any]:
         """
         Yahoo Finance로 수치 재검증
@@ -249,28 +557,28 @@ JSON 형식으로 응답:
         Args:
             validation_result: 기존 검증 결과
             question: 사용자 질문
+            prefetch: execute 시작 시 띄운 선조회 태스크 (ticker, price_data, company_info)
             
         Returns:
             Yahoo Finance 검증 결과
         """
         try:
-            # Yahoo Tool 초기화 (lazy)
-            if not self._yahoo_tool:
-                from mcp.tools import YahooFinanceTool
-                self._yahoo_tool = YahooFinanceTool(self._mcp_manager)
-            
-            # 티커 추출
-            ticker = await self._extract_ticker(question)
-            if not ticker:
-                self._log("티커를 추출할 수 없어 Yahoo Finance 검증 스킵")
-                return {}
+            if prefetch is not None:
+                # LLM 검증과 겹쳐서 이미 진행된 조회 결과 사용
+                ticker, price_data, company_info = await prefetch
+            else:
+                # 티커 추출 (검증 응답에 실린 티커 우선, 없으면 별도 추출)
+                ticker = self._ticker_from_validation(validation_result, question)
+                if ticker is None:
+                    ticker = await resolve_ticker(question, self)
+                if not ticker:
+                    self._log("티커를 추출할 수 없어 Yahoo Finance 검증 스킵")
+                    return {}
+                
+                ticker, price_data, company_info = await self._fetch_yahoo(ticker)
             
             self._log(f"Yahoo Finance 검증: {ticker}")
             
-            # 주가 및 재무 데이터 조회
-            price_data = await self._yahoo_tool.get_stock_price(ticker)
-            company_info = await self._yahoo_tool.get_company_info(ticker)
-            
             # 검증 결과 생성
             verified_claims = []
             
@@ -302,45 +610,78 @@ JSON 형식으로 응답:
             self._log(f"Yahoo Finance 검증 실패: {e}")
             return {}
     
-    async def _extract_ticker(self, question: str) -> Optional[str]:
+    async def _fetch_yahoo(self, ticker: str) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
         """
-        질문에서 주식 티커 추출
+        주가 및 기업 정보 동시 조회 (서로 독립적인 네트워크 호출)
         
-        Args:
-            question: 사용자 질문
-            
         Returns:
-            티커 심볼 또는 None
+            (ticker, price_data, company_info) - 실패한 조회는 {"error": ...}
         """
-        try:
-            prompt = f"""다음 질문에서 주식 티커 심볼을 추출하세요:
-
-질문: {question}
-
-티커 심볼만 반환하세요 (예: NVDA, AAPL, TSLA).
-티커를 찾을 수 없으면 "NONE"을 반환하세요.
-"""
-            response = await self._call_llm(prompt, temperature=0.0, max_tokens=50)
-            ticker = response.strip().upper()
-            
-            if ticker and ticker != "NONE" and len(ticker) <= 5:
-                return ticker
+        # Yahoo Tool 초기화 (lazy, 선행 import가 있으면 완료 대기)
+        if not self._yahoo_tool:
+            if self._yahoo_import_task is not None:
+                await self._yahoo_import_task
+            from mcp.tools import YahooFinanceTool
+            self._yahoo_tool = YahooFinanceTool(self._mcp_manager)
+        
+        price_data, company_info = await asyncio.gather(
+            self._yahoo_tool.get_stock_price(ticker),
+            self._yahoo_tool.get_company_info(ticker),
+            return_exceptions=True
+        )
+        if isinstance(price_data, Exception):
+            price_data = {"error": f"주가 조회 실패: {price_data}"}
+        if isinstance(company_info, Exception):
+            company_info = {"error": f"기업 정보 조회 실패: {company_info}"}
+        
+        return ticker, price_data, company_info
+    
+    def _start_yahoo_prefetch(self, question: str) -> Optional["asyncio.Task"]:
+        """
+        LLM 호출 없이 티커를 알 수 있으면 (캐시/주요 티커) Yahoo 조회를 미리 시작
+        
+        Returns:
+            선조회 태스크 또는 None (티커 미확정 → 검증 후 조회)
+        """
+        if not self._mcp_manager:
             return None
-            
-        except Exception as e:
-            self._log(f"티커 추출 실패: {e}")
+        
+        ticker = lookup_ticker(question)
+        if not ticker:
             return None
+        
+        return asyncio.create_task(self._fetch_yahoo(ticker))
+    
+    def _ticker_from_validation(
+        self,
+        validation_result: ValidationResult,
+        question: str
+    ) -> Optional[str]:
+        """
+        검증 응답의 ticker 필드 사용 (유효하면 티커 캐시에도 기록)
+        
+        Returns:
+            티커 심볼 또는 None (필드 없음/무효 → resolve_ticker로 폴백)
+        """
+        ticker = parse_ticker(validation_result.get("ticker"))
+        if ticker is None:
+            return None
+        
+        remember_ticker(question, ticker)
+        return ticker
     
     def _merge_verification(
         self,
-        original: Dict[str, Any],
+        original: ValidationResult,
+        validated_data: List[Dict[str, Any]],
         verified: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> ValidationResult:
         """
         기존 검증 결과와 Yahoo Finance 검증 결과 병합
         
         Args:
             original: 기존 검증 결과
+            validated_data: original의 validated_data (제자리에서 확장됨)
             verified: Yahoo Finance 검증 결과
             
         Returns:
@@ -349,19 +690,39 @@ JSON 형식으로 응답:
         if not verified or "verified_claims" not in verified:
             return original
         
-        # 검증된 주장 추가
-        original_data = original.get("validated_data", [])
         verified_claims = verified.get("verified_claims", [])
         
-        # 중복 제거하면서 병합
-        merged_data = original_data + verified_claims
+        if "_conf_count" not in original:
+            self._track_confidence_totals(original)
+        
+        # 중복 제거하면서 병합: 같은 내용의 기존 주장은 Yahoo 검증으로 갱신, 새 주장만 추가
+        # 누적 합/개수는 변경분만 반영 (기존 주장 재합산 없음)
+        existing = {_normalize_claim(item.get("claim", "")): item for item in validated_data}
+        new_claims = []
+        for claim in verified_claims:
+            duplicate = existing.get(_normalize_claim(claim.get("claim", "")))
+            if duplicate is None:
+                new_claims.append(claim)
+                continue
+            
+            old_confidence = duplicate.get("confidence", 0.5)
+            duplicate["confidence"] = max(old_confidence, claim.get("confidence", 0.5))
+            duplicate["citations"] = list(dict.fromkeys(
+                [*duplicate.get("citations", []), *claim.get("citations", [])]
+            ))
+            duplicate["verified"] = True
+            original["_conf_sum"] += duplicate["confidence"] - old_confidence
         
         # 신뢰도 재계산 (Yahoo Finance 검증으로 신뢰도 상승)
-        if merged_data:
-            avg_confidence = sum(item.get("confidence", 0.5) for item in merged_data) / len(merged_data)
+        original["_conf_sum"] += sum(item.get("confidence", 0.5) for item in new_claims)
+        original["_conf_count"] += len(new_claims)
+        if original["_conf_count"]:
+            avg_confidence = original["_conf_sum"] / original["_conf_count"]
             original["overall_confidence"] = min(avg_confidence + 0.05, 1.0)  # 최대 5% 상승
         
-        original["validated_data"] = merged_data
+        # 검증된 주장 추가 (새 리스트를 만들지 않고 제자리 확장)
+        validated_data.extend(new_claims)
+        original["validated_data"] = validated_data
         
         # 인사이트 추가
         insights = original.get("insights", [])
@@ -381,32 +742,34 @@ JSON 형식으로 응답:
             추가 소스 리스트
         """
         try:
-            import json
-            additional_sources = []
-            
-            for key in context.neo4j_keys:
-                # Neo4j에서 노드 조회
-                with self._neo4j_db.driver.session() as session:
-                    result = session.run(
-                        "MATCH (n {id: $key}) RETURN n",
-                        key=key
-                    )
-                    
-                    for record in result:
-                        node = record["n"]
-                        data_str = node.get("data", "{}")
-                        data = json.loads(data_str)
-                        
-                        # 소스 추출
-                        sources = data.get("sources", [])
-                        additional_sources.extend(sources)
-            
-            return additional_sources
+            # 동기 드라이버 호출은 공유 I/O 스레드 풀에서 실행 (LLM 검증과 동시에 진행되도록)
+            return await self._run_blocking(self._read_from_neo4j_sync, list(context.neo4j_keys))
             
         except Exception as e:
             self._log(f"Neo4j 읽기 실패: {e}")
             return []
     
+    def _read_from_neo4j_sync(self, neo4j_keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        _read_from_neo4j의 동기 본체 (모든 키를 UNWIND 쿼리 1회로 조회)
+        레코드를 도착하는 대로 파싱하여 전체 결과를 한 번에 메모리에 올리지 않음
+        """
+        additional_sources = []
+        
+        with self._neo4j_db.driver.session() as session:
+            result = session.run(
+                "UNWIND $keys AS key "
+                "MATCH (n:AgenticData {id: key}) "
+                "RETURN coalesce(n.data, '{}') AS data",
+                keys=neo4j_keys
+            )
+            
+            # 소스 추출
+            for record in result:
+                additional_sources.extend(json_loads(record["data"]).get("sources", []))
+        
+        return additional_sources
+    
     async def _check_sufficiency(self, context: AgentContext) -> Dict[str, Any]:
         """
         정보 충분성 판단
@@ -438,16 +801,13 @@ JSON 형식으로 응답:
         
         # 서브태스크 기반 판단
         if context.subtasks:
-            subtask_coverage = {}
-            for source in context.sources:
-                subtask_id = source.get("subtask_id")
-                if subtask_id:
-                    subtask_coverage[subtask_id] = subtask_coverage.get(subtask_id, 0) + 1
-            
-            missing_subtasks = []
-            for subtask in context.subtasks:
-                if subtask["id"] not in subtask_coverage or subtask_coverage[subtask["id"]] < 2:
-                    missing_subtasks.append(subtask["id"])
+            # 서브태스크별 소스 개수 (Counter는 C 레벨에서 집계, 없는 키는 0)
+            subtask_coverage = Counter(map(_SUBTASK_ID_GETTER, context.sources))
+            
+            missing_subtasks = [
+                subtask["id"] for subtask in context.subtasks
+                if subtask_coverage[subtask["id"]] < MIN_SOURCES_PER_SUBTASK
+            ]
             
             if missing_subtasks:
                 return {
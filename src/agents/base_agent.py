@@ -2,14 +2,48 @@
 모든 에이전트의 공통 기능을 제공하는 베이스 클래스
 """
 
+import asyncio
 import os
+import random
+import time
+import httpx
 import psutil
 from abc import ABC, abstractmethod
-from typing import Optional
-from openai import AsyncOpenAI
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Any, Callable, TypeVar
+from openai import (
+    AsyncOpenAI, APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+)
 
 from .agent_context import AgentContext
-from config import OPENAI_API_KEY, OPENAI_BASE_URL
+from .llm_cache import get_llm_cache, FileCache
+from config import (
+    OPENAI_API_KEY, OPENAI_BASE_URL, LLM_CACHE_TTL_SECONDS,
+    DISABLE_MEM_CHECK, MEM_CHECK_INTERVAL_SECONDS
+)
+
+
+LLM_MODEL = "gpt-4o"
+
+# 공유 OpenAI 클라이언트 커넥션 풀 설정
+LLM_MAX_CONNECTIONS = 50
+LLM_MAX_KEEPALIVE_CONNECTIONS = 20
+LLM_TIMEOUT_SECONDS = 60.0
+
+# LLM 재시도 백오프: BASE * 2^attempt + [0, JITTER) 초 (429는 Retry-After 우선)
+LLM_RETRY_BASE_DELAY = 0.5
+LLM_RETRY_JITTER = 0.5
+LLM_RETRY_MAX_DELAY = 30.0
+
+# 동기 I/O(Neo4j 드라이버 등) 전용 스레드 수
+# 기본 executor(min(32, CPU+4))는 저사양 환경에서 작아 서브태스크 동시 저장/조회가 줄을 서므로 별도 풀 사용
+BLOCKING_IO_WORKERS = 16
+
+# 메모리 사용률 캐시 (모든 에이전트 공유, MEM_CHECK_INTERVAL_SECONDS마다 갱신)
+_mem_cache = {"ts": float("-inf"), "percent": 0.0}
+
+T = TypeVar("T")
 
 
 class BaseAgent(ABC):
@@ -18,13 +52,20 @@ class BaseAgent(ABC):
     공통 기능: LLM 호출, 메모리 체크, 로깅
     """
     
+    # 모든 에이전트 인스턴스가 공유하는 OpenAI 클라이언트 (첫 생성 시 초기화)
+    _shared_client: Optional[AsyncOpenAI] = None
+    
+    # 모든 에이전트가 공유하는 동기 I/O 스레드 풀 (첫 사용 시 생성)
+    _blocking_executor: Optional[ThreadPoolExecutor] = None
+    
     def __init__(
         self,
         name: str,
         system_prompt: str,
         temperature: float = 0.2,
         max_retries: int = 3,
-        memory_threshold: float = 85.0
+        memory_threshold: float = 85.0,
+        request_timeout: Optional[float] = None
     ):
         """
         Args:
@@ -33,18 +74,59 @@ class BaseAgent(ABC):
             temperature: LLM 온도 (0.0 = 정확, 2.0 = 창의적)
             max_retries: LLM 호출 실패 시 재시도 횟수
             memory_threshold: 메모리 사용률 임계값 (%)
+            request_timeout: _call_llm_hedged의 헤지 요청 시작 기준 (초, None이면 헤지 없음)
         """
         self.name = name
         self.system_prompt = system_prompt
         self.temperature = temperature
         self.max_retries = max_retries
         self.memory_threshold = memory_threshold
+        self.request_timeout = request_timeout
+        
+        # OpenAI 클라이언트 (전 에이전트 공유 → TLS 연결/keep-alive 풀 재사용)
+        self.llm_client = self._get_shared_client()
+    
+    @staticmethod
+    def _get_shared_client() -> AsyncOpenAI:
+        """
+        공유 OpenAI 클라이언트 반환 (없으면 생성)
+        
+        에이전트마다 클라이언트를 만들면 각자 별도 커넥션 풀과 TLS 핸드셰이크를 가지므로
+        하나의 httpx 풀을 모든 에이전트가 함께 사용
+        """
+        if BaseAgent._shared_client is None:
+            BaseAgent._shared_client = AsyncOpenAI(
+                api_key=OPENAI_API_KEY,
+                base_url=OPENAI_BASE_URL if OPENAI_BASE_URL else None,
+                max_retries=0,  # 재시도는 _call_llm이 백오프와 함께 담당
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=LLM_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS
+                    ),
+                    timeout=LLM_TIMEOUT_SECONDS
+                )
+            )
+        return BaseAgent._shared_client
+    
+    async def _run_blocking(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        동기(블로킹) 함수를 공유 스레드 풀에서 실행 (이벤트 루프를 막지 않도록)
         
-        # OpenAI 클라이언트 초기화 (메모리 효율적)
-        self.llm_client = AsyncOpenAI(
-            api_key=OPENAI_API_KEY,
-            base_url=OPENAI_BASE_URL if OPENAI_BASE_URL else None
-        )
+        Args:
+            fn: 동기 함수 (예: Neo4j 동기 드라이버 호출)
+            *args, **kwargs: fn 인자
+            
+        Returns:
+            fn 반환값
+        """
+        if BaseAgent._blocking_executor is None:
+            BaseAgent._blocking_executor = ThreadPoolExecutor(
+                max_workers=BLOCKING_IO_WORKERS,
+                thread_name_prefix="agent-io"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(BaseAgent._blocking_executor, partial(fn, *args, **kwargs))
     
     @abstractmethod
     async def execute(self, context: AgentContext) -> AgentContext:
@@ -64,7 +146,11 @@ class BaseAgent(ABC):
         self,
         prompt: str,
         temperature: Optional[float] = None,
-        max_tokens: int = 2000
+        max_tokens: int = 2000,
+        response_format: Optional[Dict[str, Any]] = None,
+        use_cache: Optional[bool] = None,
+        cache_ttl: float = LLM_CACHE_TTL_SECONDS,
+        on_partial: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         OpenAI API 호출 (재시도 로직 포함)
@@ -73,47 +159,165 @@ class BaseAgent(ABC):
             prompt: 사용자 프롬프트
             temperature: 온도 (None이면 기본값 사용)
             max_tokens: 최대 토큰 수
+            response_format: 출력 형식 제약 (예: {"type": "json_object"}), None이면 자유 텍스트
+            use_cache: 응답 캐시 사용 여부 (None이면 temperature 0.0인 결정적 호출만 캐시)
+            cache_ttl: 캐시 유효 기간 (초)
+            on_partial: 지정 시 스트리밍으로 받으며 누적 응답을 토큰 도착마다 전달
+                        (전체 응답 전에 후속 작업을 시작할 때 사용)
             
         Returns:
             LLM 응답 텍스트
         """
         temp = temperature if temperature is not None else self.temperature
+        extra_params = {"response_format": response_format} if response_format else {}
+        
+        # 응답 캐시 조회
+        cache = get_llm_cache() if (use_cache if use_cache is not None else temp == 0.0) else None
+        cache_key = None
+        if cache is not None:
+            cache_key = FileCache.make_key(
+                self.system_prompt, prompt, temp, max_tokens, LLM_MODEL, response_format
+            )
+            cached = await self._run_blocking(cache.get, cache_key)
+            if cached is not None:
+                if on_partial is not None:
+                    on_partial(cached)  # 스트리밍 호출자에게는 캐시 응답 전체를 한 번에 전달
+                return cached
         
         for attempt in range(self.max_retries):
             try:
                 self._check_memory()
                 
                 response = await self.llm_client.chat.completions.create(
-                    model="gpt-4o",
+                    model=LLM_MODEL,
                     messages=[
                         {"role": "system", "content": self.system_prompt},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=temp,
-                    max_tokens=max_tokens
+                    max_tokens=max_tokens,
+                    stream=on_partial is not None,
+                    **extra_params
                 )
                 
-                return response.choices[0].message.content.strip()
+                if on_partial is None:
+                    content = response.choices[0].message.content.strip()
+                else:
+                    content = (await self._consume_stream(response, on_partial)).strip()
+                if cache_key is not None:
+                    await self._run_blocking(cache.set, cache_key, content, cache_ttl)
+                return content
                 
             except MemoryError as e:
                 self._log(f"메모리 부족: {e}")
                 raise
-            except Exception as e:
+            except (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError) as e:
+                # 일시적 오류만 재시도 (그 외 오류는 재시도해도 같은 결과이므로 즉시 실패)
                 self._log(f"LLM 호출 실패 (시도 {attempt + 1}/{self.max_retries}): {e}")
                 if attempt == self.max_retries - 1:
                     raise
+                await asyncio.sleep(self._retry_delay(e, attempt))
         
         raise RuntimeError(f"{self.name}: LLM 호출 최대 재시도 초과")
     
+    async def _call_llm_hedged(
+        self,
+        prompt: str,
+        hedge_after: Optional[float] = None,
+        **kwargs: Any
+    ) -> str:
+        """
+        지연 시 헤지 요청을 보내는 LLM 호출 (느린 응답 하나가 전체 파이프라인을 붙잡지 않도록)
+        
+        첫 요청이 hedge_after초 안에 끝나지 않으면 같은 요청을 하나 더 보내고
+        먼저 성공한 응답을 사용 (나머지는 취소). 둘 다 실패하면 첫 요청의 오류 전파
+        
+        Args:
+            prompt: 사용자 프롬프트
+            hedge_after: 헤지 요청 시작 기준 (초, None이면 self.request_timeout)
+            **kwargs: _call_llm 인자 (on_partial 제외 - 두 요청이 동시에 스트리밍하지 않도록)
+            
+        Returns:
+            LLM 응답 텍스트
+        """
+        hedge_after = hedge_after if hedge_after is not None else self.request_timeout
+        if hedge_after is None:
+            return await self._call_llm(prompt, **kwargs)
+        
+        tasks = [asyncio.create_task(self._call_llm(prompt, **kwargs))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                self._log(f"LLM 응답 지연 ({hedge_after:g}초 초과), 헤지 요청 시작")
+                tasks.append(asyncio.create_task(self._call_llm(prompt, **kwargs)))
+            
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return tasks[0].result()  # 모두 실패: 첫 요청의 오류 전파
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """
+        재시도 대기 시간 계산
+        
+        429(Rate Limit)는 서버가 알려준 Retry-After를 따르고,
+        그 외 일시적 오류는 지수 백오프 + 지터 (동시 재시도 분산)
+        """
+        if isinstance(error, RateLimitError):
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                return min(float(retry_after), LLM_RETRY_MAX_DELAY)
+            except (TypeError, ValueError):
+                pass
+        
+        delay = LLM_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, LLM_RETRY_JITTER)
+        return min(delay, LLM_RETRY_MAX_DELAY)
+    
+    @staticmethod
+    async def _consume_stream(stream, on_partial: Callable[[str], None]) -> str:
+        """
+        스트리밍 응답을 누적하며 청크마다 on_partial(누적 버퍼) 호출
+        
+        Returns:
+            전체 응답 텍스트
+        """
+        buffer = ""
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                buffer += delta
+                on_partial(buffer)
+        return buffer
+    
     def _check_memory(self) -> None:
         """
         메모리 사용률 체크 (8GB RAM 환경 대응)
         임계값 초과 시 MemoryError 발생
+        
+        /proc/meminfo 읽기를 줄이기 위해 사용률은 짧은 주기로 캐시
+        (LLM 호출 간격 동안 임계값을 넘나들 가능성은 낮음)
         """
-        mem = psutil.virtual_memory()
-        if mem.percent > self.memory_threshold:
+        if DISABLE_MEM_CHECK:
+            return
+        
+        now = time.monotonic()
+        if now - _mem_cache["ts"] > MEM_CHECK_INTERVAL_SECONDS:
+            _mem_cache.update(ts=now, percent=psutil.virtual_memory().percent)
+        
+        percent = _mem_cache["percent"]
+        if percent > self.memory_threshold:
             raise MemoryError(
-                f"{self.name}: 메모리 사용률 {mem.percent:.1f}% 초과 "
+                f"{self.name}: 메모리 사용률 {percent:.1f}% 초과 "
                 f"(임계값: {self.memory_threshold}%)"
             )
     
@@ -0,0 +1,116 @@
+"""
+디버그 이벤트 로그 (비동기 워크플로우용 논블로킹 기록)
+호출 측은 큐에 넣기만 하고, 파일 쓰기는 데몬 스레드가 모아서 한 번에 수행
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# orjson이 있으면 bytes로 바로 직렬화 (파일도 바이너리 모드로 기록 → 문자열 인코딩 단계 없음)
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# GRAPHRAG_DEBUG가 설정된 경우에만 기록 (python -O 실행 시에도 비활성) → 운영 환경에서는 아무 작업도 하지 않음
+DEBUG_ENABLED = __debug__ and bool(os.environ.get("GRAPHRAG_DEBUG"))
+DEBUG_LOG_PATH = os.environ.get(
+    "GRAPHRAG_DEBUG_LOG",
+    "/Users/gyuteoi/Desktop/graphrag/Finance_GraphRAG/.cursor/debug.log"
+)
+
+# 한 번의 writelines()로 기록할 최대 이벤트 수
+DEBUG_LOG_BATCH_SIZE = 64
+
+_queue: "queue.SimpleQueue[bytes]" = queue.SimpleQueue()
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _drain(first: bytes) -> List[bytes]:
+    """첫 이벤트 + 큐에 쌓인 이벤트를 배치 크기까지 수집"""
+    lines = [first]
+    while len(lines) < DEBUG_LOG_BATCH_SIZE:
+        try:
+            lines.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    return lines
+
+
+def _write(lines: List[bytes]) -> None:
+    """이벤트 배치 기록 (디버그 로그 실패가 워크플로우를 멈추지 않도록 오류 무시)"""
+    try:
+        with open(DEBUG_LOG_PATH, "ab") as f:
+            f.writelines(lines)
+    except OSError:
+        pass
+
+
+def _writer_loop() -> None:
+    """데몬 스레드 본체: 이벤트가 올 때까지 대기 후 배치로 기록"""
+    while True:
+        _write(_drain(_queue.get()))
+
+
+def _flush() -> None:
+    """종료 시 큐에 남은 이벤트 기록"""
+    while True:
+        try:
+            first = _queue.get_nowait()
+        except queue.Empty:
+            return
+        _write(_drain(first))
+
+
+def _ensure_writer() -> None:
+    """기록 스레드 시작 (최초 1회)"""
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_writer_loop, name="debug-log-writer", daemon=True)
+            _writer.start()
+            atexit.register(_flush)
+
+
+def log_event(
+    location: str,
+    message: str,
+    data: Optional[Dict[str, Any]] = None,
+    hypothesis_id: str = "",
+    run_id: str = "run1",
+    session_id: str = "debug-session"
+) -> None:
+    """
+    디버그 이벤트 기록 요청 (블로킹 I/O 없음)
+    
+    Args:
+        location: 발생 위치 (예: "langgraph_workflow.py:56")
+        message: 이벤트 설명
+        data: 추가 데이터
+        hypothesis_id: 디버깅 가설 ID
+        run_id: 실행 ID
+        session_id: 세션 ID
+    """
+    if not DEBUG_ENABLED:
+        return
+    
+    _ensure_writer()
+    _queue.put_nowait(_dumps({
+        "location": location,
+        "message": message,
+        "data": data or {},
+        "timestamp": time.time() * 1000,
+        "sessionId": session_id,
+        "runId": run_id,
+        "hypothesisId": hypothesis_id
+    }) + b"\n")
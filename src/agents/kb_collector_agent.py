@@ -3,12 +3,152 @@
 GraphRAG + Web Search를 통한 정보 수집
 """
 
+import asyncio
+import hashlib
 import json
+import re
+import secrets
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from .base_agent import BaseAgent
 from .agent_context import AgentContext, QueryComplexity
+from .semantic_cache import get_semantic_cache, embed_texts, cosine_similarity
+from .ticker_resolver import resolve_ticker
+from config import WEB_SEARCH_MAX_RESULTS, SOURCE_DEDUP_ENABLED, SOURCE_DEDUP_THRESHOLD
+
+# orjson이 있으면 빠른 C 직렬화/파싱 사용 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+try:
+    import orjson
+    from orjson import loads as json_loads
+    
+    def _json_dumps(obj: Any) -> str:
+        """Neo4j 문자열 속성용 JSON 직렬화"""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    from json import loads as json_loads
+    
+    def _json_dumps(obj: Any) -> str:
+        """Neo4j 문자열 속성용 JSON 직렬화"""
+        return json.dumps(obj, default=str)
+
+
+# 서브태스크 동시 수집 개수 (LLM/검색 API rate limit 보호)
+SUBTASK_CONCURRENCY = 5
+
+# raw_context 조립 시 소스당 발췌 길이 (전체 페이지 텍스트가 그대로 쌓이지 않도록)
+RAW_CONTEXT_EXCERPT_CHARS = 2000
+
+# 중복 소스 판별 시 임베딩할 발췌 길이
+DEDUP_EXCERPT_CHARS = 512
+
+# 상충 감지 대상: 최대 소스 개수 / 소스당 발췌 길이
+CONFLICT_MAX_SOURCES = 5
+CONFLICT_EXCERPT_CHARS = 200
+
+# 신뢰도가 없는 소스(GraphRAG 청크 등)의 커버리지 계산용 기본 신뢰도
+DEFAULT_SOURCE_CONFIDENCE = 0.7
+
+# 서브태스크는 범위가 좁아 일반 수집보다 낮은 커버리지로 충분 (기존 소스 개수 기준 2/3개와 같은 비율)
+# 기본 임계값 2.0 → 1.33: 신뢰도 없는 GraphRAG 소스 2개(1.4)면 Tavily 생략
+SUBTASK_COVERAGE_RATIO = 2 / 3
+
+# 상충 후보 사전 필터: "지표명 [:] [$]수치" 쌍 추출 (예: "매출 57억", "revenue: $5.7")
+_METRIC_VALUE_RE = re.compile(r"([A-Za-z가-힣]+)\s*[:\s]?\s*\$?([\d,]+\.?\d*)")
+_KOREAN_PARTICLES = frozenset("은는이가을를의")
+
+
+def _metric_key(token: str) -> str:
+    """지표명 정규화 (소문자, 한글 조사 1자 제거: "매출은" → "매출")"""
+    token = token.lower()
+    if len(token) > 2 and token[-1] in _KOREAN_PARTICLES:
+        return token[:-1]
+    return token
+
+
+def _source_hash(source: Dict[str, Any]) -> bytes:
+    """소스 내용 해시 (키 순서 무관, 8바이트 blake2b)"""
+    payload = json.dumps(source, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+
+
+def _raw_context_entry(source: Dict[str, Any], default_id: Any) -> str:
+    """raw_context에 들어가는 소스 한 건 ("[id] 파일: 발췌")"""
+    return (
+        f"[{source.get('id', default_id)}] {source.get('file', 'Unknown')}: "
+        f"{(source.get('excerpt') or '')[:RAW_CONTEXT_EXCERPT_CHARS]}"
+    )
+
+
+def _prune_raw_context(raw_context: str, removed: List[Dict[str, Any]]) -> str:
+    """
+    제거된 소스의 항목을 raw_context에서도 삭제 (Writer/Analyst가 중복 발췌를 다시 보지 않도록)
+    
+    Args:
+        raw_context: 수집 단계에서 조립한 컨텍스트
+        removed: 제거된 소스 (id가 있는 GraphRAG 소스만 raw_context에 항목이 있음)
+        
+    Returns:
+        정리된 raw_context
+    """
+    for source in removed:
+        if "id" not in source:
+            continue
+        entry = _raw_context_entry(source, None)
+        for pattern in (f"\n\n{entry}", f"{entry}\n\n", entry):
+            if pattern in raw_context:
+                raw_context = raw_context.replace(pattern, "", 1)
+                break
+    return raw_context
+
+
+def _natural_sort_key(value: Any) -> Tuple:
+    """숫자 인식 정렬 키 (소스 id "2" < "10", "web_2" < "web_10")"""
+    return tuple(
+        int(part) if part.isdigit() else part
+        for part in re.split(r"(\d+)", str(value))
+    )
+
+
+def _has_sufficient_coverage(sources: List[Dict], threshold: float) -> bool:
+    """
+    수집 소스만으로 충분한지 판단 (소스 개수 대신 신뢰도 합 기준)
+    
+    Args:
+        sources: 수집된 소스
+        threshold: 신뢰도 합 하한 (AgentContext.coverage_threshold)
+        
+    Returns:
+        신뢰도 합 ≥ threshold이면 True (Tavily 보강 불필요)
+    """
+    return sum(s.get("confidence", DEFAULT_SOURCE_CONFIDENCE) for s in sources) >= threshold
+
+
+def _has_candidate_numeric_conflict(sources: List[Dict]) -> bool:
+    """
+    같은 지표를 서로 다른 소스가 다른 값으로 언급하는지 확인 (LLM 상충 감지 필요 여부)
+    
+    Args:
+        sources: 상충 감지 대상 소스
+        
+    Returns:
+        2개 이상 소스가 같은 지표에 서로 다른 수치를 제시하면 True
+    """
+    # 지표 → {수치 → 언급한 소스 인덱스}
+    metrics: Dict[str, Dict[str, set]] = {}
+    for i, source in enumerate(sources):
+        excerpt = (source.get("excerpt") or "")[:CONFLICT_EXCERPT_CHARS]
+        for token, value in _METRIC_VALUE_RE.findall(excerpt):
+            value = value.replace(",", "").rstrip(".")
+            metrics.setdefault(_metric_key(token), {}).setdefault(value, set()).add(i)
+    
+    for values in metrics.values():
+        if len(values) < 2:
+            continue
+        mentioning = set().union(*values.values())
+        if len(mentioning) >= 2:
+            return True
+    return False
 
 
 class KBCollectorAgent(BaseAgent):
@@ -45,6 +185,23 @@ class KBCollectorAgent(BaseAgent):
 }
 """
     
+    # 외부 호출별 시간 제한 (초) - 초과 시 해당 소스만 건너뜀 (느린 백엔드 하나가 전체를 붙잡지 않도록)
+    TIMEOUTS = {
+        "graphrag": 8.0,
+        "yahoo": 3.0,
+        "tavily": 5.0,
+        "web": 5.0,
+        "conflicts": 4.0,
+        "ticker": 2.0,
+    }
+    
+    # 주가, 시가총액, 재무제표 등 실시간 데이터 키워드 (클래스 로드 시 1회 컴파일)
+    _YAHOO_RE = re.compile(
+        r"주가|stock\s*price|현재가|시가총액|market\s*cap|재무제표|financial|매출|revenue"
+        r"|이익|profit|eps|pe\s*ratio|배당|dividend",
+        re.IGNORECASE
+    )
+    
     def __init__(self, engine=None, web_search_enabled: bool = False, mcp_manager=None, neo4j_db=None):
         """
         Args:
@@ -64,6 +221,7 @@ class KBCollectorAgent(BaseAgent):
         self._neo4j_db = neo4j_db
         self._yahoo_tool = None
         self._tavily_tool = None
+        self._web_search = None
     
     async def execute(self, context: AgentContext) -> AgentContext:
         """
@@ -83,9 +241,11 @@ class KBCollectorAgent(BaseAgent):
             if context.subtasks:
                 self._log(f"{len(context.subtasks)}개 서브태스크 기반 수집")
                 await self._collect_by_subtasks(context)
+                await self._dedupe_sources(context)
             else:
-                # 일반 수집 (기존 방식)
-                await self._collect_general(context)
+                # 일반 수집 (의미가 같은 질문은 시맨틱 캐시의 수집 결과 재사용)
+                await self._collect_general_cached(context)
+                self._start_conflict_detection(context)
             
             # Neo4j Shared Memory에 저장
             if self._neo4j_db and context.sources:
@@ -108,70 +268,272 @@ class KBCollectorAgent(BaseAgent):
         Args:
             context: 공유 컨텍스트
         """
-        for subtask in context.subtasks:
-            task_query = subtask.get("task", context.question)
-            self._log(f"서브태스크 {subtask['id']}: {task_query}")
-            
-            # GraphRAG 검색
-            sources, raw_context, backend = await self._retrieve_from_graphrag(task_query)
-            
-            # 서브태스크 메타데이터 추가
+        # 서브태스크끼리는 독립적인 I/O → 동시에 수집 (지연시간: 합 → 최댓값)
+        semaphore = asyncio.Semaphore(SUBTASK_CONCURRENCY)
+        
+        async def collect(subtask: Dict[str, Any]):
+            async with semaphore:
+                return await self._collect_one_subtask(subtask, context)
+        
+        results = await asyncio.gather(
+            *(collect(subtask) for subtask in context.subtasks),
+            return_exceptions=True
+        )
+        
+        # Feedback Loop 재수집: 이전 반복에서 이미 가진 소스는 다시 추가하지 않음
+        seen = context.source_hashes
+        if len(seen) < len(context.sources):
+            seen.update(map(_source_hash, context.sources))
+        
+        # 서브태스크 순서대로 병합 (결과 순서 결정적)
+        # raw_context는 조각을 모아 마지막에 한 번만 결합 (반복 += 재할당 방지)
+        raw_context_chunks = [context.raw_context] if context.raw_context else []
+        duplicates = 0
+        for subtask, result in zip(context.subtasks, results):
+            if isinstance(result, Exception):
+                self._log(f"서브태스크 {subtask['id']} 수집 실패: {result}")
+                continue
+            
+            task_query, sources, raw_context, backend = result
             for source in sources:
-                source["subtask_id"] = subtask["id"]
-                source["subtask_target"] = subtask.get("target", "general")
+                source_hash = _source_hash(source)
+                if source_hash in seen:
+                    duplicates += 1
+                    continue
+                seen.add(source_hash)
+                context.sources.append(source)
+            raw_context_chunks.append(f"\n\n### Subtask {subtask['id']}: {task_query}\n{raw_context}")
+            context.retrieval_backend = backend
+        
+        context.raw_context = "".join(raw_context_chunks)
+        if duplicates:
+            self._log(f"이미 수집된 소스 {duplicates}개 제외")
+    
+    async def _collect_one_subtask(
+        self,
+        subtask: Dict[str, Any],
+        context: AgentContext
+    ) -> Tuple[str, List[Dict], str, str]:
+        """
+        서브태스크 하나의 정보 수집 (GraphRAG + Yahoo + Tavily)
+        
+        Args:
+            subtask: 서브태스크
+            context: 공유 컨텍스트 (읽기 전용)
             
-            context.sources.extend(sources)
-            context.raw_context += f"\n\n### Subtask {subtask['id']}: {task_query}\n{raw_context}"
+        Returns:
+            (task_query, subtask_id가 태깅된 sources, raw_context, backend)
+        """
+        task_query = subtask.get("task", context.question)
+        self._log(f"서브태스크 {subtask['id']}: {task_query}")
+        
+        # GraphRAG 검색
+        sources, raw_context, backend = await self._retrieve_from_graphrag(task_query)
+        
+        # 서브태스크 메타데이터 추가
+        for source in sources:
+            source["subtask_id"] = subtask["id"]
+            source["subtask_target"] = subtask.get("target", "general")
+        
+        collected = list(sources)
+        
+        # MCP 도구 활용
+        if self._mcp_manager:
+            if self._should_use_yahoo(task_query):
+                yahoo_sources = await self._fetch_yahoo_data(task_query)
+                for s in yahoo_sources:
+                    s["subtask_id"] = subtask["id"]
+                collected.extend(yahoo_sources)
+            
+            subtask_threshold = context.coverage_threshold * SUBTASK_COVERAGE_RATIO
+            if context.enable_web_search or not _has_sufficient_coverage(sources, subtask_threshold):
+                tavily_sources = await self._fetch_tavily_search(task_query)
+                for s in tavily_sources:
+                    s["subtask_id"] = subtask["id"]
+                collected.extend(tavily_sources)
+        
+        return task_query, collected, raw_context, backend
+    
+    async def _collect_general_cached(self, context: AgentContext) -> None:
+        """
+        시맨틱 캐시를 거친 일반 정보 수집
+        
+        정확히 같은 질문이면 바로 재사용하고, 아니면 임베딩 유사도 조회와 실제 수집을
+        동시에 시작하여 캐시 미스여도 지연이 늘지 않게 함 (적중 시 수집 취소)
+        
+        Args:
+            context: 공유 컨텍스트
+        """
+        cache = get_semantic_cache()
+        if cache is None:
+            await self._collect_general(context)
+            await self._dedupe_sources(context)
+            return
+        
+        snapshot = cache.get_exact(context.question)
+        if snapshot is None:
+            collect_task = asyncio.create_task(self._collect_general(context))
+            try:
+                snapshot, context.question_embedding = await cache.get_similar(context.question)
+            except Exception as e:
+                self._log(f"시맨틱 캐시 조회 실패: {e}")
+            
+            if snapshot is None:
+                await collect_task
+                await self._dedupe_sources(context)
+                if context.sources and context.retrieval_backend != "error":
+                    cache.set(context.question, self._snapshot_collection(context), context.question_embedding)
+                return
+            
+            collect_task.cancel()
+            try:
+                await collect_task
+            except asyncio.CancelledError:
+                pass
+        
+        self._log("시맨틱 캐시 적중: 수집 결과 재사용")
+        context.sources = [dict(s) for s in snapshot["sources"]]
+        context.raw_context = snapshot["raw_context"]
+        context.retrieval_backend = snapshot["retrieval_backend"]
+    
+    async def _dedupe_sources(self, context: AgentContext) -> None:
+        """
+        의미가 거의 같은 발췌(GraphRAG/Yahoo/Tavily 간 중복)를 제거하여 후속 LLM 토큰 절감
+        
+        발췌를 한 번의 호출로 임베딩한 뒤, 신뢰도 높은 소스부터 남기고
+        이미 남긴 같은 서브태스크 소스와 코사인 유사도 ≥ SOURCE_DEDUP_THRESHOLD인 소스는 제외 (원래 순서 유지)
+        질문 임베딩이 아직 없으면 같은 배치에 질문을 포함하여 context.question_embedding에 보관 (재임베딩 방지)
+        제거한 소스의 발췌는 raw_context에서도 삭제
+        
+        Args:
+            context: 공유 컨텍스트
+        """
+        if not SOURCE_DEDUP_ENABLED:
+            return
+        
+        # 발췌가 있는 소스만 비교 대상
+        candidates = [i for i, s in enumerate(context.sources) if s.get("excerpt")]
+        if len(candidates) < 2:
+            return
+        
+        texts = [context.sources[i]["excerpt"][:DEDUP_EXCERPT_CHARS] for i in candidates]
+        embed_question = context.question_embedding is None
+        if embed_question:
+            texts.insert(0, context.question)
+        
+        try:
+            embeddings = await embed_texts(texts)
+        except Exception as e:
+            self._log(f"소스 중복 제거 생략 (임베딩 실패: {e})")
+            return
+        
+        if embed_question:
+            context.question_embedding = embeddings[0]
+            embeddings = embeddings[1:]
+        
+        by_confidence = sorted(
+            zip(candidates, embeddings),
+            key=lambda pair: context.sources[pair[0]].get("confidence", 0.0),
+            reverse=True
+        )
+        # 서브태스크별 커버리지가 줄지 않도록 같은 서브태스크 안에서만 비교
+        kept_embeddings: Dict[Any, List[List[float]]] = {}
+        dropped = set()
+        for index, embedding in by_confidence:
+            kept = kept_embeddings.setdefault(context.sources[index].get("subtask_id"), [])
+            if any(cosine_similarity(embedding, other) >= SOURCE_DEDUP_THRESHOLD for other in kept):
+                dropped.add(index)
+            else:
+                kept.append(embedding)
+        
+        if dropped:
+            context.raw_context = _prune_raw_context(
+                context.raw_context, [context.sources[i] for i in sorted(dropped)]
+            )
+            context.sources = [s for i, s in enumerate(context.sources) if i not in dropped]
+            self._log(f"중복 소스 {len(dropped)}개 제거")
+    
+    @staticmethod
+    def _snapshot_collection(context: AgentContext) -> Dict[str, Any]:
+        """캐시 저장용 수집 결과 사본 (이후 에이전트의 수정이 캐시에 번지지 않도록 복사)"""
+        return {
+            "sources": [dict(s) for s in context.sources],
+            "raw_context": context.raw_context,
+            "retrieval_backend": context.retrieval_backend
+        }
+    
+    async def _collect_general(self, context: AgentContext) -> None:
+        """
+        일반 정보 수집 (기존 방식)
+        
+        Args:
+            context: 공유 컨텍스트
+        """
+        # Yahoo/Tavily는 GraphRAG 결과와 무관하므로 GraphRAG와 동시에 시작
+        # (Tavily는 GraphRAG 소스가 충분하면 취소되는 선조회)
+        yahoo_task = None
+        tavily_task = None
+        if self._mcp_manager:
+            if self._should_use_yahoo(context.question):
+                yahoo_task = asyncio.create_task(self._fetch_yahoo_data(context.question))
+            tavily_task = asyncio.create_task(self._fetch_tavily_search(context.question))
+        
+        try:
+            # 1. GraphRAG 검색
+            sources, raw_context, backend = await self._retrieve_from_graphrag(context.question)
+            
+            context.sources = sources
+            context.raw_context = raw_context
             context.retrieval_backend = backend
             
-            # MCP 도구 활용
-            if self._mcp_manager:
-                if self._should_use_yahoo(task_query):
-                    yahoo_sources = await self._fetch_yahoo_data(task_query)
-                    for s in yahoo_sources:
-                        s["subtask_id"] = subtask["id"]
+            # GraphRAG만으로 충분하면 Tavily 선조회 취소
+            if (
+                tavily_task is not None
+                and not context.enable_web_search
+                and _has_sufficient_coverage(sources, context.coverage_threshold)
+            ):
+                tavily_task.cancel()
+                tavily_task = None
+            
+            # 2. Yahoo Finance 보강
+            if yahoo_task is not None:
+                self._log("Yahoo Finance로 실시간 데이터 보강")
+                yahoo_sources = await yahoo_task
+                if yahoo_sources:
                     context.sources.extend(yahoo_sources)
-                
-                if context.enable_web_search or len(sources) < 2:
-                    tavily_sources = await self._fetch_tavily_search(task_query)
-                    for s in tavily_sources:
-                        s["subtask_id"] = subtask["id"]
+                    context.retrieval_backend += "+yahoo"
+            
+            # 3. Tavily Search 보강
+            if tavily_task is not None:
+                self._log("Tavily Search로 최신 뉴스 보강")
+                tavily_sources = await tavily_task
+                if tavily_sources:
                     context.sources.extend(tavily_sources)
+                    context.retrieval_backend += "+tavily"
+        finally:
+            # 예외로 빠져나온 경우 남은 선조회 정리
+            for task in (yahoo_task, tavily_task):
+                if task is not None and not task.done():
+                    task.cancel()
     
-    async def _collect_general(self, context: AgentContext) -> None:
+    def _start_conflict_detection(self, context: AgentContext) -> None:
         """
-        일반 정보 수집 (기존 방식)
+        상충 데이터 감지 시작 (백그라운드 실행 → 후속 에이전트와 겹침, context.get_conflicts()로 수령)
         
         Args:
             context: 공유 컨텍스트
         """
-        # 1. GraphRAG 검색
-        sources, raw_context, backend = await self._retrieve_from_graphrag(context.question)
-        
-        context.sources = sources
-        context.raw_context = raw_context
-        context.retrieval_backend = backend
-        
-        # 2. Yahoo Finance 보강
-        if self._mcp_manager and self._should_use_yahoo(context.question):
-            self._log("Yahoo Finance로 실시간 데이터 보강")
-            yahoo_sources = await self._fetch_yahoo_data(context.question)
-            if yahoo_sources:
-                context.sources.extend(yahoo_sources)
-                context.retrieval_backend += "+yahoo"
-        
-        # 3. Tavily Search 보강
-        if self._mcp_manager and (context.enable_web_search or len(sources) < 3):
-            self._log("Tavily Search로 최신 뉴스 보강")
-            tavily_sources = await self._fetch_tavily_search(context.question)
-            if tavily_sources:
-                context.sources.extend(tavily_sources)
-                context.retrieval_backend += "+tavily"
-        
-        # 4. 상충 데이터 감지
-        if len(context.sources) >= 2:
-            conflicts = await self._detect_conflicts(context.sources, context.question)
-            context.conflicts = conflicts
+        if not context.detect_conflicts or len(context.sources) < 2:
+            return
+        
+        # 같은 지표에 다른 수치를 제시한 소스 쌍이 없으면 LLM 호출 생략
+        if not _has_candidate_numeric_conflict(context.sources[:CONFLICT_MAX_SOURCES]):
+            self._log("수치 상충 후보 없음, 상충 감지 생략")
+            return
+        
+        context.conflicts_task = asyncio.create_task(
+            self._detect_conflicts(list(context.sources), context.question)
+        )
     
     async def _save_to_neo4j(self, context: AgentContext) -> None:
         """
@@ -181,62 +543,55 @@ class KBCollectorAgent(BaseAgent):
             context: 공유 컨텍스트
         """
         try:
-            import uuid
-            import json
-            
-            session_id = str(uuid.uuid4())[:8]
+            session_id = secrets.token_hex(4)
+            collected_at = time.time()
+            rows = []
             
             # 서브태스크별로 저장
             if context.subtasks:
+                # 소스를 서브태스크별로 한 번에 분류 (서브태스크마다 전체 소스 재탐색 없음)
+                sources_by_subtask: Dict[Any, List[Dict]] = {}
+                for s in context.sources:
+                    sources_by_subtask.setdefault(s.get("subtask_id"), []).append(s)
+                
                 for subtask in context.subtasks:
                     subtask_id = subtask["id"]
-                    key = f"agentic:{session_id}:{subtask_id}"
-                    
-                    # 해당 서브태스크의 소스만 필터링
-                    subtask_sources = [
-                        s for s in context.sources 
-                        if s.get("subtask_id") == subtask_id
-                    ]
-                    
                     data = {
                         "subtask": subtask,
-                        "sources": subtask_sources,
-                        "collected_at": time.time()
+                        "sources": sources_by_subtask.get(subtask_id, []),
+                        "collected_at": collected_at
                     }
-                    
-                    # Neo4j에 저장 (간단히 노드로 저장)
-                    self._neo4j_db.create_node(
-                        node_id=key,
-                        node_data={
+                    rows.append({
+                        "id": f"agentic:{session_id}:{subtask_id}",
+                        "props": {
                             "type": "AgenticData",
                             "session_id": session_id,
                             "subtask_id": subtask_id,
-                            "data": json.dumps(data)
+                            "data": _json_dumps(data)
                         }
-                    )
-                    
-                    context.neo4j_keys.append(key)
-                    self._log(f"Neo4j 저장: {key}")
+                    })
             else:
                 # 일반 저장
-                key = f"agentic:{session_id}:general"
                 data = {
                     "question": context.question,
                     "sources": context.sources,
-                    "collected_at": time.time()
+                    "collected_at": collected_at
                 }
-                
-                self._neo4j_db.create_node(
-                    node_id=key,
-                    node_data={
+                rows.append({
+                    "id": f"agentic:{session_id}:general",
+                    "props": {
                         "type": "AgenticData",
                         "session_id": session_id,
-                        "data": json.dumps(data)
+                        "data": _json_dumps(data)
                     }
-                )
-                
-                context.neo4j_keys.append(key)
-                self._log(f"Neo4j 저장: {key}")
+                })
+            
+            # 모든 노드를 UNWIND 쿼리 1회로 저장 (동기 드라이버는 공유 I/O 스레드 풀에서 실행)
+            await self._run_blocking(self._neo4j_db.create_nodes_batch, rows)
+            
+            for row in rows:
+                context.neo4j_keys.append(row["id"])
+                self._log(f"Neo4j 저장: {row['id']}")
                 
         except Exception as e:
             self._log(f"Neo4j 저장 실패: {e}")
@@ -259,20 +614,22 @@ class KBCollectorAgent(BaseAgent):
         
         try:
             # return_context=True로 호출하여 sources 받기
-            result = await self._engine.aquery(
-                question=question,
-                mode="api",  # 메모리 효율을 위해 API 모드
-                return_context=True,
-                top_k=30
+            result = await asyncio.wait_for(
+                self._engine.aquery(
+                    question=question,
+                    mode="api",  # 메모리 효율을 위해 API 모드
+                    return_context=True,
+                    top_k=30
+                ),
+                timeout=self.TIMEOUTS["graphrag"]
             )
             
             if isinstance(result, dict):
                 sources = result.get("sources", [])
-                # raw_context는 sources의 excerpt를 결합
-                raw_context = "\n\n".join([
-                    f"[{s.get('id', i+1)}] {s.get('file', 'Unknown')}: {s.get('excerpt', '')}"
-                    for i, s in enumerate(sources)
-                ])
+                # raw_context는 sources의 excerpt를 결합 (소스당 RAW_CONTEXT_EXCERPT_CHARS자까지)
+                raw_context = "\n\n".join(
+                    _raw_context_entry(s, i + 1) for i, s in enumerate(sources)
+                )
                 backend = result.get("retrieval_backend", "graphrag")
                 return sources, raw_context, backend
             else:
@@ -291,10 +648,15 @@ class KBCollectorAgent(BaseAgent):
             웹 소스 리스트
         """
         try:
-            from search import web_search
-            from config import WEB_SEARCH_MAX_RESULTS
-            
-            results = await web_search(question, max_results=WEB_SEARCH_MAX_RESULTS or 5)
+            # 검색 함수 로드 (lazy, 최초 1회)
+            if self._web_search is None:
+                from search import web_search
+                self._web_search = web_search
+            
+            results = await asyncio.wait_for(
+                self._web_search(question, max_results=WEB_SEARCH_MAX_RESULTS or 5),
+                timeout=self.TIMEOUTS["web"]
+            )
             
             web_sources = []
             for i, result in enumerate(results):
@@ -325,11 +687,16 @@ class KBCollectorAgent(BaseAgent):
             상충 정보 리스트
         """
         try:
-            # 소스 요약 생성
-            sources_summary = "\n".join([
-                f"Source {s.get('id', i+1)}: {s.get('excerpt', '')[:200]}"
-                for i, s in enumerate(sources[:5])  # 최대 5개만 비교
-            ])
+            # 소스 요약 생성 (최대 5개만 비교)
+            # id 순으로 정렬하여 수집 순서가 달라도 프롬프트가 같게 → LLM 응답 캐시 키가 안정적으로 적중
+            compared = sorted(
+                ((s.get('id', i+1), s) for i, s in enumerate(sources[:CONFLICT_MAX_SOURCES])),
+                key=lambda pair: _natural_sort_key(pair[0])
+            )
+            sources_summary = "\n".join(
+                f"Source {source_id}: {(s.get('excerpt') or '')[:CONFLICT_EXCERPT_CHARS]}"
+                for source_id, s in compared
+            )
             
             prompt = f"""질문: {question}
 
@@ -344,11 +711,14 @@ class KBCollectorAgent(BaseAgent):
 {{"conflicts": []}}
 """
             
-            response = await self._call_llm(prompt, temperature=0.0, max_tokens=500)
+            response = await asyncio.wait_for(
+                self._call_llm(prompt, temperature=0.0, max_tokens=500),
+                timeout=self.TIMEOUTS["conflicts"]
+            )
             
             # JSON 파싱
             try:
-                result = json.loads(response)
+                result = json_loads(response)
                 return result.get("conflicts", [])
             except json.JSONDecodeError:
                 self._log("상충 감지 응답 파싱 실패")
@@ -368,43 +738,7 @@ class KBCollectorAgent(BaseAgent):
         Returns:
             Yahoo Finance 사용 여부
         """
-        # 주가, 시가총액, 재무제표 등 실시간 데이터 키워드
-        keywords = [
-            "주가", "stock price", "현재가", "시가총액", "market cap",
-            "재무제표", "financial", "매출", "revenue", "이익", "profit",
-            "eps", "pe ratio", "배당", "dividend"
-        ]
-        question_lower = question.lower()
-        return any(keyword in question_lower for keyword in keywords)
-    
-    async def _extract_ticker(self, question: str) -> Optional[str]:
-        """
-        질문에서 주식 티커 추출 (LLM 활용)
-        
-        Args:
-            question: 사용자 질문
-            
-        Returns:
-            티커 심볼 또는 None
-        """
-        try:
-            prompt = f"""다음 질문에서 주식 티커 심볼을 추출하세요:
-
-질문: {question}
-
-티커 심볼만 반환하세요 (예: NVDA, AAPL, TSLA).
-티커를 찾을 수 없으면 "NONE"을 반환하세요.
-"""
-            response = await self._call_llm(prompt, temperature=0.0, max_tokens=50)
-            ticker = response.strip().upper()
-            
-            if ticker and ticker != "NONE" and len(ticker) <= 5:
-                return ticker
-            return None
-            
-        except Exception as e:
-            self._log(f"티커 추출 실패: {e}")
-            return None
+        return self._YAHOO_RE.search(question) is not None
     
     async def _fetch_yahoo_data(self, question: str) -> List[Dict]:
         """
@@ -422,8 +756,8 @@ class KBCollectorAgent(BaseAgent):
                 from mcp.tools import YahooFinanceTool
                 self._yahoo_tool = YahooFinanceTool(self._mcp_manager)
             
-            # 티커 추출
-            ticker = await self._extract_ticker(question)
+            # 티커 추출 (분석 에이전트와 공유하는 티커 캐시)
+            ticker = await resolve_ticker(question, self, timeout=self.TIMEOUTS["ticker"])
             if not ticker:
                 self._log("티커를 추출할 수 없어 Yahoo Finance 스킵")
                 return []
@@ -431,7 +765,10 @@ class KBCollectorAgent(BaseAgent):
             self._log(f"Yahoo Finance 조회: {ticker}")
             
             # 주가 정보 조회
-            price_data = await self._yahoo_tool.get_stock_price(ticker)
+            price_data = await asyncio.wait_for(
+                self._yahoo_tool.get_stock_price(ticker),
+                timeout=self.TIMEOUTS["yahoo"]
+            )
             
             # 소스 형식으로 변환
             yahoo_sources = []
@@ -475,7 +812,10 @@ class KBCollectorAgent(BaseAgent):
             self._log(f"Tavily Search 조회: {question}")
             
             # 웹 검색 실행
-            search_result = await self._tavily_tool.search(question, max_results=5)
+            search_result = await asyncio.wait_for(
+                self._tavily_tool.search(question, max_results=5),
+                timeout=self.TIMEOUTS["tavily"]
+            )
             
             # 소스 형식으로 변환
             tavily_sources = []
@@ -4,16 +4,61 @@ Planner → Collector → Analyst → Writer 순차 실행
 Feedback Loop: Analyst가 정보 부족 감지 시 Collector로 회귀
 """
 
-import uuid
-from typing import TypedDict, List, Dict, Annotated, Literal
+import atexit
+import gc
+import logging
+import queue
+import secrets
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import TypedDict, List, Dict, Annotated, Literal, AsyncIterator, Optional
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END, add_messages
 
+# 노드 내부에서 스트림 출력/실행 설정 접근 (구버전 langgraph에는 없음 → run_stream은 최종 결과만 전달)
+try:
+    from langgraph.config import get_config, get_stream_writer
+except ImportError:
+    get_config = get_stream_writer = None
+
 from .agent_context import AgentContext, QueryComplexity
-from .planner_agent import PlannerAgent
-from .kb_collector_agent import KBCollectorAgent
-from .analyst_agent import AnalystAgent
-from .writer_agent import WriterAgent
 from .memory_manager import get_memory_manager
+from .agent_pool import get_agent
+from .debug_log import log_event
+from .query_classifier import is_simple_lookup
+
+
+def _setup_logger() -> logging.Logger:
+    """
+    워크플로우 진행 로그 설정
+    
+    노드(이벤트 루프 스레드)는 큐에 레코드를 넣기만 하고, 콘솔 출력은 QueueListener 스레드가 수행
+    애플리케이션이 이미 핸들러를 붙였다면 그 설정을 그대로 사용
+    """
+    workflow_logger = logging.getLogger(__name__)
+    if workflow_logger.handlers:
+        return workflow_logger
+    
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    workflow_logger.addHandler(QueueHandler(log_queue))
+    workflow_logger.setLevel(logging.INFO)
+    workflow_logger.propagate = False
+    return workflow_logger
+
+
+logger = _setup_logger()
+
+# 워크플로우 시작 로그 구분선
+_LOG_RULE = "=" * 60
+
+# gc.freeze() 실행 여부 (최초 워크플로우 생성 시 1회만 - 이후 생성마다 새 객체를 영구 세대로 보내지 않도록)
+_gc_frozen = False
 
 
 class AgenticState(TypedDict):
@@ -44,6 +89,24 @@ class AgenticState(TypedDict):
     neo4j_keys: List[str]
     processing_steps: List[str]
     messages: Annotated[list, add_messages]
+    
+    # 노드 간 공유 컨텍스트 (모든 노드가 같은 인스턴스를 이어서 사용, 위 필드는 라우팅/결과 반환용 사본)
+    context: AgentContext
+
+
+def _workflow_node(method_name: str):
+    """
+    인스턴스 메서드로 위임하는 그래프 노드 생성
+    
+    컴파일된 그래프는 클래스 단위로 공유되므로, 실행할 워크플로우 인스턴스는
+    ainvoke(config={"configurable": {"workflow": self}})로 전달받음
+    """
+    async def node(state: AgenticState, config: RunnableConfig) -> Dict:
+        workflow = config["configurable"]["workflow"]
+        return await getattr(workflow, method_name)(state)
+    
+    node.__name__ = method_name
+    return node
 
 
 class AgenticWorkflow:
@@ -57,6 +120,9 @@ class AgenticWorkflow:
     4. 메모리 최적화
     """
     
+    # 클래스 단위 컴파일된 그래프 (토폴로지가 고정이므로 인스턴스마다 다시 컴파일하지 않음)
+    _compiled_graph = None
+    
     def __init__(self, engine=None, mcp_manager=None, neo4j_db=None):
         """
         Args:
@@ -65,9 +131,7 @@ class AgenticWorkflow:
             neo4j_db: Neo4jDatabase 인스턴스
         """
         # #region agent log
-        import json
-        with open('/Users/gyuteoi/Desktop/graphrag/Finance_GraphRAG/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({"location":"langgraph_workflow.py:56","message":"AgenticWorkflow init entry","data":{"has_engine":engine is not None,"has_mcp":mcp_manager is not None,"has_neo4j":neo4j_db is not None},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","runId":"run1","hypothesisId":"H2,H3"})+'\n')
+        log_event("langgraph_workflow.py:56", "AgenticWorkflow init entry", {"has_engine": engine is not None, "has_mcp": mcp_manager is not None, "has_neo4j": neo4j_db is not None}, hypothesis_id="H2,H3")
         # #endregion
         self.engine = engine
         self.mcp_manager = mcp_manager
@@ -76,38 +140,63 @@ class AgenticWorkflow:
         
         # 에이전트 초기화
         # #region agent log
-        with open('/Users/gyuteoi/Desktop/graphrag/Finance_GraphRAG/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({"location":"langgraph_workflow.py:67","message":"Before agent init","data":{},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","runId":"run1","hypothesisId":"H3"})+'\n')
+        log_event("langgraph_workflow.py:67", "Before agent init", hypothesis_id="H3")
         # #endregion
-        self.planner = PlannerAgent()
-        self.collector = KBCollectorAgent(
+        # 에이전트 모듈은 워크플로우 생성 시점에 로드 (모듈 import만으로 LLM/Neo4j 의존성을 불러오지 않도록)
+        from .planner_agent import PlannerAgent
+        from .kb_collector_agent import KBCollectorAgent
+        from .analyst_agent import AnalystAgent
+        from .writer_agent import WriterAgent
+        
+        # 같은 설정의 워크플로우끼리 에이전트 공유 (요청마다 생성/엔진 지연 로드 반복 방지)
+        self.planner = get_agent(PlannerAgent)
+        self.collector = get_agent(
+            KBCollectorAgent,
             engine=engine, 
             web_search_enabled=True, 
             mcp_manager=mcp_manager,
             neo4j_db=neo4j_db
         )
-        self.analyst = AnalystAgent(
+        self.analyst = get_agent(
+            AnalystAgent,
             mcp_manager=mcp_manager,
             neo4j_db=neo4j_db
         )
-        self.writer = WriterAgent(neo4j_db=neo4j_db)
+        self.writer = get_agent(WriterAgent, neo4j_db=neo4j_db)
         # #region agent log
-        with open('/Users/gyuteoi/Desktop/graphrag/Finance_GraphRAG/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({"location":"langgraph_workflow.py:82","message":"After agent init","data":{},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","runId":"run1","hypothesisId":"H3"})+'\n')
+        log_event("langgraph_workflow.py:82", "After agent init", hypothesis_id="H3")
         # #endregion
         
         # 그래프 구축
         # #region agent log
-        with open('/Users/gyuteoi/Desktop/graphrag/Finance_GraphRAG/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({"location":"langgraph_workflow.py:85","message":"Before graph build","data":{},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","runId":"run1","hypothesisId":"H3"})+'\n')
+        log_event("langgraph_workflow.py:85", "Before graph build", hypothesis_id="H3")
         # #endregion
-        self.graph = self._build_graph()
+        self.graph = self._get_graph()
         # #region agent log
-        with open('/Users/gyuteoi/Desktop/graphrag/Finance_GraphRAG/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({"location":"langgraph_workflow.py:90","message":"After graph build","data":{"graph_ready":self.graph is not None},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","runId":"run1","hypothesisId":"H3"})+'\n')
+        log_event("langgraph_workflow.py:90", "After graph build", {"graph_ready": self.graph is not None}, hypothesis_id="H3")
         # #endregion
+        
+        # 에이전트/클라이언트/컴파일된 그래프 등 장수 객체를 GC 추적 대상에서 제외 (이후 수집 비용 절감)
+        global _gc_frozen
+        if not _gc_frozen:
+            gc.freeze()
+            _gc_frozen = True
+    
+    @classmethod
+    def _get_graph(cls):
+        """
+        클래스 단위로 캐시된 컴파일 그래프 반환 (최초 1회 구축)
+        
+        Returns:
+            컴파일된 StateGraph
+        """
+        # 서브클래스는 자신의 그래프를 따로 가짐 (부모 클래스 캐시를 상속받지 않도록 __dict__ 확인)
+        if cls.__dict__.get("_compiled_graph") is None:
+            cls._compiled_graph = cls._build_graph()
+        return cls._compiled_graph
     
-    def _build_graph(self) -> StateGraph:
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """
         LangGraph 워크플로우 그래프 구축
         
@@ -116,21 +205,27 @@ class AgenticWorkflow:
         """
         workflow = StateGraph(AgenticState)
         
-        # 노드 추가
-        workflow.add_node("planner", self._planner_node)
-        workflow.add_node("collector", self._collector_node)
-        workflow.add_node("analyst", self._analyst_node)
-        workflow.add_node("writer", self._writer_node)
+        # 노드 추가 (실행 시 config로 전달된 인스턴스의 메서드 호출)
+        workflow.add_node("planner", _workflow_node("_planner_node"))
+        workflow.add_node("collector", _workflow_node("_collector_node"))
+        workflow.add_node("analyst", _workflow_node("_analyst_node"))
+        workflow.add_node("writer", _workflow_node("_writer_node"))
         
-        # 엣지 정의
-        workflow.set_entry_point("planner")
+        # 엣지 정의 (SIMPLE 질문은 Planner LLM 호출 없이 Collector부터 시작)
+        workflow.set_conditional_entry_point(
+            cls._should_plan,
+            {
+                "planner": "planner",      # 질문 분해 필요
+                "collector": "collector"   # 단순 조회 → 바로 수집
+            }
+        )
         workflow.add_edge("planner", "collector")
         workflow.add_edge("collector", "analyst")
         
         # Conditional Edge: Analyst → Collector or Writer
         workflow.add_conditional_edges(
             "analyst",
-            self._should_collect_more,
+            cls._should_collect_more,
             {
                 "collector": "collector",  # 정보 부족 → 재수집
                 "writer": "writer"         # 충분 → 리포트 작성
@@ -141,7 +236,7 @@ class AgenticWorkflow:
         
         return workflow.compile()
     
-    async def _planner_node(self, state: AgenticState) -> AgenticState:
+    async def _planner_node(self, state: AgenticState) -> Dict:
         """
         Planner 노드: 질문 분해
         
@@ -149,9 +244,9 @@ class AgenticWorkflow:
             state: 현재 상태
             
         Returns:
-            subtasks가 채워진 상태
+            State 갱신 (subtasks)
         """
-        print("[Planner] 질문 분해 시작...")
+        logger.info("[Planner] 질문 분해 시작...")
         
         # AgentContext 생성
         context = self._state_to_context(state)
@@ -159,17 +254,19 @@ class AgenticWorkflow:
         # Planner 실행
         context = await self.planner.execute(context)
         
-        # State 업데이트
-        state["subtasks"] = context.subtasks
-        state["processing_steps"].extend(context.processing_steps)
-        
         # 메모리 정리
         self.memory_manager.flush_llm_memory("Planner")
         
-        print(f"[Planner] {len(context.subtasks)}개 서브태스크 생성 완료")
-        return state
+        logger.info("[Planner] %d개 서브태스크 생성 완료", len(context.subtasks))
+        
+        # 변경된 필드만 반환 (LangGraph가 해당 채널만 갱신)
+        return {
+            "subtasks": context.subtasks,
+            "processing_steps": context.processing_steps,
+            "context": context
+        }
     
-    async def _collector_node(self, state: AgenticState) -> AgenticState:
+    async def _collector_node(self, state: AgenticState) -> Dict:
         """
         KB Collector 노드: 정보 수집
         
@@ -177,9 +274,9 @@ class AgenticWorkflow:
             state: 현재 상태
             
         Returns:
-            sources가 채워진 상태
+            State 갱신 (sources, neo4j_keys)
         """
-        print(f"[Collector] 정보 수집 시작 (반복 {state['iteration_count']+1}회)...")
+        logger.info("[Collector] 정보 수집 시작 (반복 %d회)...", state["iteration_count"] + 1)
         
         # AgentContext 생성
         context = self._state_to_context(state)
@@ -187,18 +284,20 @@ class AgenticWorkflow:
         # Collector 실행
         context = await self.collector.execute(context)
         
-        # State 업데이트
-        state["sources"] = context.sources
-        state["neo4j_keys"] = context.neo4j_keys
-        state["processing_steps"].extend(context.processing_steps)
-        
         # 메모리 정리
         self.memory_manager.flush_llm_memory("Collector")
         
-        print(f"[Collector] {len(context.sources)}개 소스 수집 완료")
-        return state
+        logger.info("[Collector] %d개 소스 수집 완료", len(context.sources))
+        
+        # 변경된 필드만 반환
+        return {
+            "sources": context.sources,
+            "neo4j_keys": context.neo4j_keys,
+            "processing_steps": context.processing_steps,
+            "context": context
+        }
     
-    async def _analyst_node(self, state: AgenticState) -> AgenticState:
+    async def _analyst_node(self, state: AgenticState) -> Dict:
         """
         Analyst 노드: 데이터 검증 및 충분성 판단
         
@@ -206,9 +305,9 @@ class AgenticWorkflow:
             state: 현재 상태
             
         Returns:
-            validated_data, needs_more_info가 채워진 상태
+            State 갱신 (validated_data, needs_more_info, iteration_count)
         """
-        print("[Analyst] 데이터 검증 시작...")
+        logger.info("[Analyst] 데이터 검증 시작...")
         
         # AgentContext 생성
         context = self._state_to_context(state)
@@ -216,22 +315,28 @@ class AgenticWorkflow:
         # Analyst 실행
         context = await self.analyst.execute(context)
         
-        # State 업데이트
-        state["validated_data"] = context.validated_data
-        state["confidence"] = context.confidence
-        state["needs_more_info"] = context.needs_more_info
-        state["processing_steps"].extend(context.processing_steps)
-        
         # 반복 횟수 증가
-        state["iteration_count"] += 1
+        context.iteration_count = state["iteration_count"] + 1
         
         # 메모리 정리
         self.memory_manager.flush_llm_memory("Analyst")
         
-        print(f"[Analyst] 검증 완료 (신뢰도: {context.confidence:.0%}, 충분성: {not context.needs_more_info})")
-        return state
+        logger.info(
+            "[Analyst] 검증 완료 (신뢰도: %.0f%%, 충분성: %s)",
+            context.confidence * 100, not context.needs_more_info
+        )
+        
+        # 변경된 필드만 반환
+        return {
+            "validated_data": context.validated_data,
+            "confidence": context.confidence,
+            "needs_more_info": context.needs_more_info,
+            "iteration_count": context.iteration_count,
+            "processing_steps": context.processing_steps,
+            "context": context
+        }
     
-    async def _writer_node(self, state: AgenticState) -> AgenticState:
+    async def _writer_node(self, state: AgenticState) -> Dict:
         """
         Writer 노드: 최종 리포트 작성
         
@@ -239,30 +344,64 @@ class AgenticWorkflow:
             state: 현재 상태
             
         Returns:
-            final_report, reasoning_path가 채워진 상태
+            State 갱신 (final_report, reasoning_path)
         """
-        print("[Writer] 리포트 작성 시작...")
+        logger.info("[Writer] 리포트 작성 시작...")
         
         # AgentContext 생성
         context = self._state_to_context(state)
         
-        # Writer 실행
-        context = await self.writer.execute(context)
+        # Writer 실행 (run_stream으로 실행 중이면 리포트 조각을 custom 스트림으로 전달)
+        on_report_chunk = None
+        streamed = []
+        if get_stream_writer is not None and get_config()["configurable"].get("stream_report"):
+            stream_writer = get_stream_writer()
+            
+            def on_report_chunk(chunk: str) -> None:
+                streamed.append(True)
+                stream_writer({"report_chunk": chunk})
+        
+        context = await self.writer.execute(context, on_report_chunk=on_report_chunk)
         
-        # State 업데이트
-        state["final_report"] = context.final_report
-        state["recommendation"] = context.recommendation or "HOLD"
-        state["reasoning_path"] = context.reasoning_path
-        state["confidence"] = context.confidence
-        state["processing_steps"].extend(context.processing_steps)
+        # 캐시 적중/폴백 등으로 조각이 전달되지 않았으면 완성된 리포트를 한 번에 전달
+        if on_report_chunk is not None and not streamed and context.final_report:
+            stream_writer({"report_chunk": context.final_report})
+        
+        recommendation = context.recommendation or "HOLD"
         
         # 메모리 정리
         self.memory_manager.flush_llm_memory("Writer")
         
-        print(f"[Writer] 리포트 작성 완료 (추천: {state['recommendation']})")
-        return state
+        logger.info("[Writer] 리포트 작성 완료 (추천: %s)", recommendation)
+        
+        # 변경된 필드만 반환
+        return {
+            "final_report": context.final_report,
+            "recommendation": recommendation,
+            "reasoning_path": context.reasoning_path,
+            "confidence": context.confidence,
+            "processing_steps": context.processing_steps,
+            "context": context
+        }
+    
+    @staticmethod
+    def _should_plan(state: AgenticState) -> Literal["planner", "collector"]:
+        """
+        Conditional Entry: 질문 분해 필요 여부 판단
+        
+        Args:
+            state: 초기 상태
+            
+        Returns:
+            "planner" (분해) or "collector" (SIMPLE → 단일 서브태스크로 바로 수집)
+        """
+        if state["context"].complexity == QueryComplexity.SIMPLE:
+            logger.info("[Router] 단순 질문 → Planner 생략, Collector 실행")
+            return "collector"
+        return "planner"
     
-    def _should_collect_more(self, state: AgenticState) -> Literal["collector", "writer"]:
+    @staticmethod
+    def _should_collect_more(state: AgenticState) -> Literal["collector", "writer"]:
         """
         Conditional Edge: 정보 재수집 여부 판단
         
@@ -274,20 +413,23 @@ class AgenticWorkflow:
         """
         # 최대 반복 횟수 체크
         if state["iteration_count"] >= state["max_iterations"]:
-            print(f"[Router] 최대 반복 횟수 도달 ({state['max_iterations']}회) → Writer")
+            logger.info("[Router] 최대 반복 횟수 도달 (%d회) → Writer", state["max_iterations"])
             return "writer"
         
         # 정보 부족 여부
         if state["needs_more_info"]:
-            print(f"[Router] 정보 부족 감지 → Collector 재실행")
+            logger.info("[Router] 정보 부족 감지 → Collector 재실행")
             return "collector"
         
-        print(f"[Router] 정보 충분 → Writer")
+        logger.info("[Router] 정보 충분 → Writer")
         return "writer"
     
     def _state_to_context(self, state: AgenticState) -> AgentContext:
         """
-        LangGraph State를 AgentContext로 변환
+        LangGraph State의 공유 AgentContext 반환
+        
+        run()이 만든 컨텍스트를 모든 노드가 그대로 이어서 사용하므로 노드마다 다시 만들지 않음
+        (raw_context, 백그라운드 상충 감지 등 State에 없는 필드도 다음 노드로 전달됨)
         
         Args:
             state: LangGraph 상태
@@ -295,6 +437,11 @@ class AgenticWorkflow:
         Returns:
             AgentContext 인스턴스
         """
+        context = state.get("context")
+        if context is not None:
+            return context
+        
+        # 컨텍스트 없이 시작된 State: 기존 필드로 한 번만 구성하여 State에 보관
         context = AgentContext(
             question=state["question"],
             complexity=QueryComplexity.MODERATE,
@@ -314,24 +461,44 @@ class AgenticWorkflow:
         
         context.processing_steps = state.get("processing_steps", [])
         
+        state["context"] = context
         return context
     
-    async def run(self, question: str, max_iterations: int = 3) -> Dict:
+    @staticmethod
+    def _initial_state(
+        question: str,
+        max_iterations: int,
+        complexity: Optional[QueryComplexity] = None
+    ) -> AgenticState:
         """
-        워크플로우 실행
+        워크플로우 초기 상태 생성
         
         Args:
             question: 사용자 질문
             max_iterations: 최대 Feedback Loop 반복 횟수
+            complexity: 호출 측 복잡도 힌트 (None이면 단순 조회 여부만 규칙으로 판별, 나머지는 MODERATE)
             
         Returns:
-            최종 결과 딕셔너리
+            초기 AgenticState
         """
-        # 초기 상태 생성
-        initial_state: AgenticState = {
+        if complexity is None:
+            complexity = QueryComplexity.SIMPLE if is_simple_lookup(question) else QueryComplexity.MODERATE
+        
+        # SIMPLE은 Planner를 거치지 않으므로 질문 자체를 단일 서브태스크로 사용
+        subtasks = []
+        if complexity == QueryComplexity.SIMPLE:
+            subtasks = [{
+                "id": 1,
+                "task": question,
+                "target": "general",
+                "priority": 1,
+                "reasoning": "단순 조회 (질문 분해 생략)"
+            }]
+        
+        return {
             "question": question,
-            "session_id": str(uuid.uuid4())[:8],
-            "subtasks": [],
+            "session_id": secrets.token_hex(4),
+            "subtasks": subtasks,
             "iteration_count": 0,
             "needs_more_info": False,
             "max_iterations": max_iterations,
@@ -343,18 +510,18 @@ class AgenticWorkflow:
             "recommendation": "HOLD",
             "neo4j_keys": [],
             "processing_steps": [],
-            "messages": []
+            "messages": [],
+            "context": AgentContext(
+                question=question,
+                complexity=complexity,
+                subtasks=list(subtasks),
+                enable_web_search=True
+            )
         }
-        
-        print(f"\n{'='*60}")
-        print(f"Agentic Workflow 시작: {question}")
-        print(f"Session ID: {initial_state['session_id']}")
-        print(f"{'='*60}\n")
-        
-        # 그래프 실행
-        final_state = await self.graph.ainvoke(initial_state)
-        
-        # 결과 반환
+    
+    @staticmethod
+    def _build_result(final_state: AgenticState) -> Dict:
+        """최종 상태 → 결과 딕셔너리"""
         return {
             "answer": final_state["final_report"],
             "sources": final_state["sources"],
@@ -366,3 +533,74 @@ class AgenticWorkflow:
             "processing_steps": final_state["processing_steps"],
             "mode": "AGENTIC_WORKFLOW"
         }
+    
+    def _log_start(self, initial_state: AgenticState) -> None:
+        """워크플로우 시작 로그"""
+        logger.info(
+            "\n%s\nAgentic Workflow 시작: %s\nSession ID: %s\n%s\n",
+            _LOG_RULE, initial_state["question"], initial_state["session_id"], _LOG_RULE
+        )
+    
+    async def run(
+        self,
+        question: str,
+        max_iterations: int = 3,
+        complexity: Optional[QueryComplexity] = None
+    ) -> Dict:
+        """
+        워크플로우 실행
+        
+        Args:
+            question: 사용자 질문
+            max_iterations: 최대 Feedback Loop 반복 횟수
+            complexity: 복잡도 힌트 (SIMPLE이면 Planner 생략)
+            
+        Returns:
+            최종 결과 딕셔너리
+        """
+        initial_state = self._initial_state(question, max_iterations, complexity)
+        self._log_start(initial_state)
+        
+        # 그래프 실행
+        final_state = await self.graph.ainvoke(
+            initial_state,
+            config={"configurable": {"workflow": self}}
+        )
+        
+        return self._build_result(final_state)
+    
+    async def run_stream(
+        self,
+        question: str,
+        max_iterations: int = 3,
+        complexity: Optional[QueryComplexity] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        워크플로우 스트리밍 실행 (Writer 리포트를 생성되는 대로 전달)
+        
+        Args:
+            question: 사용자 질문
+            max_iterations: 최대 Feedback Loop 반복 횟수
+            complexity: 복잡도 힌트 (SIMPLE이면 Planner 생략)
+            
+        Yields:
+            {"type": "report_chunk", "text": 리포트 조각} (0회 이상)
+            {"type": "result", ...run()과 같은 결과 필드} (마지막 1회)
+        """
+        initial_state = self._initial_state(question, max_iterations, complexity)
+        self._log_start(initial_state)
+        
+        final_state = initial_state
+        async for mode, payload in self.graph.astream(
+            initial_state,
+            config={"configurable": {"workflow": self, "stream_report": True}},
+            stream_mode=["custom", "values"]
+        ):
+            if mode == "custom":
+                yield {"type": "report_chunk", "text": payload["report_chunk"]}
+            else:
+                final_state = payload
+        
+        yield {"type": "result", **self._build_result(final_state)}
+
+
@@ -0,0 +1,99 @@
+"""
+LLM 응답 파일 캐시
+동일한 프롬프트(시스템 프롬프트 + 사용자 프롬프트 + 파라미터)의 재호출을 디스크에서 응답
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+
+from config import LLM_CACHE_DIR, LLM_CACHE_ENABLED
+
+
+class FileCache:
+    """
+    키(해시)별 JSON 파일로 저장하는 TTL 캐시
+    
+    저장 형식: <cache_dir>/<key>.json → {"expires_at": epoch초, "content": "..."}
+    get/set은 동기 파일 I/O이므로 비동기 코드에서는 스레드 풀에서 호출 (BaseAgent._run_blocking)
+    """
+    
+    def __init__(self, cache_dir: str = LLM_CACHE_DIR):
+        """
+        Args:
+            cache_dir: 캐시 파일 디렉토리
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """캐시 키 생성 (각 구성요소를 구분자로 이어 MD5)"""
+        return hashlib.md5("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회
+        
+        Returns:
+            저장된 응답 또는 None (없음/만료/손상)
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if entry.get("expires_at", 0) < time.time():
+            # 만료 항목은 삭제 (같은 키가 다시 저장되지 않으면 캐시 디렉토리에 계속 쌓이므로)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry.get("content")
+    
+    def set(self, key: str, content: str, ttl: float) -> None:
+        """
+        캐시 저장 (임시 파일에 쓴 뒤 교체하여 동시 쓰기에도 손상 없음)
+        
+        Args:
+            key: 캐시 키
+            content: 저장할 응답
+            ttl: 유효 기간 (초)
+        """
+        entry = {"expires_at": time.time() + ttl, "content": content}
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # 캐시 저장 실패는 무시 (응답 자체는 이미 확보)
+            pass
+
+
+# 전역 싱글톤 인스턴스
+_llm_cache: Optional[FileCache] = None
+
+
+def get_llm_cache() -> Optional[FileCache]:
+    """
+    전역 LLM 캐시 인스턴스 반환
+    
+    Returns:
+        FileCache 싱글톤 (LLM_CACHE_ENABLED=false면 None)
+    """
+    global _llm_cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        _llm_cache = FileCache()
+    return _llm_cache
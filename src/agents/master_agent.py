@@ -3,13 +3,28 @@
 워커 에이전트들을 오케스트레이션하는 지휘관
 """
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from .base_agent import BaseAgent
 from .agent_context import AgentContext, QueryComplexity
-from .kb_collector_agent import KBCollectorAgent
-from .analyst_agent import AnalystAgent
-from .writer_agent import WriterAgent
+from .agent_pool import get_agent
+from .query_classifier import is_simple_lookup
+
+if TYPE_CHECKING:
+    from .kb_collector_agent import KBCollectorAgent
+    from .analyst_agent import AnalystAgent
+    from .writer_agent import WriterAgent
+
+
+# 복잡도 분류 응답 지연 시 헤지 요청 시작 기준 (초) - 출력이 20토큰 남짓이라 짧게
+COMPLEXITY_REQUEST_TIMEOUT = 3.0
+
+# 복잡도 응답 문자열 키워드 → enum (앞에서부터 부분 문자열 매칭, 일치 없으면 SIMPLE)
+_COMPLEXITY_MAP = {
+    "complex": QueryComplexity.COMPLEX,
+    "moderate": QueryComplexity.MODERATE,
+    "simple": QueryComplexity.SIMPLE,
+}
 
 
 class MasterAgent(BaseAgent):
@@ -58,9 +73,9 @@ JSON 형식으로 응답:
         self._mcp_manager = mcp_manager
         
         # 워커 에이전트들 (Lazy initialization)
-        self._kb_collector: Optional[KBCollectorAgent] = None
-        self._analyst: Optional[AnalystAgent] = None
-        self._writer: Optional[WriterAgent] = None
+        self._kb_collector: Optional["KBCollectorAgent"] = None
+        self._analyst: Optional["AnalystAgent"] = None
+        self._writer: Optional["WriterAgent"] = None
     
     async def execute(self, context: AgentContext) -> AgentContext:
         """
@@ -76,8 +91,10 @@ JSON 형식으로 응답:
         context.add_step(f"{self.name}: 오케스트레이션 시작")
         
         try:
-            # 1. 복잡도 분석 (이미 설정되어 있지 않은 경우)
-            if context.complexity == QueryComplexity.SIMPLE:
+            # 1. 복잡도 분석 (이미 설정되어 있지 않은 경우, 단일 지표 조회는 LLM 분석 생략)
+            if context.complexity == QueryComplexity.SIMPLE and is_simple_lookup(context.question):
+                self._log("단순 조회 질문 → 복잡도 분석 생략 (simple)")
+            elif context.complexity == QueryComplexity.SIMPLE:
                 complexity = await self._analyze_complexity(context.question)
                 context.complexity = complexity
                 self._log(f"복잡도 분석 결과: {complexity.value}")
@@ -117,20 +134,23 @@ JSON 형식으로 응답:
 {{"complexity": "simple/moderate/complex", "reasoning": "판단 근거"}}
 """
             
-            response = await self._call_llm(prompt, temperature=0.0, max_tokens=200)
+            response = await self._call_llm_hedged(
+                prompt,
+                hedge_after=COMPLEXITY_REQUEST_TIMEOUT,
+                temperature=0.0,
+                max_tokens=200,
+                response_format={"type": "json_object"}
+            )
             
             # JSON 파싱
             import json
             try:
                 result = json.loads(response)
                 complexity_str = result.get("complexity", "simple").lower()
-                
-                if "complex" in complexity_str:
-                    return QueryComplexity.COMPLEX
-                elif "moderate" in complexity_str:
-                    return QueryComplexity.MODERATE
-                else:
-                    return QueryComplexity.SIMPLE
+                return next(
+                    (value for key, value in _COMPLEXITY_MAP.items() if key in complexity_str),
+                    QueryComplexity.SIMPLE
+                )
                     
             except json.JSONDecodeError:
                 self._log("복잡도 분석 응답 파싱 실패, SIMPLE로 기본 설정")
@@ -141,19 +161,23 @@ JSON 형식으로 응답:
             return QueryComplexity.SIMPLE
     
     def _initialize_workers(self, web_search_enabled: bool) -> None:
-        """워커 에이전트 초기화 (Lazy)"""
+        """워커 에이전트 초기화 (Lazy, 모듈 import도 첫 실행 시점으로 지연, 같은 설정이면 풀의 인스턴스 공유)"""
         if self._kb_collector is None:
-            self._kb_collector = KBCollectorAgent(
+            from .kb_collector_agent import KBCollectorAgent
+            self._kb_collector = get_agent(
+                KBCollectorAgent,
                 engine=self._engine,
                 web_search_enabled=web_search_enabled,
                 mcp_manager=self._mcp_manager
             )
         
         if self._analyst is None:
-            self._analyst = AnalystAgent(mcp_manager=self._mcp_manager)
+            from .analyst_agent import AnalystAgent
+            self._analyst = get_agent(AnalystAgent, mcp_manager=self._mcp_manager)
         
         if self._writer is None:
-            self._writer = WriterAgent()
+            from .writer_agent import WriterAgent
+            self._writer = get_agent(WriterAgent)
     
     async def _execute_pipeline(self, context: AgentContext) -> AgentContext:
         """
@@ -197,4 +221,7 @@ JSON 형식으로 응답:
                 # raw_context를 그대로 사용
                 context.final_report = context.raw_context or "정보를 찾을 수 없습니다."
         
+        # 4. 백그라운드 상충 감지 결과 수령 (Analyst/Writer 실행과 겹쳐 진행됨)
+        await context.get_conflicts()
+        
         return context
@@ -5,11 +5,19 @@ Handles LLM context cleanup and memory monitoring
 
 import gc
 import logging
-from typing import Dict
+import time
+from typing import Dict, Optional
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# get_memory_usage() 결과 재사용 기간 (초) - 이보다 짧은 간격의 사용률 변화는 의미 없음
+MEMORY_USAGE_CACHE_SECONDS = 0.25
+
+# 세대별 GC 임계값 (0세대 기본 700 → 50,000): 에이전트 호출마다 생기는 단명 객체로
+# 0세대 수집이 과도하게 반복되지 않도록 상향 (전체 정리는 임계값 초과 시에만 명시적으로 수행)
+GC_THRESHOLDS = (50_000, 20, 20)
+
 
 class MemoryManager:
     """
@@ -28,11 +36,17 @@ class MemoryManager:
         """
         self.threshold_percent = threshold_percent
         self.cleanup_count = 0
+        # (조회 시각, 사용량) - psutil 조회 캐시
+        self._cached: tuple = (float("-inf"), None)
+        gc.set_threshold(*GC_THRESHOLDS)
     
     def flush_llm_memory(self, agent_name: str) -> Dict[str, float]:
         """
         LLM 컨텍스트 정리 및 가비지 컬렉션
         
+        gc.collect()는 추적 중인 모든 컨테이너를 순회하므로 (Neo4j 드라이버, RAG 캐시 등 대형 객체 그래프에서 수십 ms)
+        메모리 사용률이 임계값을 넘은 경우에만 젊은 세대(0-1세대)를 수집
+        
         Args:
             agent_name: 현재 에이전트 이름
             
@@ -42,11 +56,18 @@ class MemoryManager:
         # 정리 전 메모리 상태
         before = self.get_memory_usage()
         
-        # 가비지 컬렉션 실행
-        gc.collect()
+        if not self.check_memory_threshold(before):
+            return {
+                "before_percent": before["percent"],
+                "after_percent": before["percent"],
+                "freed_mb": 0.0
+            }
+        
+        # 가비지 컬렉션 실행 (젊은 세대만, 전체 수집은 force_cleanup)
+        gc.collect(1)
         
         # 정리 후 메모리 상태
-        after = self.get_memory_usage()
+        after = self.get_memory_usage(force=True)
         
         self.cleanup_count += 1
         
@@ -64,9 +85,12 @@ class MemoryManager:
             "freed_mb": freed_mb
         }
     
-    def get_memory_usage(self) -> Dict[str, float]:
+    def get_memory_usage(self, force: bool = False) -> Dict[str, float]:
         """
-        현재 메모리 사용량 조회
+        현재 메모리 사용량 조회 (MEMORY_USAGE_CACHE_SECONDS 이내 재조회는 캐시 반환)
+        
+        Args:
+            force: True면 캐시를 무시하고 새로 조회
         
         Returns:
             {
@@ -76,22 +100,33 @@ class MemoryManager:
                 "percent": 사용률 (%)
             }
         """
+        now = time.monotonic()
+        cached_at, cached = self._cached
+        if not force and cached is not None and now - cached_at < MEMORY_USAGE_CACHE_SECONDS:
+            return dict(cached)
+        
         mem = psutil.virtual_memory()
-        return {
+        usage = {
             "total_gb": mem.total / (1024 ** 3),
             "used_gb": mem.used / (1024 ** 3),
             "available_gb": mem.available / (1024 ** 3),
             "percent": mem.percent
         }
+        self._cached = (now, usage)
+        return dict(usage)
     
-    def check_memory_threshold(self) -> bool:
+    def check_memory_threshold(self, usage: Optional[Dict[str, float]] = None) -> bool:
         """
         메모리 임계값 체크
         
+        Args:
+            usage: 이미 조회한 사용량 (None이면 get_memory_usage()로 조회)
+        
         Returns:
             True if 임계값 초과, False otherwise
         """
-        usage = self.get_memory_usage()
+        if usage is None:
+            usage = self.get_memory_usage()
         
         if usage["percent"] > self.threshold_percent:
             logger.warning(
@@ -109,9 +144,9 @@ class MemoryManager:
         """
         logger.warning("[MemoryManager] Forcing aggressive memory cleanup...")
         
-        # 여러 번 가비지 컬렉션 실행
+        # 여러 번 전체 세대 가비지 컬렉션 실행
         for _ in range(3):
-            gc.collect()
+            gc.collect(2)
         
         usage = self.get_memory_usage()
         logger.info(f"[MemoryManager] Force cleanup complete. Usage: {usage['percent']:.1f}%")
@@ -134,8 +169,9 @@ class MemoryManager:
         }
 
 
-# 전역 싱글톤 인스턴스
-_memory_manager: MemoryManager = None
+# 전역 싱글톤 인스턴스 (최초 get_memory_manager() 호출 시 생성 - 생성 시 프로세스 전역 GC 임계값을
+# 바꾸므로 import만으로는 생성하지 않음)
+_memory_manager: Optional[MemoryManager] = None
 
 
 def get_memory_manager() -> MemoryManager:
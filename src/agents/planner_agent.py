@@ -2,10 +2,26 @@
 Planner Agent - 질문 분해 및 서브태스크 생성
 """
 
+import asyncio
 import json
+import re
 from typing import List, Dict
 from .base_agent import BaseAgent
-from .agent_context import AgentContext
+from .agent_context import AgentContext, QueryComplexity
+from .semantic_cache import get_semantic_cache
+from config import PLANNER_CACHE_TTL_SECONDS
+
+# orjson이 있으면 빠른 C 파서 사용 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# 분해 응답 지연 시 헤지 요청 시작 기준 (초)
+PLANNER_REQUEST_TIMEOUT = 15.0
+
+# 응답에서 JSON 객체 추출: 코드 블록(```json ... ```) 안의 객체, 없으면 첫 '{'부터 마지막 '}'까지
+_JSON_OBJECT_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.S)
 
 
 class PlannerAgent(BaseAgent):
@@ -13,9 +29,10 @@ class PlannerAgent(BaseAgent):
     플래너 에이전트
     
     역할:
-    1. 복잡한 질문을 최소 3단계 서브태스크로 분해
-    2. 각 서브태스크의 target 카테고리 지정
-    3. 정보 수집 우선순위 설정
+    1. 질문 복잡도 판단 (분해와 같은 LLM 호출에서 함께 수행)
+    2. 복잡한 질문을 최소 3단계 서브태스크로 분해
+    3. 각 서브태스크의 target 카테고리 지정
+    4. 정보 수집 우선순위 설정
     
     예시:
     질문: "트럼프 당선이 강남 부동산에 미치는 영향은?"
@@ -37,6 +54,11 @@ class PlannerAgent(BaseAgent):
 3. **검증 가능성**: 각 태스크는 데이터로 검증 가능해야 함
 4. **최소 3개, 최대 5개**: 너무 적으면 피상적, 너무 많으면 메모리 부족
 
+**복잡도 판단 및 서브태스크 개수**:
+- simple: 단순 팩트 검색 (예: "NVIDIA 매출은?") → 3개
+- moderate: 수치 분석 필요 (예: "NVIDIA YoY 성장률은?") → 3-4개
+- complex: 투자 조언 등 종합 분석 (예: "NVIDIA 주식 살까요?") → 4-5개
+
 **Target 카테고리**:
 - policy: 정책, 법률, 규제
 - economy: 경제지표, 금리, 환율
@@ -48,6 +70,7 @@ class PlannerAgent(BaseAgent):
 
 **출력 형식 (JSON)**:
 {
+  "complexity": "simple/moderate/complex",
   "subtasks": [
     {
       "id": 1,
@@ -62,12 +85,43 @@ class PlannerAgent(BaseAgent):
 }
 
 **중요**: 반드시 유효한 JSON 형식으로만 응답하세요. 추가 설명은 넣지 마세요."""
+    
+    # 사용자 프롬프트 골격 (호출마다 str.format으로 질문만 채움)
+    PROMPT_TEMPLATE = """**사용자 질문**: {question}
+
+위 질문의 복잡도를 판단하고, 복잡도에 맞는 개수의 서브태스크로 분해하세요. JSON 형식으로만 응답하세요."""
+    
+    # LLM 실패 시 기본 서브태스크 템플릿 ({q}에 질문 삽입, 사용 시 복사본 반환)
+    FALLBACK_SUBTASKS = (
+        {
+            "id": 1,
+            "task": "'{q}'와 관련된 최근 이벤트 및 정책 조사",
+            "target": "policy",
+            "priority": 1,
+            "reasoning": "배경 컨텍스트 파악"
+        },
+        {
+            "id": 2,
+            "task": "'{q}'의 핵심 경제 지표 및 데이터 수집",
+            "target": "economy",
+            "priority": 2,
+            "reasoning": "정량적 근거 확보"
+        },
+        {
+            "id": 3,
+            "task": "'{q}'에 대한 전문가 의견 및 분석 리포트 탐색",
+            "target": "market",
+            "priority": 3,
+            "reasoning": "다각적 관점 확보"
+        }
+    )
 
     def __init__(self):
         super().__init__(
             name="Planner",
             system_prompt=self.SYSTEM_PROMPT,
-            temperature=0.3  # 약간의 창의성 허용
+            temperature=0.3,  # 약간의 창의성 허용
+            request_timeout=PLANNER_REQUEST_TIMEOUT
         )
     
     async def execute(self, context: AgentContext) -> AgentContext:
@@ -83,34 +137,15 @@ class PlannerAgent(BaseAgent):
         self._log(f"질문 분석 시작: {context.question}")
         context.add_step(f"[Planner] 질문 분해 시작")
         
-        # 질문 복잡도에 따라 프롬프트 조정
-        complexity_hint = {
-            "simple": "이 질문은 단순하므로 3개 서브태스크로 충분합니다.",
-            "moderate": "이 질문은 중간 복잡도이므로 3-4개 서브태스크가 필요합니다.",
-            "complex": "이 질문은 복잡하므로 4-5개 서브태스크로 철저히 분해하세요."
-        }
-        
-        hint = complexity_hint.get(context.complexity.value, complexity_hint["moderate"])
-        
-        prompt = f"""{hint}
-
-**사용자 질문**: {context.question}
-
-위 질문을 분석하여 서브태스크로 분해하세요. JSON 형식으로만 응답하세요."""
-        
-        # LLM 호출
         try:
-            response = await self._call_llm(prompt, max_tokens=1500)
-            
-            # JSON 파싱
-            subtasks_data = self._parse_json_response(response)
-            
-            if not subtasks_data or "subtasks" not in subtasks_data:
-                raise ValueError("Invalid response format: 'subtasks' key missing")
+            subtasks_data = await self._plan_cached(context.question)
             
             context.subtasks = subtasks_data["subtasks"]
+            context.complexity = self._parse_complexity(
+                subtasks_data.get("complexity"), context.complexity
+            )
             
-            self._log(f"서브태스크 {len(context.subtasks)}개 생성 완료")
+            self._log(f"서브태스크 {len(context.subtasks)}개 생성 완료 (복잡도: {context.complexity.value})")
             context.add_step(f"[Planner] {len(context.subtasks)}개 서브태스크 생성 완료")
             
             # 전략 로깅
@@ -128,6 +163,94 @@ class PlannerAgent(BaseAgent):
             
             return context
     
+    async def _plan_cached(self, question: str) -> Dict:
+        """
+        시맨틱 캐시를 거친 질문 분해
+        
+        정확히 같은 질문이면 바로 재사용하고, 아니면 임베딩 유사도 조회와 LLM 분해를
+        동시에 시작하여 캐시 미스여도 지연이 늘지 않게 함 (적중 시 LLM 호출 취소)
+        
+        Args:
+            question: 사용자 질문
+            
+        Returns:
+            {"complexity", "subtasks", "overall_strategy"} 딕셔너리
+        """
+        cache = get_semantic_cache("planner", ttl=PLANNER_CACHE_TTL_SECONDS)
+        if cache is None:
+            return await self._plan(question)
+        
+        plan = cache.get_exact(question)
+        if plan is None:
+            plan_task = asyncio.create_task(self._plan(question))
+            embedding = None
+            try:
+                plan, embedding = await cache.get_similar(question)
+            except Exception as e:
+                self._log(f"시맨틱 캐시 조회 실패: {e}")
+            
+            if plan is None:
+                plan = await plan_task
+                cache.set(question, plan, embedding)
+                return plan
+            
+            plan_task.cancel()
+            try:
+                await plan_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        
+        self._log("시맨틱 캐시 적중: 서브태스크 분해 재사용")
+        # 이후 에이전트의 수정이 캐시에 번지지 않도록 서브태스크 복사
+        return {**plan, "subtasks": [dict(subtask) for subtask in plan["subtasks"]]}
+    
+    async def _plan(self, question: str) -> Dict:
+        """
+        LLM으로 복잡도 판단과 서브태스크 분해 (별도 복잡도 분석 왕복 없이 한 번의 호출)
+        
+        Args:
+            question: 사용자 질문
+            
+        Returns:
+            파싱된 응답 딕셔너리
+            
+        Raises:
+            ValueError: subtasks 키가 없는 응답
+        """
+        prompt = self.PROMPT_TEMPLATE.format(question=question)
+        
+        # LLM 호출 (JSON 모드: 코드 블록/설명 없이 JSON 객체만 반환)
+        response = await self._call_llm_hedged(
+            prompt,
+            max_tokens=1500,
+            response_format={"type": "json_object"}
+        )
+        
+        # JSON 파싱
+        subtasks_data = self._parse_json_response(response)
+        
+        if not subtasks_data or "subtasks" not in subtasks_data:
+            raise ValueError("Invalid response format: 'subtasks' key missing")
+        
+        return subtasks_data
+    
+    @staticmethod
+    def _parse_complexity(value, default: QueryComplexity) -> QueryComplexity:
+        """
+        응답의 complexity 문자열을 QueryComplexity로 변환
+        
+        Args:
+            value: LLM이 반환한 복잡도 문자열
+            default: 값이 없거나 알 수 없을 때 유지할 복잡도
+            
+        Returns:
+            QueryComplexity enum
+        """
+        try:
+            return QueryComplexity(str(value).strip().lower())
+        except ValueError:
+            return default
+    
     def _parse_json_response(self, response: str) -> Dict:
         """
         LLM 응답에서 JSON 추출 및 파싱
@@ -138,15 +261,14 @@ class PlannerAgent(BaseAgent):
         Returns:
             파싱된 딕셔너리
         """
-        # 코드 블록 제거
-        if "```json" in response:
-            response = response.split("```json")[1].split("```")[0]
-        elif "```" in response:
-            response = response.split("```")[1].split("```")[0]
+        # JSON 객체 추출 (코드 블록/앞뒤 설명 제거, 일치 없으면 원문 그대로 파싱)
+        match = _JSON_OBJECT_RE.search(response)
+        if match:
+            response = match.group(1) or match.group(2)
         
         # JSON 파싱
         try:
-            return json.loads(response.strip())
+            return json_loads(response.strip())
         except json.JSONDecodeError as e:
             self._log(f"JSON 파싱 실패: {e}")
             raise
@@ -162,25 +284,6 @@ class PlannerAgent(BaseAgent):
             기본 서브태스크 리스트
         """
         return [
-            {
-                "id": 1,
-                "task": f"'{question}'와 관련된 최근 이벤트 및 정책 조사",
-                "target": "policy",
-                "priority": 1,
-                "reasoning": "배경 컨텍스트 파악"
-            },
-            {
-                "id": 2,
-                "task": f"'{question}'의 핵심 경제 지표 및 데이터 수집",
-                "target": "economy",
-                "priority": 2,
-                "reasoning": "정량적 근거 확보"
-            },
-            {
-                "id": 3,
-                "task": f"'{question}'에 대한 전문가 의견 및 분석 리포트 탐색",
-                "target": "market",
-                "priority": 3,
-                "reasoning": "다각적 관점 확보"
-            }
+            {**subtask, "task": subtask["task"].format(q=question)}
+            for subtask in self.FALLBACK_SUBTASKS
         ]
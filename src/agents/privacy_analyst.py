@@ -5,6 +5,7 @@ Provides insights on supply chain risks, talent flow, and hidden relationships
 """
 
 import asyncio
+import weakref
 from typing import Dict, List, Any, Optional
 import sys
 import os
@@ -12,7 +13,8 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import OLLAMA_BASE_URL, LOCAL_MODELS
+from config import OLLAMA_BASE_URL, LOCAL_MODELS, LLM_CACHE_TTL_SECONDS
+from agents.llm_cache import get_llm_cache, FileCache
 
 # Try to import LangChain components
 try:
@@ -27,12 +29,82 @@ except ImportError:
     print("💡 Install with: pip install langchain langchain-community")
 
 try:
+    import httpx
     from ollama import AsyncClient
     OLLAMA_AVAILABLE = True
 except ImportError:
     OLLAMA_AVAILABLE = False
     print("⚠️  ollama not installed.")
 
+# 2-hop exploration: paths aggregated per call, and sample paths returned for display
+TWO_HOP_PATH_LIMIT = 100
+TWO_HOP_SAMPLE_SIZE = 5
+
+# Temperature of the cached fallback analysis (low enough that a cached answer stands in for a fresh one)
+SIMPLE_ANALYSIS_TEMPERATURE = 0.3
+
+# Suppliers examined per supply chain risk analysis
+SUPPLY_CHAIN_SUPPLIER_LIMIT = 50
+
+# Company node labels → name index: seed scripts / integrator write :Company,
+# the privacy graph builder writes the upper-cased extractor type :COMPANY
+COMPANY_NAME_INDEXES = {
+    "Company": "seeded_company_name",
+    "COMPANY": "extracted_company_name",
+}
+_COMPANY_LABEL_FILTER = " OR ".join(f"company:{label}" for label in COMPANY_NAME_INDEXES)
+
+# Shared Ollama client connection pool (keep above the server's OLLAMA_NUM_PARALLEL, see config)
+OLLAMA_MAX_CONNECTIONS = 64
+OLLAMA_MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Default cap on concurrent analyses in analyze_many (bounds Neo4j sessions and Ollama requests)
+ANALYZE_MAX_CONCURRENCY = 16
+
+# Company name index is created once per process, before the first company-anchored query
+_company_index_ready = False
+
+# Shared Ollama clients, one per event loop (created on first use in that loop).
+# httpx keep-alive connections are bound to the loop that opened them, and the Streamlit
+# pages run each request in a new loop, so a single process-wide client would fail there.
+_shared_ollama_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _new_ollama_client() -> "AsyncClient":
+    """Create an Ollama client with the shared connection pool limits"""
+    return AsyncClient(
+        host=OLLAMA_BASE_URL,
+        limits=httpx.Limits(
+            max_connections=OLLAMA_MAX_CONNECTIONS,
+            max_keepalive_connections=OLLAMA_MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
+
+
+def _get_shared_ollama_client() -> Optional["AsyncClient"]:
+    """
+    Return the Ollama client shared within the running event loop (create if missing)
+    
+    Every agent instance reuses one httpx keep-alive pool per loop instead of opening its own connections
+    
+    Returns:
+        AsyncClient, or None if ollama is not installed
+    """
+    if not OLLAMA_AVAILABLE:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No running loop: nothing to share the connections with
+        return _new_ollama_client()
+    
+    client = _shared_ollama_clients.get(loop)
+    if client is None:
+        client = _shared_ollama_clients[loop] = _new_ollama_client()
+    return client
+
 
 class PrivacyAnalystAgent:
     """
@@ -40,6 +112,25 @@ class PrivacyAnalystAgent:
     Analyzes company data using Neo4j 2-hop traversal for insights
     """
     
+    # ReAct agent prompt (parsed once, together with the agent executor)
+    REACT_TEMPLATE = """You are a business analyst with access to a graph database.
+Answer the user's question by using the available tools.
+
+Available tools:
+{tools}
+
+Tool names: {tool_names}
+
+Question: {input}
+
+Thought: {agent_scratchpad}
+"""
+    
+    @property
+    def ollama_client(self) -> Optional["AsyncClient"]:
+        """Ollama client of the current event loop (the agent itself is pooled across loops)"""
+        return _get_shared_ollama_client()
+    
     def __init__(self, neo4j_db=None, neo4j_retriever=None):
         """
         Initialize analyst agent
@@ -50,9 +141,12 @@ class PrivacyAnalystAgent:
         """
         self.neo4j_db = neo4j_db
         self.neo4j_retriever = neo4j_retriever
-        self.ollama_client = AsyncClient(host=OLLAMA_BASE_URL) if OLLAMA_AVAILABLE else None
         self.llm_model = LOCAL_MODELS["llm"]
         
+        # ReAct agent executor, built on first use and reused across queries
+        self._agent_executor = None
+        self._executor_tool_ids: tuple = ()
+        
         # Initialize LangChain components if available
         if LANGCHAIN_AVAILABLE:
             self.llm = ChatOllama(
@@ -104,6 +198,10 @@ class PrivacyAnalystAgent:
         Returns:
             List of matching nodes
         """
+        return await asyncio.to_thread(self._do_neo4j_search, query)
+    
+    def _do_neo4j_search(self, query: str) -> List[Dict[str, Any]]:
+        """Blocking body of neo4j_search (shared by the async method and the tool)"""
         if not self.neo4j_db:
             return []
         
@@ -122,19 +220,15 @@ LIMIT 20
             return []
     
     def _neo4j_search_sync(self, query: str) -> str:
-        """Synchronous wrapper for neo4j_search"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        results = loop.run_until_complete(self.neo4j_search(query))
-        loop.close()
+        """Synchronous tool wrapper for neo4j_search"""
+        results = self._do_neo4j_search(query)
         
         if not results:
             return f"No entities found matching '{query}'"
         
-        output = f"Found {len(results)} entities:\n"
-        for r in results:
-            output += f"- {r['name']} ({r['type']})\n"
-        return output
+        parts = [f"Found {len(results)} entities:\n"]
+        parts.extend(f"- {r['name']} ({r['type']})\n" for r in results)
+        return "".join(parts)
     
     async def two_hop_explore(self, entity_names: List[str]) -> Dict[str, Any]:
         """
@@ -146,71 +240,82 @@ LIMIT 20
         Returns:
             Dict with paths and insights
         """
+        return await asyncio.to_thread(self._do_two_hop_explore, entity_names)
+    
+    def _do_two_hop_explore(self, entity_names: List[str]) -> Dict[str, Any]:
+        """Blocking body of two_hop_explore (shared by the async method and the tool)"""
         if not self.neo4j_db:
             return {"paths": [], "insights": []}
         
+        # Pattern counts are aggregated server-side; only a small summary row crosses the wire
         cypher = """
-MATCH path = (start)-[r1]->(mid)-[r2]->(end)
+MATCH (start)-[r1]->(mid)-[r2]->(end)
 WHERE start.name IN $names
-RETURN 
-    start.name AS start_name,
-    type(r1) AS rel1_type,
-    mid.name AS mid_name,
-    labels(mid)[0] AS mid_type,
-    type(r2) AS rel2_type,
-    end.name AS end_name,
-    labels(end)[0] AS end_type
-LIMIT 100
+WITH start, type(r1) AS rel1_type, mid, type(r2) AS rel2_type, end
+LIMIT $limit
+RETURN
+    count(*) AS count,
+    sum(CASE WHEN rel1_type CONTAINS 'SUPPLIES' AND rel2_type CONTAINS 'HAS_DEBT' THEN 1 ELSE 0 END) AS debt_suppliers,
+    count(DISTINCT CASE WHEN rel1_type CONTAINS 'LOST_EMPLOYEE' AND rel2_type CONTAINS 'JOINED' THEN end.name END) AS talent_companies,
+    sum(CASE WHEN rel1_type CONTAINS 'INVESTS_IN' OR rel2_type CONTAINS 'INVESTS_IN' THEN 1 ELSE 0 END) AS investments,
+    count(DISTINCT CASE WHEN rel2_type CONTAINS 'LOCATED_IN' OR rel2_type CONTAINS 'OPERATES_IN' THEN end.name END) AS regions,
+    collect({
+        start_name: start.name,
+        rel1_type: rel1_type,
+        mid_name: mid.name,
+        mid_type: labels(mid)[0],
+        rel2_type: rel2_type,
+        end_name: end.name,
+        end_type: labels(end)[0]
+    })[..$sample_size] AS sample
 """
         
         try:
-            results = self.neo4j_db.execute_query(cypher, {"names": entity_names})
-            
-            # Analyze patterns
-            insights = self._analyze_patterns(results)
+            results = self.neo4j_db.execute_query(
+                cypher,
+                {"names": entity_names, "limit": TWO_HOP_PATH_LIMIT, "sample_size": TWO_HOP_SAMPLE_SIZE}
+            )
+            summary = results[0] if results else {}
             
             return {
-                "paths": results,
-                "insights": insights,
-                "count": len(results)
+                "paths": summary.get("sample", []),
+                "insights": self._analyze_patterns(summary),
+                "count": summary.get("count", 0)
             }
         except Exception as e:
             print(f"⚠️  2-hop exploration error: {e}")
             return {"paths": [], "insights": [], "count": 0}
     
     def _two_hop_explore_sync(self, entity_names: str) -> str:
-        """Synchronous wrapper for two_hop_explore"""
+        """Synchronous tool wrapper for two_hop_explore"""
         names = [n.strip() for n in entity_names.split(",")]
-        
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(self.two_hop_explore(names))
-        loop.close()
+        result = self._do_two_hop_explore(names)
         
         if result["count"] == 0:
             return f"No 2-hop paths found from {entity_names}"
         
-        output = f"Found {result['count']} 2-hop paths:\n\n"
+        parts = [f"Found {result['count']} 2-hop paths:\n\n"]
         
         # Show sample paths
-        for path in result["paths"][:5]:
-            output += f"  {path['start_name']} --[{path['rel1_type']}]--> "
-            output += f"{path['mid_name']} ({path['mid_type']}) --[{path['rel2_type']}]--> "
-            output += f"{path['end_name']} ({path['end_type']})\n"
+        parts.extend(
+            f"  {path['start_name']} --[{path['rel1_type']}]--> "
+            f"{path['mid_name']} ({path['mid_type']}) --[{path['rel2_type']}]--> "
+            f"{path['end_name']} ({path['end_type']})\n"
+            for path in result["paths"]
+        )
         
         if result["insights"]:
-            output += f"\n🔍 Insights:\n"
-            for insight in result["insights"]:
-                output += f"  - {insight}\n"
+            parts.append("\n🔍 Insights:\n")
+            parts.extend(f"  - {insight}\n" for insight in result["insights"])
         
-        return output
+        return "".join(parts)
     
-    def _analyze_patterns(self, paths: List[Dict]) -> List[str]:
+    def _analyze_patterns(self, summary: Dict[str, Any]) -> List[str]:
         """
-        Analyze 2-hop patterns for insights
+        Format 2-hop pattern counts as insights
         
         Args:
-            paths: List of 2-hop path results
+            summary: Aggregated counts returned by the two_hop_explore query
             
         Returns:
             List of insight strings
@@ -218,29 +323,37 @@ LIMIT 100
         insights = []
         
         # Supply chain risk patterns
-        debt_suppliers = [p for p in paths if "SUPPLIES" in p.get("rel1_type", "") and "HAS_DEBT" in p.get("rel2_type", "")]
-        if debt_suppliers:
-            insights.append(f"Supply Chain Risk: {len(debt_suppliers)} suppliers with debt detected")
+        if summary.get("debt_suppliers"):
+            insights.append(f"Supply Chain Risk: {summary['debt_suppliers']} suppliers with debt detected")
         
         # Talent flow patterns
-        talent_flow = [p for p in paths if "LOST_EMPLOYEE" in p.get("rel1_type", "") and "JOINED" in p.get("rel2_type", "")]
-        if talent_flow:
-            companies = set(p["end_name"] for p in talent_flow)
-            insights.append(f"Talent Flow: Employees moved to {len(companies)} competitors")
+        if summary.get("talent_companies"):
+            insights.append(f"Talent Flow: Employees moved to {summary['talent_companies']} competitors")
         
         # Investment patterns
-        investments = [p for p in paths if "INVESTS_IN" in p.get("rel1_type", "") or "INVESTS_IN" in p.get("rel2_type", "")]
-        if investments:
-            insights.append(f"Investment Network: {len(investments)} investment relationships found")
+        if summary.get("investments"):
+            insights.append(f"Investment Network: {summary['investments']} investment relationships found")
         
         # Geographic patterns
-        locations = [p for p in paths if "LOCATED_IN" in p.get("rel2_type", "") or "OPERATES_IN" in p.get("rel2_type", "")]
-        if locations:
-            regions = set(p["end_name"] for p in locations)
-            insights.append(f"Geographic Presence: Operations in {len(regions)} regions")
+        if summary.get("regions"):
+            insights.append(f"Geographic Presence: Operations in {summary['regions']} regions")
         
         return insights
     
+    def _ensure_company_index(self) -> None:
+        """Create the company name indexes once so company-anchored queries seek instead of scanning"""
+        global _company_index_ready
+        if _company_index_ready:
+            return
+        _company_index_ready = True
+        for label, index_name in COMPANY_NAME_INDEXES.items():
+            try:
+                self.neo4j_db.execute_query(
+                    f"CREATE INDEX {index_name} IF NOT EXISTS FOR (c:{label}) ON (c.name)"
+                )
+            except Exception as e:
+                print(f"⚠️  Company index creation error ({label}): {e}")
+    
     async def supply_chain_risk_analysis(self, company_name: str) -> Dict[str, Any]:
         """
         Analyze supply chain risks for a company
@@ -251,48 +364,59 @@ LIMIT 100
         Returns:
             Risk analysis results
         """
+        return await asyncio.to_thread(self._do_supply_chain_risk_analysis, company_name)
+    
+    def _do_supply_chain_risk_analysis(self, company_name: str) -> Dict[str, Any]:
+        """Blocking body of supply_chain_risk_analysis (shared by the async method and the tool)"""
         if not self.neo4j_db:
             return {"risk_level": "unknown", "details": []}
         
-        cypher = """
-MATCH (company {name: $company_name})-[:SUPPLIES|PURCHASES*1..2]-(supplier)
-OPTIONAL MATCH (supplier)-[:HAS_DEBT|HAS_RISK]-(risk)
-RETURN 
-    supplier.name AS supplier_name,
-    labels(supplier)[0] AS supplier_type,
-    COLLECT(DISTINCT risk.name) AS risks
-LIMIT 50
+        # Labeled anchor (either company label) → index seek on name; risk is an existence
+        # check per supplier, so Neo4j returns one row of counts instead of a row per supplier
+        cypher = f"""
+MATCH (company {{name: $company_name}})
+WHERE {_COMPANY_LABEL_FILTER}
+MATCH (company)-[:SUPPLIES|PURCHASES*1..2]-(supplier)
+WITH DISTINCT supplier
+LIMIT $limit
+WITH supplier, EXISTS {{ (supplier)-[:HAS_DEBT|HAS_RISK]-() }} AS at_risk
+RETURN
+    count(supplier) AS suppliers_analyzed,
+    sum(CASE WHEN at_risk THEN 1 ELSE 0 END) AS at_risk_suppliers,
+    collect(CASE WHEN at_risk THEN supplier.name END) AS at_risk_names
 """
         
         try:
-            results = self.neo4j_db.execute_query(cypher, {"company_name": company_name})
+            self._ensure_company_index()
+            results = self.neo4j_db.execute_query(
+                cypher,
+                {"company_name": company_name, "limit": SUPPLY_CHAIN_SUPPLIER_LIMIT}
+            )
+            summary = results[0] if results else {}
             
-            risk_count = sum(1 for r in results if r.get("risks"))
+            risk_count = summary.get("at_risk_suppliers", 0)
             risk_level = "high" if risk_count > 3 else "medium" if risk_count > 0 else "low"
             
             return {
                 "risk_level": risk_level,
-                "suppliers_analyzed": len(results),
+                "suppliers_analyzed": summary.get("suppliers_analyzed", 0),
                 "at_risk_suppliers": risk_count,
-                "details": results
+                "details": summary.get("at_risk_names", [])
             }
         except Exception as e:
             print(f"⚠️  Supply chain analysis error: {e}")
             return {"risk_level": "unknown", "details": []}
     
     def _supply_chain_risk_sync(self, company_name: str) -> str:
-        """Synchronous wrapper for supply_chain_risk_analysis"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(self.supply_chain_risk_analysis(company_name))
-        loop.close()
-        
-        output = f"Supply Chain Risk Analysis for {company_name}:\n"
-        output += f"  Risk Level: {result['risk_level'].upper()}\n"
-        output += f"  Suppliers Analyzed: {result.get('suppliers_analyzed', 0)}\n"
-        output += f"  At-Risk Suppliers: {result.get('at_risk_suppliers', 0)}\n"
-        
-        return output
+        """Synchronous tool wrapper for supply_chain_risk_analysis"""
+        result = self._do_supply_chain_risk_analysis(company_name)
+        
+        return (
+            f"Supply Chain Risk Analysis for {company_name}:\n"
+            f"  Risk Level: {result['risk_level'].upper()}\n"
+            f"  Suppliers Analyzed: {result.get('suppliers_analyzed', 0)}\n"
+            f"  At-Risk Suppliers: {result.get('at_risk_suppliers', 0)}\n"
+        )
     
     async def talent_flow_analysis(self, company_name: str) -> Dict[str, Any]:
         """
@@ -304,15 +428,20 @@ LIMIT 50
         Returns:
             Talent flow analysis results
         """
+        return await asyncio.to_thread(self._do_talent_flow_analysis, company_name)
+    
+    def _do_talent_flow_analysis(self, company_name: str) -> Dict[str, Any]:
+        """Blocking body of talent_flow_analysis (shared by the async method and the tool)"""
         if not self.neo4j_db:
             return {"inflow": 0, "outflow": 0, "details": []}
         
-        cypher = """
-MATCH (company {name: $company_name})
+        cypher = f"""
+MATCH (company {{name: $company_name}})
+WHERE {_COMPANY_LABEL_FILTER}
 OPTIONAL MATCH (company)-[:LOST_EMPLOYEE]->(person)-[:JOINED]->(competitor)
-WITH company, COLLECT({person: person.name, to: competitor.name}) AS outflow_data
+WITH company, COLLECT({{person: person.name, to: competitor.name}}) AS outflow_data
 OPTIONAL MATCH (competitor)-[:LOST_EMPLOYEE]->(person)-[:JOINED]->(company)
-WITH company, outflow_data, COLLECT({person: person.name, from: competitor.name}) AS inflow_data
+WITH company, outflow_data, COLLECT({{person: person.name, from: competitor.name}}) AS inflow_data
 RETURN 
     SIZE(outflow_data) AS outflow,
     SIZE(inflow_data) AS inflow,
@@ -321,6 +450,7 @@ RETURN
 """
         
         try:
+            self._ensure_company_index()
             results = self.neo4j_db.execute_query(cypher, {"company_name": company_name})
             
             if results:
@@ -331,23 +461,22 @@ RETURN
             return {"inflow": 0, "outflow": 0, "details": []}
     
     def _talent_flow_sync(self, company_name: str) -> str:
-        """Synchronous wrapper for talent_flow_analysis"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(self.talent_flow_analysis(company_name))
-        loop.close()
+        """Synchronous tool wrapper for talent_flow_analysis"""
+        result = self._do_talent_flow_analysis(company_name)
         
-        output = f"Talent Flow Analysis for {company_name}:\n"
-        output += f"  Incoming: {result.get('inflow', 0)} employees\n"
-        output += f"  Outgoing: {result.get('outflow', 0)} employees\n"
+        parts = [
+            f"Talent Flow Analysis for {company_name}:\n",
+            f"  Incoming: {result.get('inflow', 0)} employees\n",
+            f"  Outgoing: {result.get('outflow', 0)} employees\n"
+        ]
         
         net = result.get('inflow', 0) - result.get('outflow', 0)
         if net > 0:
-            output += f"  Net Gain: +{net} employees\n"
+            parts.append(f"  Net Gain: +{net} employees\n")
         elif net < 0:
-            output += f"  Net Loss: {net} employees\n"
+            parts.append(f"  Net Loss: {net} employees\n")
         
-        return output
+        return "".join(parts)
     
     async def analyze(self, query: str) -> str:
         """
@@ -363,39 +492,61 @@ RETURN
             # Fallback to simple analysis
             return await self._simple_analyze(query)
         
-        # Create agent prompt
-        template = """You are a business analyst with access to a graph database.
-Answer the user's question by using the available tools.
-
-Available tools:
-{tools}
-
-Tool names: {tool_names}
-
-Question: {input}
-
-Thought: {agent_scratchpad}
-"""
+        try:
+            # Run the cached agent
+            result = await self._get_agent_executor().ainvoke({"input": query})
+            return result.get("output", "Unable to generate analysis.")
+            
+        except Exception as e:
+            print(f"⚠️  Agent execution error: {e}")
+            return await self._simple_analyze(query)
+    
+    def _get_agent_executor(self) -> "AgentExecutor":
+        """
+        Return the ReAct agent executor, building it on first use
         
-        prompt = PromptTemplate.from_template(template)
+        The prompt template and agent wiring are reused across queries;
+        the executor is rebuilt only if self.tools has been replaced or changed
         
-        try:
-            # Create and run agent
+        Returns:
+            AgentExecutor instance
+        """
+        tool_ids = tuple(id(tool) for tool in self.tools)
+        if self._agent_executor is None or tool_ids != self._executor_tool_ids:
+            prompt = PromptTemplate.from_template(self.REACT_TEMPLATE)
             agent = create_react_agent(self.llm, self.tools, prompt)
-            agent_executor = AgentExecutor(
+            self._agent_executor = AgentExecutor(
                 agent=agent,
                 tools=self.tools,
                 verbose=True,
                 max_iterations=5,
                 handle_parsing_errors=True
             )
+            self._executor_tool_ids = tool_ids
+        return self._agent_executor
+    
+    async def analyze_many(
+        self,
+        queries: List[str],
+        max_concurrency: int = ANALYZE_MAX_CONCURRENCY
+    ) -> List[str]:
+        """
+        Analyze several independent queries concurrently
+        
+        Args:
+            queries: User queries
+            max_concurrency: Maximum number of analyses in flight
             
-            result = await agent_executor.ainvoke({"input": query})
-            return result.get("output", "Unable to generate analysis.")
-            
-        except Exception as e:
-            print(f"⚠️  Agent execution error: {e}")
-            return await self._simple_analyze(query)
+        Returns:
+            Analysis results in the same order as queries
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze_one(query: str) -> str:
+            async with semaphore:
+                return await self.analyze(query)
+        
+        return list(await asyncio.gather(*(analyze_one(q) for q in queries)))
     
     async def _simple_analyze(self, query: str) -> str:
         """
@@ -411,29 +562,44 @@ Thought: {agent_scratchpad}
         words = query.lower().split()
         potential_entities = [w for w in words if len(w) > 3]
         
-        results = []
-        for entity in potential_entities[:3]:  # Limit to 3 entities
-            search_results = await self.neo4j_search(entity)
-            if search_results:
-                results.extend(search_results)
+        # Limit to 3 entities, searched concurrently
+        search_results = await asyncio.gather(
+            *(self.neo4j_search(entity) for entity in potential_entities[:3])
+        )
+        results = [r for entity_results in search_results for r in entity_results]
         
         if not results:
             return "No relevant entities found in the database."
         
         # Simple analysis using Ollama
-        if self.ollama_client:
-            context = "Entities found:\n"
-            for r in results[:5]:
-                context += f"- {r['name']} ({r['type']})\n"
+        ollama_client = self.ollama_client
+        if ollama_client:
+            context = "Entities found:\n" + "".join(
+                f"- {r['name']} ({r['type']})\n" for r in results[:5]
+            )
             
             prompt = f"{context}\n\nUser question: {query}\n\nProvide a brief analysis:"
             
+            # Same entities + question → reuse the cached answer instead of another Ollama call
+            cache = get_llm_cache()
+            cache_key = FileCache.make_key(
+                "privacy_analyst", self.llm_model, SIMPLE_ANALYSIS_TEMPERATURE, prompt
+            )
+            if cache is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            
             try:
-                response = await self.ollama_client.chat(
+                response = await ollama_client.chat(
                     model=self.llm_model,
-                    messages=[{"role": "user", "content": prompt}]
+                    messages=[{"role": "user", "content": prompt}],
+                    options={"temperature": SIMPLE_ANALYSIS_TEMPERATURE}
                 )
-                return response['message']['content']
+                content = response['message']['content']
+                if cache is not None:
+                    cache.set(cache_key, content, LLM_CACHE_TTL_SECONDS)
+                return content
             except Exception as e:
                 print(f"⚠️  Ollama error: {e}")
         
@@ -0,0 +1,45 @@
+"""
+LLM 없이 판별 가능한 단순 질문 분류
+"특정 종목의 단일 지표" 조회(예: "NVDA 주가는?", "엔비디아 매출은?")는 복잡도 분석/질문 분해 LLM 호출 생략
+"""
+
+import re
+
+from .ticker_resolver import match_ticker
+
+
+# 단순 조회로 볼 최대 질문 길이 (공백 제외 문자 수)
+SIMPLE_QUESTION_MAX_CHARS = 30
+
+# 단일 지표 키워드 (영문 약어는 다른 단어의 일부와 매칭되지 않도록 영문자 경계, 한글 조사는 허용)
+_METRIC_RE = re.compile(
+    r"주가|현재가|시가총액|매출|영업이익|순이익|배당"
+    r"|(?<![A-Za-z])(?:eps|per)(?![A-Za-z])|stock\s*price|market\s*cap|revenue|dividend",
+    re.IGNORECASE
+)
+
+# 분석/비교/투자 판단이 필요한 표현, 종목이 아닌 섹터 단위 표현 (하나라도 있으면 단순 조회 아님)
+_ANALYTIC_RE = re.compile(
+    r"영향|전망|분석|비교|이유|왜|어떻게|추이|성장률|증가율|대비|살까|사야|팔까|매수|매도|투자|리스크"
+    r"|관련주|테마|섹터|업종|산업|sector|industry"
+    r"|why|how|impact|outlook|forecast|compare|vs|growth|yoy|should|buy|sell|risk",
+    re.IGNORECASE
+)
+
+
+def is_simple_lookup(question: str) -> bool:
+    """
+    종목 하나의 단일 지표 조회 질문인지 판별 (QueryComplexity.SIMPLE로 바로 분류)
+    
+    Args:
+        question: 사용자 질문
+    
+    Returns:
+        짧고, 티커가 특정되고, 지표 키워드가 있으며, 분석 표현이 없으면 True
+        (티커는 대문자 심볼 또는 단어 단위로 일치하는 기업명만 인정 - match_ticker 경계 규칙)
+    """
+    if len("".join(question.split())) > SIMPLE_QUESTION_MAX_CHARS:
+        return False
+    if _ANALYTIC_RE.search(question) or not _METRIC_RE.search(question):
+        return False
+    return match_ticker(question) is not None
@@ -0,0 +1,234 @@
+"""
+질문 의미 기반 결과 캐시
+표현만 다른 같은 질문("NVDA 주가" / "엔비디아 주가는?")에 재수집/재계획 없이 응답
+(KB 수집 결과, Planner 서브태스크 분해 결과를 네임스페이스별 인스턴스로 캐시)
+"""
+
+import math
+import random
+import time
+from collections import OrderedDict
+from operator import mul
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config import (
+    API_MODELS,
+    RUN_MODE,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL_SECONDS,
+)
+
+
+# LSH 초평면 개수 (버킷 키 비트 수) / 초평면 생성 시드 (프로세스 간 동일한 버킷)
+LSH_NUM_PLANES = 16
+LSH_SEED = 42
+
+EmbedFn = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+def _normalize_question(question: str) -> str:
+    """정확 일치 조회용 질문 키 (공백/대소문자 정규화)"""
+    return " ".join(question.split()).lower()
+
+
+def _unit(vector: List[float]) -> List[float]:
+    """L2 정규화 (내적 = 코사인 유사도)"""
+    norm = math.sqrt(sum(map(mul, vector, vector))) or 1.0
+    return [v / norm for v in vector]
+
+
+def _dot(a: List[float], b: List[float]) -> float:
+    """벡터 내적"""
+    return sum(map(mul, a, b))
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    """단위 벡터(embed_texts 결과) 간 코사인 유사도"""
+    return _dot(a, b)
+
+
+async def embed_texts(texts: List[str]) -> List[List[float]]:
+    """
+    텍스트 리스트를 한 번의 호출로 임베딩 (API 모드는 에이전트 공유 OpenAI 클라이언트, 그 외 Ollama)
+    
+    Returns:
+        단위 벡터 리스트 (내적 = 코사인 유사도)
+    """
+    if RUN_MODE == "API":
+        # utils.openai_embedding_if는 호출마다 클라이언트를 새로 만들므로 공유 커넥션 풀 사용
+        from .base_agent import BaseAgent
+        response = await BaseAgent._get_shared_client().embeddings.create(
+            model=API_MODELS["embedding"],
+            input=texts
+        )
+        vectors = [item.embedding for item in response.data]
+    else:
+        from utils import ollama_embedding_if
+        vectors = await ollama_embedding_if(texts)
+    return [_unit(vector) for vector in vectors]
+
+
+class SemanticCache:
+    """
+    임베딩 랜덤 초평면 LSH 버킷 + 코사인 유사도 확인 캐시
+    
+    조회 순서:
+    1. get_exact: 정규화된 질문 문자열 정확 일치 (임베딩 호출 없음)
+    2. get_similar: 질문 임베딩의 LSH 버킷 내 항목 중 코사인 유사도 ≥ threshold
+    """
+    
+    def __init__(
+        self,
+        embed_fn: Optional[EmbedFn] = None,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = SEMANTIC_CACHE_TTL_SECONDS,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES
+    ):
+        """
+        Args:
+            embed_fn: 텍스트 리스트 → 벡터 리스트 (None이면 embed_texts)
+            threshold: 캐시 적중 코사인 유사도 하한
+            ttl: 항목 유효 기간 (초)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 안 쓴 항목부터 제거)
+        """
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        
+        # entry_id → (질문 키, 버킷, 단위 임베딩, 스냅샷, 만료 시각) - LRU 순서
+        self._entries: "OrderedDict[int, Tuple[str, int, Optional[List[float]], Dict[str, Any], float]]" = OrderedDict()
+        self._buckets: Dict[int, set] = {}
+        self._by_question: Dict[str, int] = {}
+        self._planes: Optional[List[List[float]]] = None
+        self._next_id = 0
+    
+    async def _embed(self, question: str) -> List[float]:
+        """질문 임베딩 (단위 벡터)"""
+        if self._embed_fn is None:
+            return (await embed_texts([question]))[0]
+        return _unit((await self._embed_fn([question]))[0])
+    
+    def _bucket(self, embedding: List[float]) -> int:
+        """임베딩 → LSH 버킷 (각 초평면의 어느 쪽에 있는지를 비트로)"""
+        if self._planes is None or len(self._planes[0]) != len(embedding):
+            rng = random.Random(LSH_SEED)
+            self._planes = [
+                [rng.gauss(0.0, 1.0) for _ in range(len(embedding))]
+                for _ in range(LSH_NUM_PLANES)
+            ]
+        bucket = 0
+        for plane in self._planes:
+            bucket = (bucket << 1) | (_dot(plane, embedding) >= 0.0)
+        return bucket
+    
+    def _touch(self, entry_id: int) -> Optional[Dict[str, Any]]:
+        """유효한 항목이면 LRU 갱신 후 스냅샷 반환, 만료면 제거"""
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            return None
+        if entry[4] < time.time():
+            self._remove(entry_id)
+            return None
+        self._entries.move_to_end(entry_id)
+        return entry[3]
+    
+    def _remove(self, entry_id: int) -> None:
+        """항목과 인덱스(질문 키, 버킷) 제거"""
+        question_key, bucket, _, _, _ = self._entries.pop(entry_id)
+        if self._by_question.get(question_key) == entry_id:
+            del self._by_question[question_key]
+        members = self._buckets.get(bucket)
+        if members is not None:
+            members.discard(entry_id)
+            if not members:
+                del self._buckets[bucket]
+    
+    def get_exact(self, question: str) -> Optional[Dict[str, Any]]:
+        """
+        정규화된 질문 문자열이 같은 항목 조회 (임베딩 호출 없음)
+        
+        Returns:
+            스냅샷 또는 None
+        """
+        entry_id = self._by_question.get(_normalize_question(question))
+        if entry_id is None:
+            return None
+        return self._touch(entry_id)
+    
+    async def get_similar(self, question: str) -> Tuple[Optional[Dict[str, Any]], List[float]]:
+        """
+        질문 임베딩과 같은 LSH 버킷의 항목 중 코사인 유사도 ≥ threshold인 항목 조회
+        
+        Returns:
+            (스냅샷 또는 None, 질문 임베딩 - 미스 시 set()에 재사용)
+        """
+        embedding = await self._embed(question)
+        for candidate_id in list(self._buckets.get(self._bucket(embedding), ())):
+            candidate = self._entries.get(candidate_id)
+            if candidate is None or candidate[2] is None:
+                continue
+            if _dot(candidate[2], embedding) >= self.threshold:
+                snapshot = self._touch(candidate_id)
+                if snapshot is not None:
+                    return snapshot, embedding
+        
+        return None, embedding
+    
+    def set(
+        self,
+        question: str,
+        snapshot: Dict[str, Any],
+        embedding: Optional[List[float]] = None
+    ) -> None:
+        """
+        캐시 저장
+        
+        Args:
+            question: 질문
+            snapshot: 저장할 수집 결과
+            embedding: get_similar()가 반환한 임베딩 (None이면 정확 일치로만 조회됨)
+        """
+        question_key = _normalize_question(question)
+        if question_key in self._by_question:
+            self._remove(self._by_question[question_key])
+        
+        bucket = self._bucket(embedding) if embedding is not None else -1
+        entry_id = self._next_id
+        self._next_id += 1
+        
+        self._entries[entry_id] = (question_key, bucket, embedding, snapshot, time.time() + self.ttl)
+        self._by_question[question_key] = entry_id
+        if embedding is not None:
+            self._buckets.setdefault(bucket, set()).add(entry_id)
+        
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+
+# 네임스페이스별 전역 인스턴스 (수집 결과와 계획 결과가 서로 섞이지 않도록 분리)
+_semantic_caches: Dict[str, SemanticCache] = {}
+
+
+def get_semantic_cache(
+    namespace: str = "collection",
+    ttl: float = SEMANTIC_CACHE_TTL_SECONDS
+) -> Optional[SemanticCache]:
+    """
+    네임스페이스별 시맨틱 캐시 인스턴스 반환
+    
+    Args:
+        namespace: 캐시 구분 ("collection": KB 수집 결과, "planner": 서브태스크 분해 결과)
+        ttl: 항목 유효 기간 (초), 네임스페이스 최초 생성 시에만 적용
+    
+    Returns:
+        SemanticCache 싱글톤 (SEMANTIC_CACHE_ENABLED=false면 None)
+    """
+    if not SEMANTIC_CACHE_ENABLED:
+        return None
+    cache = _semantic_caches.get(namespace)
+    if cache is None:
+        cache = _semantic_caches[namespace] = SemanticCache(ttl=ttl)
+    return cache
@@ -0,0 +1,196 @@
+"""
+티커 심볼 조회
+질문 텍스트에서 LLM 호출 없이 주식 티커를 찾는 정적 테이블 + 컴파일된 정규식,
+테이블에 없는 기업은 LLM으로 추출 (수집/분석 에이전트가 공유하는 LRU 캐시)
+"""
+
+import asyncio
+import re
+from collections import OrderedDict
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_agent import BaseAgent
+
+
+# 티커 캐시 크기 / LLM 추출 결과 디스크 캐시 기간
+TICKER_CACHE_SIZE = 1000
+TICKER_LLM_CACHE_TTL = 30 * 24 * 3600  # 티커는 잘 바뀌지 않으므로 디스크 캐시 30일
+
+# 바로 인식하는 티커 심볼 (질문에 대문자로 그대로 등장하는 경우)
+KNOWN_TICKERS = frozenset({
+    # 반도체 / 하드웨어
+    "NVDA", "AMD", "INTC", "TSM", "AVGO", "QCOM", "MU", "ASML", "AMAT", "LRCX",
+    "KLAC", "TXN", "ARM", "SMCI", "MRVL", "ADI", "NXPI", "ON",
+    # 빅테크 / 소프트웨어
+    "AAPL", "MSFT", "GOOGL", "GOOG", "AMZN", "META", "NFLX", "ORCL", "IBM",
+    "CRM", "ADBE", "PLTR", "CSCO", "UBER", "SHOP",
+    # 자동차 / 기타 대형주
+    "TSLA", "BRK", "JPM", "V", "MA", "WMT", "XOM", "JNJ", "KO", "DIS",
+})
+
+# 기업명(소문자 영문 / 한글) → 티커
+COMPANY_TICKERS = {
+    "nvidia": "NVDA", "엔비디아": "NVDA",
+    "advanced micro devices": "AMD", "에이엠디": "AMD",
+    "intel": "INTC", "인텔": "INTC",
+    "tsmc": "TSM", "taiwan semiconductor": "TSM", "티에스엠씨": "TSM",
+    "broadcom": "AVGO", "브로드컴": "AVGO",
+    "qualcomm": "QCOM", "퀄컴": "QCOM",
+    "micron": "MU", "마이크론": "MU",
+    "applied materials": "AMAT", "어플라이드 머티리얼즈": "AMAT",
+    "apple": "AAPL", "애플": "AAPL",
+    "microsoft": "MSFT", "마이크로소프트": "MSFT",
+    "alphabet": "GOOGL", "google": "GOOGL", "구글": "GOOGL",
+    "amazon": "AMZN", "아마존": "AMZN",
+    "meta platforms": "META", "메타": "META",
+    "netflix": "NFLX", "넷플릭스": "NFLX",
+    "oracle": "ORCL", "오라클": "ORCL",
+    "palantir": "PLTR", "팔란티어": "PLTR",
+    "tesla": "TSLA", "테슬라": "TSLA",
+}
+
+# 이 길이 이하의 심볼은 일반 약어/모델명과 겹치므로("V100", "ON", "MA") "$V"처럼 $가 붙은 경우만 인식
+SHORT_SYMBOL_MAX_LEN = 2
+
+# 대문자 1-5자 후보 (영문/숫자와 붙어 있으면 제외, 한글 조사는 허용: "NVDA의")
+_SYMBOL_RE = re.compile(r"(?<![A-Za-z0-9$])(\$?)([A-Z]{1,5})(?![A-Za-z0-9])")
+
+# 한글 기업명 뒤에 붙을 수 있는 조사 (그 외 한글이 이어지면 다른 단어의 일부: "애플리케이션", "메타버스")
+_KO_PARTICLES = (
+    "으로", "에서", "에게", "보다", "처럼", "까지", "부터", "이랑", "하고",
+    "의", "은", "는", "이", "가", "을", "를", "에", "와", "과", "도", "만", "로", "랑"
+)
+_KO_NAME_END = rf"(?:{'|'.join(_KO_PARTICLES)})?(?![가-힣])"
+
+
+def _company_pattern(name: str) -> str:
+    """기업명 하나의 정규식 (영문은 영문/숫자 경계, 한글은 앞은 한글 경계 + 뒤는 조사만 허용)"""
+    if name.isascii():
+        return rf"(?<![A-Za-z0-9]){re.escape(name)}(?![A-Za-z0-9])"
+    return rf"(?<![가-힣]){re.escape(name)}(?={_KO_NAME_END})"
+
+
+# 기업명 alternation (긴 이름 우선 → 접두어가 겹쳐도 가장 긴 이름과 매칭)
+_COMPANY_RE = re.compile(
+    "|".join(_company_pattern(name) for name in sorted(COMPANY_TICKERS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+
+def match_ticker(question: str) -> Optional[str]:
+    """
+    질문에서 티커를 로컬 테이블로 조회 (LLM 불필요)
+    
+    Args:
+        question: 사용자 질문
+    
+    Returns:
+        티커 심볼 또는 None (테이블에 없음 → LLM 추출 필요)
+    """
+    for dollar, symbol in _SYMBOL_RE.findall(question):
+        if symbol in KNOWN_TICKERS and (dollar or len(symbol) > SHORT_SYMBOL_MAX_LEN):
+            return symbol
+    
+    match = _COMPANY_RE.search(question)
+    if match:
+        return COMPANY_TICKERS[match.group(0).lower()]
+    
+    return None
+
+
+# 테이블에 없는 기업의 티커 추출 프롬프트
+_TICKER_PROMPT = """다음 질문에서 주식 티커 심볼을 추출하세요:
+
+질문: {question}
+
+티커 심볼만 반환하세요 (예: NVDA, AAPL, TSLA).
+티커를 찾을 수 없으면 "NONE"을 반환하세요.
+"""
+
+# 정규화된 질문 → 티커 (LRU, 수집/분석 에이전트 공유 - 서브태스크/재수집/검증 시 같은 질문 반복)
+_ticker_cache: "OrderedDict[str, Optional[str]]" = OrderedDict()
+
+
+def _cache_key(question: str) -> str:
+    """캐시 키 (공백/대소문자 정규화한 질문)"""
+    return " ".join(question.split()).lower()
+
+
+def parse_ticker(text: str) -> Optional[str]:
+    """
+    LLM 응답/검증 결과의 티커 문자열 정규화
+    
+    Returns:
+        대문자 티커 또는 None (빈 값, "NONE", 5자 초과)
+    """
+    ticker = str(text or "").strip().upper()
+    if not ticker or ticker == "NONE" or len(ticker) > 5:
+        return None
+    return ticker
+
+
+def remember_ticker(question: str, ticker: Optional[str]) -> None:
+    """질문의 티커를 공유 캐시에 기록 (None은 "티커 없음" 확정)"""
+    key = _cache_key(question)
+    _ticker_cache[key] = ticker
+    _ticker_cache.move_to_end(key)
+    if len(_ticker_cache) > TICKER_CACHE_SIZE:
+        _ticker_cache.popitem(last=False)
+
+
+def lookup_ticker(question: str) -> Optional[str]:
+    """
+    LLM 없이 알 수 있는 티커 (공유 캐시 → 로컬 테이블)
+    
+    Returns:
+        티커 심볼 또는 None (미확정 포함)
+    """
+    return _ticker_cache.get(_cache_key(question)) or match_ticker(question)
+
+
+async def resolve_ticker(
+    question: str,
+    agent: "BaseAgent",
+    timeout: Optional[float] = None
+) -> Optional[str]:
+    """
+    질문에서 주식 티커 추출 (캐시 → 로컬 테이블 → LLM 순)
+    
+    Args:
+        question: 사용자 질문
+        agent: LLM 호출/로그에 사용할 에이전트
+        timeout: LLM 추출 제한 시간 (초, None이면 제한 없음)
+    
+    Returns:
+        티커 심볼 또는 None
+    """
+    # 1. 캐시 조회
+    key = _cache_key(question)
+    if key in _ticker_cache:
+        _ticker_cache.move_to_end(key)
+        return _ticker_cache[key]
+    
+    # 2. 로컬 테이블 조회 (티커 심볼 / 한영 기업명) → 대부분 LLM 생략
+    ticker = match_ticker(question)
+    
+    # 3. 테이블에 없는 기업만 LLM 추출
+    if ticker is None:
+        try:
+            response = await asyncio.wait_for(
+                agent._call_llm(
+                    _TICKER_PROMPT.format(question=question),
+                    temperature=0.0,
+                    max_tokens=50,
+                    cache_ttl=TICKER_LLM_CACHE_TTL
+                ),
+                timeout=timeout
+            )
+            ticker = parse_ticker(response)
+        except Exception as e:
+            # 일시적 실패는 캐시하지 않음
+            agent._log(f"티커 추출 실패: {e}")
+            return None
+    
+    remember_ticker(question, ticker)
+    return ticker
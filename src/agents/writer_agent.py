@@ -3,12 +3,79 @@
 투자자용 최종 리포트 작성
 """
 
+import hashlib
 import json
-from typing import Optional
+import re
+from collections import Counter
+from itertools import islice
+from typing import Callable, List, Optional
 
 from .base_agent import BaseAgent
 from .agent_context import AgentContext
 
+# orjson이 있으면 빠른 C 파서 사용 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# 스트리밍 응답에서 "report" 문자열 값의 시작 위치
+_REPORT_START_RE = re.compile(r'"report"\s*:\s*"')
+
+
+class _ReportStreamDecoder:
+    """
+    누적 JSON 응답 버퍼에서 "report" 문자열 값을 도착한 만큼 디코딩
+    
+    이스케이프 시퀀스가 청크 경계에서 잘리지 않은 구간까지만 디코딩하고,
+    이미 전달한 부분은 다시 처리하지 않음 (청크마다 새로 늘어난 부분만 반환)
+    """
+    
+    def __init__(self):
+        self._start: Optional[int] = None  # report 값 시작 인덱스
+        self._pos = 0                      # 디코딩 완료한 버퍼 인덱스
+        self.done = False                  # 닫는 따옴표까지 도달
+    
+    def feed(self, buffer: str) -> str:
+        """
+        Args:
+            buffer: 지금까지 누적된 응답
+            
+        Returns:
+            새로 디코딩된 리포트 텍스트 (없으면 빈 문자열)
+        """
+        if self.done:
+            return ""
+        if self._start is None:
+            match = _REPORT_START_RE.search(buffer)
+            if not match:
+                return ""
+            self._start = self._pos = match.end()
+        
+        i, end = self._pos, len(buffer)
+        while i < end:
+            char = buffer[i]
+            if char == '"':
+                self.done = True
+                break
+            if char == "\\":
+                # 이스케이프 전체(\n, \uXXXX)가 도착해야 디코딩
+                width = 6 if buffer[i + 1:i + 2] == "u" else 2
+                if i + width > end:
+                    break
+                i += width
+            else:
+                i += 1
+        
+        segment, self._pos = buffer[self._pos:i], i
+        if not segment:
+            return ""
+        try:
+            return json_loads(f'"{segment}"')
+        except ValueError:
+            return segment
+
 
 class WriterAgent(BaseAgent):
     """
@@ -44,6 +111,24 @@ class WriterAgent(BaseAgent):
 }
 """
     
+    # 리포트 요청의 고정부: 사용자 프롬프트 맨 앞에 매번 같은 바이트로 두어
+    # 시스템 프롬프트와 함께 프로바이더의 프롬프트 프리픽스 캐시에 적중하도록 함 (가변 데이터는 뒤에 배치)
+    REPORT_INSTRUCTIONS = """아래 정보를 바탕으로 마지막 질문에 대한 투자자용 전문 리포트를 작성하세요.
+
+요구사항:
+1. 구조: 요약 → 상세 분석 → 투자 리스크 → 최종 제언
+2. 모든 주장에 [N] 형태로 출처 인용
+3. 전문 금융 용어 사용
+4. 평문 출력 (HTML 금지)
+5. 투자 제언: BUY/HOLD/SELL 중 하나
+
+JSON 형식으로 응답:
+{
+  "report": "## 요약\\n...\\n\\n## 상세 분석\\n...\\n\\n## 투자 리스크\\n...\\n\\n## 최종 제언\\n...",
+  "recommendation": "BUY/HOLD/SELL",
+  "confidence": 0.85
+}"""
+    
     def __init__(self, neo4j_db=None):
         """
         Args:
@@ -56,12 +141,17 @@ class WriterAgent(BaseAgent):
         )
         self._neo4j_db = neo4j_db
     
-    async def execute(self, context: AgentContext) -> AgentContext:
+    async def execute(
+        self,
+        context: AgentContext,
+        on_report_chunk: Optional[Callable[[str], None]] = None
+    ) -> AgentContext:
         """
         리포트 작성 실행
         
         Args:
             context: Analyst가 채운 validated_data를 포함한 컨텍스트
+            on_report_chunk: 지정 시 리포트 본문을 생성되는 대로 조각 단위로 전달 (UI 점진 렌더링용)
             
         Returns:
             final_report, recommendation이 채워진 컨텍스트
@@ -92,7 +182,8 @@ class WriterAgent(BaseAgent):
                 context.validated_data,
                 context.insights,
                 context.sources,
-                context.reasoning_path
+                context.reasoning_path,
+                on_report_chunk
             )
             
             # 2. 결과를 컨텍스트에 반영
@@ -124,73 +215,75 @@ class WriterAgent(BaseAgent):
         validated_data: list,
         insights: list,
         sources: list,
-        reasoning_path: list = None
+        reasoning_path: list = None,
+        on_report_chunk: Optional[Callable[[str], None]] = None
     ) -> dict:
         """
         LLM을 활용한 리포트 생성
         
         Args:
             reasoning_path: 추론 경로 (옵션)
+            on_report_chunk: 지정 시 스트리밍으로 받으며 "report" 값을 조각 단위로 전달
         
         Returns:
             {"report": str, "recommendation": str, "confidence": float}
         """
         # 검증된 데이터 요약
-        validated_summary = "\n".join([
+        validated_summary = "\n".join(
             f"- {item.get('claim', '')} (신뢰도: {item.get('confidence', 0):.2f}, 출처: {item.get('citations', [])})"
-            for item in validated_data[:10]
-        ])
+            for item in islice(validated_data, 10)
+        )
         
         # 인사이트 요약
-        insights_summary = "\n".join([f"- {insight}" for insight in insights[:5]])
+        insights_summary = "\n".join(f"- {insight}" for insight in islice(insights, 5))
         
         # 소스 목록
-        sources_list = "\n".join([
+        sources_list = "\n".join(
             f"[{s.get('id', i+1)}] {s.get('file', 'Unknown')} (Page {s.get('page', 'N/A')})"
-            for i, s in enumerate(sources[:10])
-        ])
+            for i, s in enumerate(islice(sources, 10))
+        )
         
         # 추론 경로 (있는 경우)
         reasoning_section = ""
         if reasoning_path:
-            reasoning_section = f"\n\n추론 경로:\n" + "\n".join([
+            reasoning_section = "\n\n추론 경로:\n" + "\n".join(
                 f"{i+1}. {step}" for i, step in enumerate(reasoning_path)
-            ])
+            )
         
-        prompt = f"""질문: {question}
+        # 고정 지시 → 출처(서브태스크 간 변화 적음) → 검증 데이터/인사이트 → 질문 순 (변화가 잦은 부분일수록 뒤에)
+        prompt = f"""{self.REPORT_INSTRUCTIONS}
+
+출처:
+{sources_list}
 
 검증된 데이터:
 {validated_summary}
 
 핵심 인사이트:
-{insights_summary}
-
-출처:
-{sources_list}{reasoning_section}
-
-위 정보를 바탕으로 투자자용 전문 리포트를 작성하세요.
+{insights_summary}{reasoning_section}
 
-요구사항:
-1. 구조: 요약 → 상세 분석 → 투자 리스크 → 최종 제언
-2. 모든 주장에 [N] 형태로 출처 인용
-3. 전문 금융 용어 사용
-4. 평문 출력 (HTML 금지)
-5. 투자 제언: BUY/HOLD/SELL 중 하나
-
-JSON 형식으로 응답:
-{{
-  "report": "## 요약\\n...\\n\\n## 상세 분석\\n...\\n\\n## 투자 리스크\\n...\\n\\n## 최종 제언\\n...",
-  "recommendation": "BUY/HOLD/SELL",
-  "confidence": 0.85
-}}
+질문: {question}
 """
         
+        on_partial = None
+        if on_report_chunk is not None:
+            decoder = _ReportStreamDecoder()
+            
+            def on_partial(buffer: str) -> None:
+                chunk = decoder.feed(buffer)
+                if chunk:
+                    on_report_chunk(chunk)
+        
         try:
-            response = await self._call_llm(prompt, temperature=0.3, max_tokens=2500)
+            # 같은 검증 데이터/출처로 다시 작성하는 경우(Feedback Loop 재실행 등) 캐시 응답 재사용
+            # (temperature 0.3의 낮은 변동성이라 캐시된 리포트로 대체해도 무방)
+            response = await self._call_llm(
+                prompt, temperature=0.3, max_tokens=2500, use_cache=True, on_partial=on_partial
+            )
             
             # JSON 파싱
             try:
-                result = json.loads(response)
+                result = json_loads(response)
                 return result
             except json.JSONDecodeError:
                 self._log("LLM 응답 JSON 파싱 실패, 텍스트 그대로 사용")
@@ -246,44 +339,35 @@ JSON 형식으로 응답:
             통합 컨텍스트
         """
         try:
-            import json
+            # 모든 키를 쿼리 1회로 조회 (동기 드라이버는 공유 I/O 스레드 풀에서 실행)
+            records = await self._run_blocking(self._read_nodes_sync, list(context.neo4j_keys))
             
             all_sources = []
             all_insights = []
             
-            for key in context.neo4j_keys:
-                # Neo4j에서 노드 조회
-                with self._neo4j_db.driver.session() as session:
-                    result = session.run(
-                        "MATCH (n {id: $key}) RETURN n",
-                        key=key
+            for data_str in records:
+                data = json_loads(data_str)
+                
+                # 소스 통합
+                sources = data.get("sources", [])
+                all_sources.extend(sources)
+                
+                # 서브태스크 정보 추출
+                if "subtask" in data:
+                    subtask = data["subtask"]
+                    all_insights.append(
+                        f"서브태스크 {subtask['id']} ({subtask['task']}): "
+                        f"{len(sources)}개 소스 수집"
                     )
-                    
-                    for record in result:
-                        node = record["n"]
-                        data_str = node.get("data", "{}")
-                        data = json.loads(data_str)
-                        
-                        # 소스 통합
-                        sources = data.get("sources", [])
-                        all_sources.extend(sources)
-                        
-                        # 서브태스크 정보 추출
-                        if "subtask" in data:
-                            subtask = data["subtask"]
-                            all_insights.append(
-                                f"서브태스크 {subtask['id']} ({subtask['task']}): "
-                                f"{len(sources)}개 소스 수집"
-                            )
             
-            # 중복 제거
-            seen_ids = set()
-            unique_sources = []
+            # 중복 제거 (id, 없으면 발췌 전체의 64비트 해시를 키로 - 먼저 나온 소스 유지)
+            unique = {}
             for s in all_sources:
-                sid = s.get("id", s.get("excerpt", "")[:50])
-                if sid not in seen_ids:
-                    seen_ids.add(sid)
-                    unique_sources.append(s)
+                key = s.get("id")
+                if key is None:
+                    key = hashlib.blake2b(s.get("excerpt", "").encode("utf-8"), digest_size=8).digest()
+                unique.setdefault(key, s)
+            unique_sources = list(unique.values())
             
             # 컨텍스트 업데이트
             if unique_sources:
@@ -297,6 +381,22 @@ JSON 형식으로 응답:
             self._log(f"Neo4j 컨텍스트 로드 실패: {e}")
             return context
     
+    def _read_nodes_sync(self, neo4j_keys: List[str]) -> List[str]:
+        """
+        _load_full_context의 동기 본체 (UNWIND로 왕복 1회, AgenticData id 인덱스 사용)
+        
+        Returns:
+            노드별 data JSON 문자열 리스트
+        """
+        with self._neo4j_db.driver.session() as session:
+            result = session.run(
+                "UNWIND $keys AS key "
+                "MATCH (n:AgenticData {id: key}) "
+                "RETURN coalesce(n.data, '{}') AS data",
+                keys=neo4j_keys
+            )
+            return [record["data"] for record in result]
+    
     def _build_reasoning_path(self, context: AgentContext) -> list:
         """
         서브태스크 기반 추론 경로 생성
@@ -314,20 +414,17 @@ JSON 형식으로 응답:
         
         path.append(f"질문 분해: {len(context.subtasks)}개 서브태스크")
         
+        # 서브태스크별 소스 개수 (소스 1회 순회로 집계, 없는 키는 0)
+        source_counts = Counter(s.get("subtask_id") for s in context.sources)
+        
         for subtask in context.subtasks:
             subtask_id = subtask["id"]
             task_desc = subtask.get("task", "")
             target = subtask.get("target", "general")
             
-            # 해당 서브태스크의 소스 개수
-            subtask_sources = [
-                s for s in context.sources 
-                if s.get("subtask_id") == subtask_id
-            ]
-            
             path.append(
                 f"서브태스크 {subtask_id} ({target}): {task_desc} "
-                f"→ {len(subtask_sources)}개 소스 수집"
+                f"→ {source_counts[subtask_id]}개 소스 수집"
             )
         
         # 검증 단계
@@ -4,6 +4,7 @@ Manages environment variables and model settings with strict typing
 """
 
 import os
+from functools import lru_cache
 from typing import Literal, Dict, Any
 
 try:
@@ -21,6 +22,10 @@ OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
 
 # Ollama Configuration (하이브리드 클라우드 지원)
 OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+# Concurrent Ollama requests from local extraction (3 is safe for 8GB RAM).
+# Start the Ollama server with the same OLLAMA_NUM_PARALLEL and OLLAMA_MAX_LOADED_MODELS=1 so
+# parallel requests share one loaded model and are batched instead of queued (e.g. 8 on a GPU host).
+OLLAMA_NUM_PARALLEL: int = int(os.getenv("OLLAMA_NUM_PARALLEL", "3"))
 
 # Model configurations with strict typing
 API_MODELS: Dict[str, str | int] = {
@@ -47,6 +52,8 @@ NEO4J_URI: str = os.getenv("NEO4J_URI", "")
 NEO4J_USERNAME: str = os.getenv("NEO4J_USERNAME", "neo4j")
 NEO4J_PASSWORD: str = os.getenv("NEO4J_PASSWORD", "")
 NEO4J_AUTO_EXPORT: bool = os.getenv("NEO4J_AUTO_EXPORT", "false").lower() in ("true", "1", "yes")
+NEO4J_MAX_CONNECTION_POOL_SIZE: int = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "50"))
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "30"))
 
 # Financial entity types for prioritized extraction
 FINANCIAL_ENTITY_TYPES: list[str] = [
@@ -55,6 +62,23 @@ FINANCIAL_ENTITY_TYPES: list[str] = [
     "EPS", "PE_RATIO", "MARKET_CAP",
 ]
 
+# LLM response cache (deterministic agent calls are served from disk on repeat)
+LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+LLM_CACHE_DIR: str = os.getenv("LLM_CACHE_DIR", ".cache/llm")
+LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))  # 7 days
+
+# Semantic cache for KB collection (near-duplicate questions reuse collected sources)
+SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))  # cosine similarity
+SEMANTIC_CACHE_TTL_SECONDS: int = int(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "600"))
+SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "10000"))
+# Planner decompositions are reused much longer than collected sources (plans don't go stale)
+PLANNER_CACHE_TTL_SECONDS: int = int(os.getenv("PLANNER_CACHE_TTL_SECONDS", str(24 * 3600)))  # 24 hours
+
+# Near-duplicate source removal in KB collection (embedding cosine similarity)
+SOURCE_DEDUP_ENABLED: bool = os.getenv("SOURCE_DEDUP_ENABLED", "true").lower() in ("true", "1", "yes")
+SOURCE_DEDUP_THRESHOLD: float = float(os.getenv("SOURCE_DEDUP_THRESHOLD", "0.92"))
+
 # Router configuration for query classification
 ROUTER_MODEL: str = "gpt-4o-mini"
 ROUTER_TEMPERATURE: float = 0.0  # Deterministic routing
@@ -81,11 +105,33 @@ PRIVACY_CHUNK_SIZE: int = int(os.getenv("PRIVACY_CHUNK_SIZE", "512"))  # Smaller
 PRIVACY_BATCH_SIZE: int = int(os.getenv("PRIVACY_BATCH_SIZE", "5"))    # Process 5 chunks at a time
 PRIVACY_MAX_MEMORY_MB: int = int(os.getenv("PRIVACY_MAX_MEMORY_MB", "2048"))  # 2GB memory limit
 
+# Agent memory guard (set DISABLE_MEM_CHECK=true on hosts without the 8GB limit)
+DISABLE_MEM_CHECK: bool = os.getenv("DISABLE_MEM_CHECK", "false").lower() in ("true", "1", "yes")
+MEM_CHECK_INTERVAL_SECONDS: float = float(os.getenv("MEM_CHECK_INTERVAL_SECONDS", "1.0"))
+
 
 def get_models() -> Dict[str, str | int]:
     """Return model configuration based on current RUN_MODE"""
     return API_MODELS if RUN_MODE == "API" else LOCAL_MODELS
 
+@lru_cache(maxsize=1)
+def get_driver():
+    """
+    Return the process-wide Neo4j driver (created on first call)
+    
+    The driver owns the Bolt connection pool, so reusing one instance
+    avoids paying the TCP/TLS/Bolt handshake on every connection.
+    Close it only at process exit; it is shared by every caller.
+    """
+    from neo4j import GraphDatabase
+    
+    return GraphDatabase.driver(
+        NEO4J_URI,
+        auth=(NEO4J_USERNAME, NEO4J_PASSWORD),
+        max_connection_pool_size=NEO4J_MAX_CONNECTION_POOL_SIZE,
+        connection_acquisition_timeout=NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+    )
+
 def validate_config() -> bool:
     """
     Validate configuration settings
@@ -5,7 +5,7 @@ GraphRAG 인덱싱 결과를 Neo4j에 저장하고, PDF 파싱 기능도 제공
 
 import os
 import sys
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 import networkx as nx
 
 # .env 파일 읽기
@@ -26,7 +26,7 @@ except ImportError:
 # src 디렉토리를 Python path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD
+from config import NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD, get_driver
 from utils import extract_text_from_pdf
 from models.neo4j_models import GraphStats
 
@@ -79,14 +79,21 @@ class Neo4jDatabase:
                 f"   현재 URI: {self.uri}"
             )
         
-        # Neo4j 드라이버 생성
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        # Neo4j 드라이버 생성 (config와 같은 접속 정보면 프로세스 공용 드라이버 재사용)
+        self._owns_driver = (self.uri, self.username, self.password) != (NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD)
+        if self._owns_driver:
+            self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        else:
+            self.driver = get_driver()
+        
+        # id 인덱스를 이미 만든 라벨 (create_nodes_batch에서 라벨별 1회만 생성)
+        self._indexed_labels: set = set()
         
         print(f"✅ Neo4j 연결 성공! URI: {self.uri.split('@')[-1] if '@' in self.uri else self.uri}")
     
     def close(self):
-        """연결을 닫는 함수예요!"""
-        if self.driver:
+        """연결을 닫는 함수예요! (공용 드라이버는 다른 인스턴스가 쓰고 있으니 닫지 않아요)"""
+        if self.driver and self._owns_driver:
             self.driver.close()
             print("🔌 Neo4j 연결이 종료되었어요.")
     
@@ -126,6 +133,40 @@ class Neo4jDatabase:
         with self.driver.session() as session:
             session.run(query, **params)
     
+    def create_nodes_batch(self, rows: List[Dict[str, Any]], label: str = "AgenticData") -> None:
+        """
+        여러 노드를 한 번의 쿼리로 생성하는 함수예요! (UNWIND로 왕복 1회)
+        
+        Args:
+            rows: [{"id": 노드 ID, "props": 속성 딕셔너리}, ...]
+            label: 노드 라벨 (코드에서 정한 값만 사용, 사용자 입력 금지)
+        """
+        if not rows:
+            return
+        
+        # 라벨은 파라미터로 넘길 수 없어서 쿼리에 넣고, 값은 전부 파라미터로 전달
+        query = f"""
+        UNWIND $rows AS row
+        MERGE (n:{label} {{id: row.id}})
+        SET n += row.props
+        """
+        
+        with self.driver.session() as session:
+            self._ensure_id_index(session, label)
+            session.run(query, rows=rows).consume()
+    
+    def _ensure_id_index(self, session, label: str) -> None:
+        """
+        라벨의 id 인덱스를 만드는 함수예요! (인스턴스당 라벨별 1회)
+        MERGE와 id 조회(UNWIND ... MATCH)가 전체 스캔 대신 인덱스를 타게 해줘요
+        """
+        if label in self._indexed_labels:
+            return
+        session.run(
+            f"CREATE INDEX {label.lower()}_id IF NOT EXISTS FOR (n:{label}) ON (n.id)"
+        ).consume()
+        self._indexed_labels.add(label)
+    
     def create_relationship(
         self,
         source_id: str,
@@ -16,7 +16,7 @@ except ImportError:
     OLLAMA_AVAILABLE = False
     print("⚠️  ollama not installed. Install with: pip install ollama")
 
-from ..config import OLLAMA_BASE_URL, LOCAL_MODELS
+from ..config import OLLAMA_BASE_URL, LOCAL_MODELS, OLLAMA_NUM_PARALLEL
 
 
 class KnowledgeExtractor:
@@ -250,32 +250,43 @@ JSON output:"""
             print(f"Content preview: {content[:200]}...")
             return {"entities": [], "relationships": []}
     
-    async def extract_batch(self, texts: List[str]) -> List[Dict[str, List[Dict]]]:
+    async def extract_batch(
+        self,
+        texts: List[str],
+        max_concurrent: int = OLLAMA_NUM_PARALLEL
+    ) -> List[Dict[str, List[Dict]]]:
         """
         Extract entities from multiple text chunks in parallel (with concurrency limit)
         
+        A semaphore keeps up to max_concurrent requests in flight at all times, so a slow
+        chunk does not hold back the next ones (Ollama batches the parallel requests)
+        
         Args:
             texts: List of text strings to process
+            max_concurrent: Maximum concurrent Ollama requests (match the server's OLLAMA_NUM_PARALLEL)
             
         Returns:
-            List of extraction results
+            List of extraction results (same order as texts)
         """
-        # Process in batches to avoid overwhelming Ollama server
-        max_concurrent = 3  # Conservative limit for 8GB RAM
-        results = []
+        semaphore = asyncio.Semaphore(max_concurrent)
         
-        for i in range(0, len(texts), max_concurrent):
-            batch = texts[i:i + max_concurrent]
-            tasks = [self.extract_entities(text) for text in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Handle exceptions
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    print(f"⚠️  Batch extraction error: {result}")
-                    results.append({"entities": [], "relationships": []})
-                else:
-                    results.append(result)
+        async def extract_one(text: str) -> Dict[str, List[Dict]]:
+            async with semaphore:
+                return await self.extract_entities(text)
+        
+        batch_results = await asyncio.gather(
+            *(extract_one(text) for text in texts),
+            return_exceptions=True
+        )
+        
+        # Handle exceptions
+        results = []
+        for result in batch_results:
+            if isinstance(result, Exception):
+                print(f"⚠️  Batch extraction error: {result}")
+                results.append({"entities": [], "relationships": []})
+            else:
+                results.append(result)
         
         return results
     
@@ -151,7 +151,7 @@ class PrivacyGraphRAGEngine:
             try:
                 # Ingest and build graph
                 chunks = self.privacy_ingestor.ingest_file(temp_path)
-                stats = await self.privacy_graph_builder.build_graph_sequential(chunks)
+                stats = await self.privacy_graph_builder.build_graph_batched(chunks)
                 
                 print(f"✅ Privacy Graph Builder 인덱싱 완료!")
                 print(f"   📊 Entities: {stats['entities_extracted']}")
@@ -233,10 +233,11 @@ class PrivacyGraphRAGEngine:
             print("🔧 Privacy Mode: Privacy Analyst Agent 사용 (Neo4j + Ollama)")
             
             try:
+                from agents.agent_pool import get_agent
                 from agents.privacy_analyst import PrivacyAnalystAgent
                 
-                # Initialize agent
-                analyst = PrivacyAnalystAgent()
+                # Shared agent (ReAct executor/ChatOllama are built once, not per question)
+                analyst = get_agent(PrivacyAnalystAgent)
                 
                 # Get answer
                 response = await analyst.analyze(question)
@@ -10,7 +10,7 @@ Refactored to use modular components:
 import gc
 import time
 import asyncio
-from typing import Dict, List, Any, Generator, Optional
+from typing import Dict, List, Any, Generator, Optional, Tuple
 import sys
 import os
 
@@ -18,6 +18,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import (
+    OLLAMA_NUM_PARALLEL,
     PRIVACY_BATCH_SIZE,
     PRIVACY_MAX_MEMORY_MB,
     NEO4J_URI,
@@ -167,6 +168,25 @@ class PrivacyGraphBuilder:
             print("⚠️  Neo4j not configured. Skipping query execution.")
             return 0
         
+        # Neo4j driver calls block: run them in a worker thread so other chunks keep extracting
+        successful, failed = await asyncio.to_thread(self._execute_queries_blocking, queries)
+        
+        # Update statistics
+        self.stats["queries_executed"] += successful
+        self.stats["errors"] += failed
+        
+        if failed > 0:
+            print(f"⚠️  {failed}/{len(queries)} queries failed")
+        
+        return successful
+    
+    def _execute_queries_blocking(self, queries: List[str]) -> Tuple[int, int]:
+        """
+        Blocking body of execute_queries (runs in a worker thread)
+        
+        Returns:
+            (successful, failed) query counts
+        """
         successful = 0
         failed = 0
         
@@ -179,14 +199,7 @@ class PrivacyGraphBuilder:
                 if failed <= 3:  # Show first 3 errors
                     print(f"⚠️  Query failed: {str(e)[:100]}")
         
-        # Update statistics
-        self.stats["queries_executed"] += successful
-        self.stats["errors"] += failed
-        
-        if failed > 0:
-            print(f"⚠️  {failed}/{len(queries)} queries failed")
-        
-        return successful
+        return successful, failed
     
     async def process_chunk(self, chunk: Dict[str, Any]) -> bool:
         """
@@ -199,9 +212,6 @@ class PrivacyGraphBuilder:
             True if successful
         """
         try:
-            # Check memory before processing
-            self.trigger_gc_if_needed()
-            
             # Extract graph elements
             text = chunk.get("text", "")
             metadata = chunk.get("metadata", {})
@@ -229,9 +239,31 @@ class PrivacyGraphBuilder:
             self.stats["errors"] += 1
             return False
     
-    async def build_graph_sequential(self, chunks: Generator[Dict[str, Any], None, None]) -> Dict[str, Any]:
+    async def _process_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Process one batch of chunks concurrently (memory is checked once per batch)
+        
+        At most OLLAMA_NUM_PARALLEL chunks run at once, the same cap as
+        KnowledgeExtractor.extract_batch (3 by default, safe for 8GB RAM)
+        
+        Args:
+            batch: Independent data chunks
+        """
+        self.trigger_gc_if_needed()
+        semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+        
+        async def process_one(chunk_item: Dict[str, Any]) -> bool:
+            async with semaphore:
+                return await self.process_chunk(chunk_item)
+        
+        await asyncio.gather(*(process_one(chunk_item) for chunk_item in batch))
+    
+    async def build_graph_batched(self, chunks: Generator[Dict[str, Any], None, None]) -> Dict[str, Any]:
         """
-        Build graph from chunks sequentially (memory-efficient)
+        Build graph from chunks in batches of batch_size
+        
+        Batches run one after another (bounded memory); chunks within a batch
+        are processed concurrently, up to OLLAMA_NUM_PARALLEL at a time.
         
         Args:
             chunks: Generator yielding data chunks
@@ -239,7 +271,7 @@ class PrivacyGraphBuilder:
         Returns:
             Statistics dict
         """
-        print("🚀 Starting sequential graph building...")
+        print(f"🚀 Starting batched graph building (batch size: {self.batch_size})...")
         start_time = time.time()
         
         batch = []
@@ -249,8 +281,8 @@ class PrivacyGraphBuilder:
             
             # Process batch when full
             if len(batch) >= self.batch_size:
-                for chunk_item in batch:
-                    await self.process_chunk(chunk_item)
+                # Chunks in a batch are independent: extract them concurrently
+                await self._process_batch(batch)
                 
                 # Clear batch and trigger GC
                 batch = []
@@ -263,8 +295,7 @@ class PrivacyGraphBuilder:
         
         # Process remaining chunks
         if batch:
-            for chunk_item in batch:
-                await self.process_chunk(chunk_item)
+            await self._process_batch(batch)
         
         elapsed = time.time() - start_time
         
@@ -290,7 +321,7 @@ class PrivacyGraphBuilder:
             Statistics dict
         """
         chunks = ingestor.ingest_file(filepath)
-        return await self.build_graph_sequential(chunks)
+        return await self.build_graph_batched(chunks)
     
     async def build_graph_from_pdf_parallel(
         self,
@@ -1106,6 +1106,7 @@ with tab2:
                                 stats = {"processed": 0}
                                 
                                 for i, chunk in enumerate(chunks):
+                                    builder.trigger_gc_if_needed()
                                     await builder.process_chunk(chunk)
                                     stats["processed"] = i + 1
                                     progress_bar.progress((i + 1) / total_chunks)
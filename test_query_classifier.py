@@ -0,0 +1,46 @@
+"""
+Query Classifier Test Script
+Tests rule-based SIMPLE classification (Planner/complexity LLM calls skipped)
+"""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from agents.query_classifier import is_simple_lookup
+
+
+@pytest.mark.parametrize("question", [
+    "NVDA 주가는?",
+    "NVDA의 PER은?",
+    "엔비디아 매출은?",
+    "애플 주가",
+    "Tesla revenue",
+    "$V 배당",
+])
+def test_simple_lookup(question):
+    assert is_simple_lookup(question)
+
+
+@pytest.mark.parametrize("question", [
+    # 기업명이 다른 단어의 일부 / 짧은 심볼
+    "메타버스 관련주 주가",
+    "애플리케이션 매출",
+    "인텔리전스 매출",
+    "V100 GPU 가격",
+    # 분석/비교/섹터 질문
+    "NVDA 주가 전망은?",
+    "엔비디아 vs AMD 매출",
+    "NVDA YoY 성장률",
+    "엔비디아 살까요?",
+    "반도체 섹터 주가",
+    # 지표 없음 / 너무 긴 질문
+    "엔비디아",
+    "엔비디아의 최근 데이터센터 부문 매출과 게이밍 부문 매출을 각각 자세히 알려주세요",
+])
+def test_not_simple_lookup(question):
+    assert not is_simple_lookup(question)